@@ -1,3 +1,7 @@
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -9,17 +13,37 @@ from api.degrees.controllers.degrees_controller import degrees
 from api.marks.controllers.marks_controller import marks
 from api.personal_circumstances.controllers.personal_circumstances_controller import personal_circumstances
 from api.academic_misconducts.controllers.academic_misconducts_controller import academic_misconducts
+from api.system.controllers.system_controller import system
 
 from api.database import engine
+from api.database import async_engine
+
+from api.config import Config
 
 from api.system.models.models import Base
 
+from api.system.schema_upgrades import upgrade_schema
+
+from api.users.hashers.hashing_pool import shutdown_hashing_pool
+
 from api.utils.singleton import singleton
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync handlers run in AnyIO's default thread pool, which Starlette caps at 40 threads unless it is resized.
+    to_thread.current_default_thread_limiter().total_tokens = Config.THREADPOOL_SIZE
+
+    yield
+
+    shutdown_hashing_pool()
+
+    if async_engine is not None:
+        await async_engine.dispose()
+
 @singleton
 def create_app() -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -27,9 +51,11 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "X-Next-Cursor", "X-Total-Estimate"],
     )
 
     Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
 
     app.include_router(users, tags=["users"])
     app.include_router(classes, tags=["classes"])
@@ -39,5 +65,6 @@ def create_app() -> FastAPI:
     app.include_router(marks, tags=["marks"])
     app.include_router(personal_circumstances, tags=["personal_circumstances"])
     app.include_router(academic_misconducts, tags=["academic_misconducts"])
+    app.include_router(system, tags=["system"])
 
     return app
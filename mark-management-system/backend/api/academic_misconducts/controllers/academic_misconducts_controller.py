@@ -5,6 +5,7 @@ from typing import Tuple, List
 from api.system.schemas import schemas
 
 from api.academic_misconducts.use_cases.create_academic_misconduct_use_case import CreateAcademicMisconductUseCase
+from api.academic_misconducts.use_cases.create_academic_misconducts_bulk_use_case import CreateAcademicMisconductsBulkUseCase
 from api.academic_misconducts.use_cases.get_academic_misconducts_for_student_use_case import GetAcademicMisconductsForStudentUseCase
 
 from api.academic_misconducts.errors.academic_misconduct_not_found import AcademicMisconductNotFound
@@ -16,6 +17,7 @@ from api.students.errors.student_not_found import StudentNotFound
 from api.middleware.dependencies import get_current_user
 
 from api.academic_misconducts.dependencies import create_academic_misconduct_use_case
+from api.academic_misconducts.dependencies import create_academic_misconducts_bulk_use_case
 from api.academic_misconducts.dependencies import get_academic_misconducts_for_student_use_case
 
 
@@ -67,6 +69,50 @@ def create_academic_misconduct(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@academic_misconducts.post("/api/v1/academic-misconducts/bulk", response_model=schemas.AcademicMisconductBulkResult)
+def create_academic_misconducts_bulk(
+    request: schemas.AcademicMisconductBulkCreate,
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    create_academic_misconducts_bulk_use_case: CreateAcademicMisconductsBulkUseCase = Depends(create_academic_misconducts_bulk_use_case),
+):
+    """
+    Creates many academic misconduct entries in the system at once, i.e. every row of an uploaded file, within a single request.
+
+    Rows which cannot be created (e.g. an invalid date or outcome, the student or class does not exist, or the student does not belong to the class) do not fail the request, 
+    instead they are reported back in the `results` with a `status` and a `detail`.
+
+    Args:  
+        - `request`: A `schemas.AcademicMisconductBulkCreate` object is required which contains a list of academic misconducts, each with the student & class to which it will be assigned to.  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `create_academic_misconducts_bulk_use_case`: The class which handles the business logic for bulk academic misconduct creation.   
+
+    Raises:  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If there has been a permission error.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `response_model`: The response is in the model of the `schemas.AcademicMisconductBulkResult` schema, which contains the number of created & failed rows and a result per row.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        return create_academic_misconducts_bulk_use_case.execute(
+            request, current_user
+        )
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @academic_misconducts.get("/api/v1/academic-misconducts/{reg_no}", response_model=List[schemas.AcademicMisconductBase])
 def get_academic_misconducts_for_student(
     reg_no: str,
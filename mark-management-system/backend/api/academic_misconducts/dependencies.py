@@ -6,8 +6,11 @@ from api.middleware.dependencies import StudentRepository
 from api.middleware.dependencies import ClassRepository
 
 from api.academic_misconducts.use_cases.create_academic_misconduct_use_case import CreateAcademicMisconductUseCase
+from api.academic_misconducts.use_cases.create_academic_misconducts_bulk_use_case import CreateAcademicMisconductsBulkUseCase
 from api.academic_misconducts.use_cases.get_academic_misconducts_for_student_use_case import GetAcademicMisconductsForStudentUseCase
 
+from api.academic_misconducts.validators import AcademicMisconductValidator
+
 from api.middleware.dependencies import get_academic_misconduct_repository
 from api.middleware.dependencies import get_user_repository
 from api.middleware.dependencies import get_student_repository
@@ -27,15 +30,31 @@ def create_academic_misconduct_use_case(
         class_repository
     )
 
-def get_academic_misconducts_for_student_use_case(
+def get_academic_misconduct_validator() -> AcademicMisconductValidator:
+    return AcademicMisconductValidator()
+
+def create_academic_misconducts_bulk_use_case(
         academic_misconduct_repository: AcademicMisconductRepository = Depends(get_academic_misconduct_repository),
         user_repository: UserRepository = Depends(get_user_repository),
         student_repository: StudentRepository = Depends(get_student_repository),
         class_repository: ClassRepository = Depends(get_class_repository),
+        academic_misconduct_validator: AcademicMisconductValidator = Depends(get_academic_misconduct_validator),
+    ) -> CreateAcademicMisconductsBulkUseCase:
+    return CreateAcademicMisconductsBulkUseCase(
+        academic_misconduct_repository, 
+        user_repository,
+        student_repository,
+        class_repository,
+        academic_misconduct_validator,
+    )
+
+def get_academic_misconducts_for_student_use_case(
+        academic_misconduct_repository: AcademicMisconductRepository = Depends(get_academic_misconduct_repository),
+        user_repository: UserRepository = Depends(get_user_repository),
+        student_repository: StudentRepository = Depends(get_student_repository),
     ) -> GetAcademicMisconductsForStudentUseCase:
     return GetAcademicMisconductsForStudentUseCase(
         academic_misconduct_repository, 
         user_repository,
-        student_repository,
-        class_repository
+        student_repository
     )
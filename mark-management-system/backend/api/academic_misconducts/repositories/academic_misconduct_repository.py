@@ -1,8 +1,9 @@
-from typing import List
+from typing import List, Tuple
 
 from sqlalchemy.orm import Session
 
 from api.system.models.models import AcademicMisconduct
+from api.system.models.models import Class
 
 from api.system.schemas.schemas import AcademicMisconductBase
 
@@ -28,10 +29,37 @@ class AcademicMisconductRepository:
         Args:
             academic_misconduct: The object to be added.
         """
+        self._normalise_outcome(academic_misconduct)
+
         self.db.add(academic_misconduct)
         self.db.commit()
         self.db.refresh(academic_misconduct)
 
+    def add_all(self, academic_misconducts: List[AcademicMisconduct]) -> List[int]:
+        """
+        Adds a list of objects into the database, within a single transaction.
+
+        Args:
+            academic_misconducts: The objects to be added.
+
+        Returns:
+            List[int]: The identifiers of the newly added academic misconducts, in the same order as the objects passed in.
+        """
+        if not academic_misconducts:
+            return []
+
+        for academic_misconduct in academic_misconducts:
+            self._normalise_outcome(academic_misconduct)
+
+        self.db.add_all(academic_misconducts)
+        self.db.flush()
+
+        academic_misconduct_ids = [academic_misconduct.id for academic_misconduct in academic_misconducts]
+
+        self.db.commit()
+
+        return academic_misconduct_ids
+
     def get_by_student_id(self, student_id: int) -> List[AcademicMisconduct]:
         """
         Get a list of academic misconducts by an id of a student.
@@ -43,3 +71,24 @@ class AcademicMisconductRepository:
             Optional[AcademicMisconduct]: A List[AcademicMisconduct] from the database.
         """
         return self.db.query(AcademicMisconduct).filter_by(student_id=student_id).all()
+
+    def get_with_class_codes_by_student_id(self, student_id: int) -> List[Tuple[AcademicMisconduct, str]]:
+        """
+        Get a list of academic misconducts by an id of a student, each alongside the code of its class, in a single query.
+
+        Args:
+            student_id: The student identificator.
+        
+        Returns:
+            List[Tuple[AcademicMisconduct, str]]: A list of `AcademicMisconduct` objects from the database & the code of their class.
+        """
+        return (self.db.query(AcademicMisconduct, Class.code)
+            .join(Class, Class.id == AcademicMisconduct.class_id)
+            .filter(AcademicMisconduct.student_id == student_id)
+            .order_by(AcademicMisconduct.id)
+            .all()
+        )
+
+    def _normalise_outcome(self, academic_misconduct: AcademicMisconduct) -> None:
+        # Outcomes are stored in upper case (i.e. "UPHELD"), whichever endpoint they were created through.
+        academic_misconduct.outcome = academic_misconduct.outcome.upper()
@@ -84,6 +84,6 @@ class CreateAcademicMisconductUseCase:
         
         return AcademicMisconductSchema(
             date=request.date,
-            outcome=request.outcome,
+            outcome=academic_misconduct.outcome,
             class_code=class_.code
         )
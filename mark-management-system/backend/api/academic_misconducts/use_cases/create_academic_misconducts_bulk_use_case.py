@@ -0,0 +1,124 @@
+from datetime import date
+
+from typing import Tuple, List
+
+from api.system.models.models import AcademicMisconduct
+
+from api.system.schemas.schemas import AcademicMisconductBulkCreate
+from api.system.schemas.schemas import AcademicMisconductBulkRowResult
+from api.system.schemas.schemas import AcademicMisconductBulkResult
+
+from api.academic_misconducts.repositories.academic_misconduct_repository import AcademicMisconductRepository
+
+from api.users.repositories.user_repository import UserRepository
+from api.students.repositories.student_repository import StudentRepository
+from api.classes.repositories.class_repository import ClassRepository
+
+from api.academic_misconducts.validators import AcademicMisconductValidator
+
+from api.users.errors.user_not_found import UserNotFound
+
+
+class CreateAcademicMisconductsBulkUseCase:
+    """
+    The Use Case containing business logic for creating many academic misconducts at once, i.e. an uploaded file.
+    """
+    def __init__(
+            self,
+            academic_misconduct_repository: AcademicMisconductRepository,
+            user_repository: UserRepository,
+            student_repository: StudentRepository,
+            class_repository: ClassRepository,
+            academic_misconduct_validator: AcademicMisconductValidator,
+        ) -> None:
+        self.academic_misconduct_repository = academic_misconduct_repository
+        self.user_repository = user_repository
+        self.student_repository = student_repository
+        self.class_repository = class_repository
+        self.academic_misconduct_validator = academic_misconduct_validator
+
+    def execute(self, request: AcademicMisconductBulkCreate, current_user: Tuple[str, bool, bool]) -> AcademicMisconductBulkResult:
+        """
+        Executes the Use Case to create a list of academic misconducts in the system.
+
+        Registration numbers, class codes & whether each student belongs to their class are resolved in one query each,
+        and every new academic misconduct is inserted within a single transaction. Rows which cannot be created are
+        reported back alongside the reason, rather than failing the whole request.
+
+        Args:
+            request: A `AcademicMisconductBulkCreate` object is required which contains the rows of the uploaded file.
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+
+        Raises:
+            UserNotFound: If the user from the JWT token is not found.
+            PermissionError: If the user is not valid and a lecturer, or if they are not an administrator.
+
+        Returns:
+            AcademicMisconductBulkResult: A AcademicMisconductBulkResult schema object containing the number of created & failed rows, as well as a result per row.
+        """
+        user_email, is_admin, is_lecturer = current_user
+
+        user = self.user_repository.find_by_email(user_email)
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        if not ((user and is_lecturer) or is_admin):
+            raise PermissionError("Permission denied to access this resource")
+
+        rows = request.academic_misconducts
+
+        students = {reg_no: student_id for student_id, reg_no in self.student_repository.find_ids_by_reg_nos(row.reg_no for row in rows)}
+        classes = {code: class_id for class_id, code, _ in self.class_repository.find_ids_by_codes(row.class_code for row in rows)}
+
+        student_class_pairs = self.class_repository.find_student_class_pairs(classes.values(), students.values())
+
+        results: List[AcademicMisconductBulkRowResult] = []
+        new_academic_misconducts: List[AcademicMisconduct] = []
+        new_academic_misconduct_results: List[AcademicMisconductBulkRowResult] = []
+
+        for row_number, row in enumerate(rows):
+            result = AcademicMisconductBulkRowResult(
+                row=row_number,
+                reg_no=row.reg_no,
+                class_code=row.class_code,
+                status="created",
+            )
+
+            results.append(result)
+
+            validation_errors = self.academic_misconduct_validator.validate_academic_misconduct_row(row.date, row.outcome)
+            student_id = students.get(row.reg_no)
+            class_id = classes.get(row.class_code)
+
+            if validation_errors:
+                result.status, result.detail = "invalid", next(iter(validation_errors.values()))
+            elif student_id is None:
+                result.status, result.detail = "student_not_found", "Student not found"
+            elif class_id is None:
+                result.status, result.detail = "class_not_found", "Class not found"
+            elif (class_id, student_id) not in student_class_pairs:
+                result.status, result.detail = "student_not_in_class", "Student doesnt belong to the provided class"
+            else:
+                new_academic_misconducts.append(
+                    AcademicMisconduct(
+                        date=date.fromisoformat(row.date),
+                        outcome=row.outcome,
+                        student_id=student_id,
+                        class_id=class_id,
+                    )
+                )
+                new_academic_misconduct_results.append(result)
+
+        academic_misconduct_ids = self.academic_misconduct_repository.add_all(new_academic_misconducts)
+
+        for result, academic_misconduct_id in zip(new_academic_misconduct_results, academic_misconduct_ids):
+            result.academic_misconduct_id = academic_misconduct_id
+
+        created = len(academic_misconduct_ids)
+
+        return AcademicMisconductBulkResult(
+            created=created,
+            failed=len(results) - created,
+            results=results,
+        )
@@ -5,7 +5,6 @@ from api.system.schemas.schemas import AcademicMisconductBase as AcademicMiscond
 from api.academic_misconducts.repositories.academic_misconduct_repository import AcademicMisconductRepository
 from api.users.repositories.user_repository import UserRepository
 from api.students.repositories.student_repository import StudentRepository
-from api.classes.repositories.class_repository import ClassRepository
 
 from api.users.errors.user_not_found import UserNotFound
 from api.students.errors.student_not_found import StudentNotFound
@@ -21,12 +20,10 @@ class GetAcademicMisconductsForStudentUseCase:
                  academic_misconduct_repository: AcademicMisconductRepository,
                  user_repository: UserRepository,
                  student_repository: StudentRepository,
-                 class_repository: ClassRepository,
                 ) -> None:
         self.academic_misconduct_repository = academic_misconduct_repository
         self.user_repository = user_repository
         self.student_repository = student_repository
-        self.class_repository = class_repository
 
     def execute(self, reg_no: str, current_user: Tuple[str, bool, bool]) -> List[AcademicMisconductSchema]:
         """
@@ -59,20 +56,18 @@ class GetAcademicMisconductsForStudentUseCase:
         if not student:
             raise StudentNotFound("Student not found")
         
-        academic_misconducts = self.academic_misconduct_repository.get_by_student_id(student.id)
+        academic_misconducts = self.academic_misconduct_repository.get_with_class_codes_by_student_id(student.id)
 
         if not academic_misconducts:
             raise AcademicMisconductNotFound("No academic misconducts found")
         
         transformed_academic_misconducts = []
 
-        for misconduct in academic_misconducts:
-            class_ = self.class_repository.find_by_id(misconduct.class_id)
-
+        for misconduct, class_code in academic_misconducts:
             academic_misconduct = AcademicMisconductSchema(
                 date=misconduct.date,
                 outcome=misconduct.outcome,
-                class_code=class_.code,
+                class_code=class_code,
             )
 
             transformed_academic_misconducts.append(academic_misconduct)
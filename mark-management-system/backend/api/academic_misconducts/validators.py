@@ -0,0 +1,29 @@
+from datetime import date
+
+from typing import Dict, Any, Set
+
+
+class AcademicMisconductValidator:
+    """A utility class which validates academic misconducts, following the rules of the academic misconduct upload file."""
+
+    def __init__(self) -> None:
+        self.validation_errors = {}
+
+        self.outcomes: Set[str] = {"UPHELD", "UNDER INVESTIGATION"}
+
+    def validate_date(self, date_: str) -> None:
+        try:
+            date.fromisoformat(date_)
+        except ValueError:
+            self.validation_errors["date"] = "Date should be in the format YYYY-MM-DD"
+
+    def validate_outcome(self, outcome: str) -> None:
+        if outcome.upper() not in self.outcomes:
+            self.validation_errors["outcome"] = "Invalid outcome. The options are: upheld, under investigation"
+
+    def validate_academic_misconduct_row(self, date_: str, outcome: str) -> Dict[str, Any]:
+        self.validation_errors = {}
+        self.validate_date(date_)
+        self.validate_outcome(outcome)
+
+        return self.validation_errors
@@ -1,6 +1,6 @@
-from fastapi import Depends, APIRouter, HTTPException
+from fastapi import Depends, APIRouter, HTTPException, Query, Response
 
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 from api.system.schemas import schemas
 
@@ -15,6 +15,8 @@ from api.classes.use_cases.get_associated_degrees_for_class_use_case import GetA
 from api.classes.use_cases.get_class_statistics_use_case import GetClassStatisticsUseCase
 from api.classes.use_cases.get_class_metrics_use_case import GetClassMetricsUseCase
 
+from api.system.errors.invalid_cursor import InvalidCursor
+
 from api.classes.errors.class_already_exists import ClassAlreadyExists
 from api.classes.errors.classes_not_found import ClassesNotFound
 from api.classes.errors.class_not_found import ClassNotFound
@@ -39,6 +41,14 @@ from api.classes.dependencies import get_class_statistics_use_case
 from api.classes.dependencies import get_class_metrics_use_case
 
 from api.middleware.dependencies import get_current_user
+from api.middleware.dependencies import ConditionalGet
+from api.middleware.dependencies import get_session_runner
+
+from api.classes.serializers import to_classes
+from api.classes.serializers import to_classes_page
+
+from api.utils.pagination import set_page_headers
+from api.utils.session_runner import SessionRunner
 
 
 classes = APIRouter()
@@ -91,11 +101,15 @@ def create_class(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-@classes.get("/api/v1/classes", response_model=List[schemas.Class])
-def get_classes(
+@classes.get("/api/v1/classes", response_model=List[schemas.Class], dependencies=[Depends(ConditionalGet("classes", "students", "marks", "users"))])
+async def get_classes(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_classes_use_case: GetClassesUseCase = Depends(get_classes_use_case),
 ):
     """
@@ -107,18 +121,24 @@ def get_classes(
     Args:  
         - `skip` (default: 0): A parameter which determines how many objects to skip.  
         - `limit` (default: 100): A parameter which determines the maximum amount of classes to return.  
+        - `cursor` (default: None): The cursor of the page to return, as given by the `X-Next-Cursor` header of the previous page.  
+        - `include_total` (default: false): Whether to include an estimate of the total number of classes in the `X-Total-Estimate` header.  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.  
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_classes_use_case`: The class which handles the business logic for class retrieval.  
 
     Raises:  
+        - `HTTPException`, 304: If the `If-None-Match` header matches the `ETag` of the response, i.e. nothing has changed since.  
         - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 400: If the `cursor` is malformed.  
         - `HTTPException`, 403: If there has been a permission error, in this case, if the `is_admin` flag is false, as only administrator can create a class.  
         - `HTTPException`, 404: If no classes have been found and returned.  
         - `HTTPException`, 500: If any other system exception occurs.  
 
     Returns:  
         - `response_model`: The response is in the model of the `List[schemas.Class]` schema, which returns a list of Classes.  
+                             The `X-Next-Cursor` header is set if there is a next page.  
     """
     if current_user is None:
         raise HTTPException(
@@ -127,7 +147,14 @@ def get_classes(
         )
 
     try:
-        return get_classes_use_case.execute(skip, limit, current_user)
+        page = await session_runner.run(
+            lambda: to_classes_page(get_classes_use_case.execute(skip, limit, current_user, cursor, include_total))
+        )
+        set_page_headers(response, page)
+
+        return page.items
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except ClassesNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except PermissionError as e:
@@ -136,10 +163,11 @@ def get_classes(
         raise HTTPException(status_code=500, detail=str(e))
 
 @classes.get("/api/v1/classes/lecturer", response_model=List[schemas.Class])
-def get_classes_for_lecturer(
+async def get_classes_for_lecturer(
     skip: int = 0,
     limit: int = 100,
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_classes_for_lecturer_use_case: GetClassesForLecturerUseCase = Depends(get_classes_for_lecturer_use_case),
 ):
     """
@@ -153,6 +181,7 @@ def get_classes_for_lecturer(
         - `limit` (default: 100): A parameter which determines the maximum amount of classes to return.  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.  
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_classes_for_lecturer_use_case`: The class which handles the business logic for class retrieval for the lecturer.  
 
     Raises: 
@@ -170,7 +199,7 @@ def get_classes_for_lecturer(
         )
 
     try:
-        return get_classes_for_lecturer_use_case.execute(current_user, skip, limit)
+        return await session_runner.run(lambda: to_classes(get_classes_for_lecturer_use_case.execute(current_user, skip, limit)))
     except UserNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ClassesNotFound as e:
@@ -409,10 +438,11 @@ def get_associated_degrees_for_class(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-@classes.get("/api/v1/classes/{class_code}/statistics", response_model=schemas.MarksStatistics)
-def get_class_statistics(
+@classes.get("/api/v1/classes/{class_code}/statistics", response_model=schemas.MarksStatistics, dependencies=[Depends(ConditionalGet("marks", "classes"))])
+async def get_class_statistics(
     class_code: str,
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_class_statistics_use_case: GetClassStatisticsUseCase = Depends(get_class_statistics_use_case),
 ):
     """
@@ -425,9 +455,11 @@ def get_class_statistics(
         - `class_code`: The class code of the class to calculate the statistics for.
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_class_statistics_use_case`: The class which handles the business logic for the calculation of statistics for the class.   
 
     Raises:  
+        - `HTTPException`, 304: If the `If-None-Match` header matches the `ETag` of the response, i.e. nothing has changed since.  
         - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
         - `HTTPException`, 404: If the user (lecturer) from the JWT has not been found, or if no marks have been found.  
         - `HTTPException`, 500: If any other system exception occurs.  
@@ -442,7 +474,7 @@ def get_class_statistics(
         )    
 
     try:
-        return get_class_statistics_use_case.execute(class_code, current_user)
+        return await session_runner.run(get_class_statistics_use_case.execute, class_code, current_user)
     except UserNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except MarkNotFound as e:
@@ -450,9 +482,11 @@ def get_class_statistics(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@classes.get("/api/v1/classes/metrics/all", response_model=schemas.MarksMetrics)
-def get_class_metrics(
+@classes.get("/api/v1/classes/metrics/all", response_model=schemas.MarksMetrics, dependencies=[Depends(ConditionalGet("marks", "classes"))])
+async def get_class_metrics(
+    k: int = Query(3, ge=1),
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_class_metrics_use_case: GetClassMetricsUseCase = Depends(get_class_metrics_use_case),
 ):
     """
@@ -462,11 +496,14 @@ def get_class_metrics(
     OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
 
     Args:  
+        - `k` (default: 3): The number of classes to return for each metric, i.e. the 3 lowest performing classes.  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_class_metrics_use_case`: The class which handles the business logic for the calculation of metrics for classes.   
 
     Raises:  
+        - `HTTPException`, 304: If the `If-None-Match` header matches the `ETag` of the response, i.e. nothing has changed since.  
         - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
         - `HTTPException`, 404: If the user (lecturer) from the JWT has not been found, or if no marks have been found.  
         - `HTTPException`, 500: If any other system exception occurs.  
@@ -481,7 +518,7 @@ def get_class_metrics(
         )    
 
     try:
-        return get_class_metrics_use_case.execute(current_user)
+        return await session_runner.run(get_class_metrics_use_case.execute, current_user, k)
     except UserNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except MarkNotFound as e:
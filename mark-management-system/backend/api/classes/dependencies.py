@@ -4,6 +4,8 @@ from api.middleware.dependencies import ClassRepository
 from api.middleware.dependencies import UserRepository
 from api.middleware.dependencies import DegreeRepository
 from api.middleware.dependencies import MarkRepository
+from api.middleware.dependencies import ClassStatisticsRepository
+from api.middleware.dependencies import ScopedCache
 
 from api.classes.use_cases.create_class_use_case import CreateClassUseCase
 from api.classes.use_cases.get_classes_use_case import GetClassesUseCase
@@ -19,7 +21,11 @@ from api.classes.use_cases.get_class_metrics_use_case import GetClassMetricsUseC
 from api.middleware.dependencies import get_class_repository
 from api.middleware.dependencies import get_user_repository
 from api.middleware.dependencies import get_degree_repository
-from api.middleware.dependencies import get_mark_repository
+from api.middleware.dependencies import get_statistics_cache
+from api.middleware.dependencies import get_read_class_repository
+from api.middleware.dependencies import get_read_user_repository
+from api.middleware.dependencies import get_read_mark_repository
+from api.middleware.dependencies import get_read_class_statistics_repository
 
 
 
@@ -33,15 +39,15 @@ def create_class_use_case(
     )
 
 def get_classes_use_case(
-        class_repository: ClassRepository = Depends(get_class_repository),
+        class_repository: ClassRepository = Depends(get_read_class_repository),
     ) -> GetClassesUseCase:
     return GetClassesUseCase(
         class_repository, 
     )
 
 def get_classes_for_lecturer_use_case(
-        class_repository: ClassRepository = Depends(get_class_repository),
-        user_repository: UserRepository = Depends(get_user_repository)
+        class_repository: ClassRepository = Depends(get_read_class_repository),
+        user_repository: UserRepository = Depends(get_read_user_repository)
     ) -> GetClassesForLecturerUseCase:
     return GetClassesForLecturerUseCase(
         class_repository, 
@@ -74,21 +80,27 @@ def get_class_use_case(
     )
 
 def get_class_statistics_use_case(
-        class_repository: ClassRepository = Depends(get_class_repository),
-        user_repository: UserRepository = Depends(get_user_repository)
+        mark_repository: MarkRepository = Depends(get_read_mark_repository),
+        class_statistics_repository: ClassStatisticsRepository = Depends(get_read_class_statistics_repository),
+        user_repository: UserRepository = Depends(get_read_user_repository),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
     ) -> GetClassStatisticsUseCase:
     return GetClassStatisticsUseCase(
-        class_repository, 
-        user_repository
+        mark_repository, 
+        class_statistics_repository,
+        user_repository,
+        statistics_cache,
     )
 
 def get_class_metrics_use_case(
-        mark_repository: MarkRepository = Depends(get_mark_repository),
-        user_repository: UserRepository = Depends(get_user_repository)
+        class_statistics_repository: ClassStatisticsRepository = Depends(get_read_class_statistics_repository),
+        user_repository: UserRepository = Depends(get_read_user_repository),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
     ) -> GetClassMetricsUseCase:
     return GetClassMetricsUseCase(
-        mark_repository, 
-        user_repository
+        class_statistics_repository, 
+        user_repository,
+        statistics_cache,
     )
 
 def check_if_class_is_associated_with_a_degree_use_case(
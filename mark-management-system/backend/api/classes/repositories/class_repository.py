@@ -1,4 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Iterable, Tuple, Set
+
+from sqlalchemy import exists
+
+from sqlalchemy.engine import Row
 
 from sqlalchemy.orm import Session
 
@@ -8,7 +12,11 @@ from api.system.models.models import User
 from api.system.models.models import Marks
 
 from api.system.schemas.schemas import ClassEdit
-from api.system.schemas.schemas import MarksStatistics
+
+from api.system.repositories.data_version_repository import DataVersionRepository
+
+from api.utils.pagination import keyset
+from api.utils.pagination import estimate_count
 
 
 class ClassRepository:
@@ -22,6 +30,7 @@ class ClassRepository:
             db: The database session.
         """
         self.db = db
+        self.data_version_repository = DataVersionRepository(db)
     
     def add(self, class_: Class) -> None:
         """
@@ -31,6 +40,7 @@ class ClassRepository:
             class_: The object to be added.
         """
         self.db.add(class_)
+        self.data_version_repository.bump(Class.__tablename__)
         self.db.commit()
         self.db.refresh(class_)
 
@@ -58,6 +68,40 @@ class ClassRepository:
         """
         return self.db.query(Class).filter_by(code=code).first()
 
+    def find_by_codes(self, codes: Iterable[str]) -> List[Class]:
+        """
+        Retrieves every class matching one of the given class codes, in a single query.
+
+        Args:
+            codes: The class codes.
+        
+        Returns:
+            List[Class]: A list of `Class`(es) from the database, codes which do not exist are simply not present in the result.
+        """
+        codes = set(codes)
+
+        if not codes:
+            return []
+
+        return self.db.query(Class).filter(Class.code.in_(codes)).all()
+
+    def find_ids_by_codes(self, codes: Iterable[str]) -> List[Row]:
+        """
+        Retrieves the identifiers of every class matching one of the given class codes, in a single query, without loading the classes.
+
+        Args:
+            codes: The class codes.
+        
+        Returns:
+            List[Row]: A list of rows containing the `id`, `code` and `lecturer_id` of each class, codes which do not exist are simply not present in the result.
+        """
+        codes = set(codes)
+
+        if not codes:
+            return []
+
+        return self.db.query(Class.id, Class.code, Class.lecturer_id).filter(Class.code.in_(codes)).all()
+
     def get_class(self, class_id: int) -> Optional[Class]:
         """
         Retrieves a class by a given class identifier.
@@ -70,18 +114,28 @@ class ClassRepository:
         """
         return self.db.query(Class).filter_by(id=class_id).first()
 
-    def get_classes(self, skip: int = 0, limit: int = 100) -> List[Class]:
+    def get_classes(self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[Class]:
         """
-        Retrieves a list of classes, given a skip and a limit.
+        Retrieves a list of classes ordered by their identifier, given a skip, a limit and optionally a cursor.
 
         Args:
             skip: The amount to skip.
-            limit: The maximum number of items to be retrieved.
+            limit: The maximum number of items to be retrieved, one more is returned if there is a next page.
+            after_id (default: None): The identifier of the last class of the previous page.
         
         Returns:
             List[Class]: A list of `Class`(es) from the database, however can also return `[]` if none are found.
         """
-        return self.db.query(Class).offset(skip).limit(limit).all()
+        return keyset(self.db.query(Class), Class.id, after_id, skip, limit).all()
+
+    def estimate_classes(self) -> int:
+        """
+        Estimates the number of classes in the system.
+
+        Returns:
+            int: The (estimated) number of classes.
+        """
+        return estimate_count(self.db, Class.__tablename__, self.db.query(Class))
     
     def get_classes_by_lecturer_id(self, lecturer_id: int, skip: int = 0, limit: int = 100) -> List[Class]:
         """
@@ -97,6 +151,29 @@ class ClassRepository:
         """
         return self.db.query(Class).filter_by(lecturer_id=lecturer_id).offset(skip).limit(limit).all()
     
+    def get_classes_with_upload_status(self, lecturer_ids: Iterable[int]) -> List[Tuple[Class, bool]]:
+        """
+        Retrieves the classes taught by any of the given lecturers, alongside whether marks have been uploaded for each class.
+
+        Args:
+            lecturer_ids: The identifiers of the lecturers.
+        
+        Returns:
+            List[Tuple[Class, bool]]: A list of `Class`(es) & an is_uploaded flag, however can also return `[]` if none are found.
+        """
+        lecturer_ids = list(lecturer_ids)
+
+        if not lecturer_ids:
+            return []
+
+        is_uploaded = exists().where(Marks.class_id == Class.id).label("is_uploaded")
+
+        return (self.db.query(Class, is_uploaded)
+            .filter(Class.lecturer_id.in_(lecturer_ids))
+            .order_by(Class.lecturer_id, Class.id)
+            .all()
+        )
+
     def check_class_code_exists(self, request: ClassEdit) -> bool:
         """
         Checks if a given class code exists in the database.
@@ -135,6 +212,27 @@ class ClassRepository:
         """
         return self.db.query(Class).join(Class.students).filter(Student.id == student_id, Class.id == class_id).first() is not None
     
+    def find_student_class_pairs(self, class_ids: Iterable[int], student_ids: Iterable[int]) -> Set[Tuple[int, int]]:
+        """
+        Retrieves which of the given students belong to which of the given classes, in a single query.
+
+        Args:
+            class_ids: The identifiers of the classes.
+            student_ids: The identifiers of the students.
+        
+        Returns:
+            Set[Tuple[int, int]]: The class & student identifier of every student which belongs to one of the classes.
+        """
+        class_ids, student_ids = set(class_ids), set(student_ids)
+
+        if not (class_ids and student_ids):
+            return set()
+
+        return {
+            (class_id, student_id) for class_id, student_id in self.db.query(Marks.class_id, Marks.student_id)
+                .filter(Marks.class_id.in_(class_ids), Marks.student_id.in_(student_ids))
+        }
+
     def is_student_in_class(self, class_code: str, reg_no: str) -> bool:
         """
         Checks if a student belongs to a class.
@@ -148,23 +246,6 @@ class ClassRepository:
         """
         return self.db.query(Class).join(Class.students).filter(Student.reg_no == reg_no, Class.code == class_code).first() is not None
     
-    def get_marks_for_class(self, class_code: str) -> List[MarksStatistics]:
-        """
-        Retrieves a list of marks for a given class.
-
-        Args:
-            class_code: The class for which the student marks should be retrieved.
-        
-        Returns:
-            List[MarksStatistics]: A list of `MarksStatistics` schematic objects.
-        """
-        return (self.db.query(Class.code, Marks.mark)
-            .join(Marks, Marks.class_id == Class.id)
-            .filter(Class.code == class_code)
-            .all()
-        )
-
-
     def update(self, class_: Class, lecturer: User, request: ClassEdit) -> None:
         """
         Updates the details of an existing class.
@@ -181,6 +262,7 @@ class ClassRepository:
         class_.lecturer_id = request.lecturer_id
         class_.lecturer = lecturer
 
+        self.data_version_repository.bump(Class.__tablename__)
         self.db.commit()
 
     def delete(self, class_: Class) -> None:
@@ -191,4 +273,5 @@ class ClassRepository:
             class_: A class object, which already exists in the database.
         """
         self.db.delete(class_)
+        self.data_version_repository.bump(Class.__tablename__)
         self.db.commit()
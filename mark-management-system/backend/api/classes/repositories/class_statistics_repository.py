@@ -0,0 +1,231 @@
+from typing import List, Optional, Iterable, Iterator, Tuple, Dict, Any
+
+from sqlalchemy import func
+
+from sqlalchemy.orm import Session
+
+from api.system.models.models import Class
+from api.system.models.models import ClassStatistics
+from api.system.models.models import Marks
+
+from api.marks.statistics import PASS_MARK
+from api.marks.statistics import MARK_BUCKETS
+
+from api.utils.upsert import dialect_insert
+
+
+BUCKET_COLUMNS = ("first_bucket", "second_bucket", "third_bucket", "fourth_bucket", "fifth_bucket")
+
+
+class ClassStatisticsRepository:
+    """
+    The repository layer which performs queries and operations on the database for `ClassStatistics` objects, a summary
+    of the marks of each class which is kept up to date as marks are written.
+    """
+
+    def __init__(self, db: Session) -> None:
+        """
+        Initializes the repository with a databance instance via Dependency Inversion.
+
+        Args:
+            db: The database session.
+        """
+        self.db = db
+
+    def find_by_class_code(self, class_code: str) -> Optional[ClassStatistics]:
+        """
+        Retrieves the statistics of a class by a given class code.
+
+        Args:
+            class_code: The class code.
+
+        Returns:
+            Optional[ClassStatistics]: A `ClassStatistics` object from the database, however can also return `None` if they have not been built yet.
+        """
+        return (self.db.query(ClassStatistics)
+            .join(Class, Class.id == ClassStatistics.class_id)
+            .filter(Class.code == class_code)
+            .first()
+        )
+
+    def get_class_statistics(self) -> List[Tuple[ClassStatistics, Class]]:
+        """
+        Retrieves the statistics of every class which has at least one mark, alongside the class itself.
+
+        Returns:
+            List[Tuple[ClassStatistics, Class]]: A list of `ClassStatistics` & `Class` objects, however can also return `[]` if none are found.
+        """
+        return (self.db.query(ClassStatistics, Class)
+            .join(Class, Class.id == ClassStatistics.class_id)
+            .filter(ClassStatistics.mark_count > 0)
+            .order_by(ClassStatistics.class_id)
+            .all()
+        )
+
+    def get_class_moments(self) -> Iterator[Tuple[int, str, str, int, int, int, int, int]]:
+        """
+        Streams the details & the mark count, sum and sum of squares of every class which has at least one mark, without
+        loading any `ClassStatistics` (or `Class`) objects, i.e. for ranking classes.
+
+        Classes whose statistics have not been built yet (i.e. before a backfill) are aggregated from their marks instead,
+        after every other class, in a single query which is only run if there are any.
+
+        Returns:
+            Iterator[Tuple]: An iterator of rows, each containing the id, code, name, credit, credit level, mark count, mark sum & mark sum of squares of a class.
+        """
+        unsummarised: Dict[int, Tuple[str, str, int, int]] = {}
+
+        for class_id, code, name, credit, credit_level, statistics_class_id, mark_count, mark_sum, mark_sum_of_squares in (
+            self.db.query(
+                Class.id,
+                Class.code,
+                Class.name,
+                Class.credit,
+                Class.credit_level,
+                ClassStatistics.class_id,
+                ClassStatistics.mark_count,
+                ClassStatistics.mark_sum,
+                ClassStatistics.mark_sum_of_squares,
+            )
+            .outerjoin(ClassStatistics, ClassStatistics.class_id == Class.id)
+            .order_by(Class.id)
+            .yield_per(1000)
+        ):
+            if statistics_class_id is None:
+                unsummarised[class_id] = (code, name, credit, credit_level)
+            elif mark_count > 0:
+                yield class_id, code, name, credit, credit_level, mark_count, mark_sum, mark_sum_of_squares
+
+        if not unsummarised:
+            return
+
+        for class_id, mark_count, mark_sum, mark_sum_of_squares in (self.db.query(
+                Marks.class_id,
+                func.count(Marks.mark),
+                func.sum(Marks.mark),
+                func.sum(Marks.mark * Marks.mark),
+            )
+            .filter(Marks.class_id.in_(unsummarised), Marks.mark.is_not(None))
+            .group_by(Marks.class_id)
+            .order_by(Marks.class_id)
+        ):
+            yield class_id, *unsummarised[class_id], mark_count, mark_sum, mark_sum_of_squares
+
+    def record(self, class_id: Optional[int], changes: Iterable[Tuple[Any, int]]) -> None:
+        """
+        Applies mark changes to the statistics of a class. The changes must already be flushed, and are not committed, so that
+        they are committed alongside the marks themselves.
+
+        If the statistics of the class have not been built yet, they are rebuilt from the marks instead.
+
+        Args:
+            class_id: The identifier of the class.
+            changes: A list of a mark (or `None` if only a mark code was given) & either 1 if the mark was added, or -1 if it was removed.
+        """
+        if class_id is None:
+            return
+
+        class_id = int(class_id)
+
+        # The row is created with `ON CONFLICT DO NOTHING`, so that concurrent first writes to a class wait on the row instead
+        # of failing on its primary key. A concurrent write only applies its changes once this transaction has committed.
+        insert = dialect_insert(self.db)
+        created = self.db.execute(
+            insert(ClassStatistics)
+            .values(class_id=class_id, histogram={})
+            .on_conflict_do_nothing(index_elements=[ClassStatistics.class_id])
+            .returning(ClassStatistics.class_id)
+        ).first()
+
+        if created is not None:
+            self.rebuild([class_id])
+            return
+
+        statistics = self.db.query(ClassStatistics).filter_by(class_id=class_id).with_for_update().first()
+
+        histogram = dict(statistics.histogram)
+
+        for mark, sign in changes:
+            self._apply(statistics, histogram, mark, sign)
+
+        statistics.histogram = histogram
+
+    def rebuild(self, class_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Recalculates the statistics of classes from their marks, i.e. for a backfill. The changes are not committed.
+
+        Args:
+            class_ids (default: None): The identifiers of the classes to rebuild, or every class if `None`.
+
+        Returns:
+            int: The number of classes which have been rebuilt.
+        """
+        class_query = self.db.query(Class.id)
+        mark_query = self.db.query(Marks.class_id, Marks.mark, func.count()).group_by(Marks.class_id, Marks.mark)
+        existing_query = self.db.query(ClassStatistics)
+
+        if class_ids is not None:
+            class_ids = set(class_ids)
+
+            class_query = class_query.filter(Class.id.in_(class_ids))
+            mark_query = mark_query.filter(Marks.class_id.in_(class_ids))
+            existing_query = existing_query.filter(ClassStatistics.class_id.in_(class_ids))
+
+        existing = {statistics.class_id: statistics for statistics in existing_query.with_for_update()}
+
+        rebuilt: Dict[int, ClassStatistics] = {}
+        histograms: Dict[int, Dict[str, int]] = {}
+
+        for (class_id,) in class_query:
+            statistics = existing.pop(class_id, None) or ClassStatistics(class_id=class_id)
+
+            statistics.row_count = 0
+            statistics.mark_count = 0
+            statistics.mark_sum = 0
+            statistics.mark_sum_of_squares = 0
+            statistics.pass_count = 0
+
+            for column in BUCKET_COLUMNS:
+                setattr(statistics, column, 0)
+
+            rebuilt[class_id], histograms[class_id] = statistics, {}
+
+        for class_id, mark, count in mark_query:
+            if class_id in rebuilt:
+                self._apply(rebuilt[class_id], histograms[class_id], mark, count)
+
+        for class_id, statistics in rebuilt.items():
+            statistics.histogram = histograms[class_id]
+            self.db.add(statistics)
+
+        # Statistics of classes which no longer exist.
+        for statistics in existing.values():
+            self.db.delete(statistics)
+
+        return len(rebuilt)
+
+    def _apply(self, statistics: ClassStatistics, histogram: Dict[str, int], mark: Any, count: int) -> None:
+        statistics.row_count += count
+
+        if mark is None or mark == "":
+            return
+
+        mark = int(mark)
+
+        statistics.mark_count += count
+        statistics.mark_sum += mark * count
+        statistics.mark_sum_of_squares += mark * mark * count
+
+        if mark >= PASS_MARK:
+            statistics.pass_count += count
+
+        for column, (lower, upper) in zip(BUCKET_COLUMNS, MARK_BUCKETS):
+            if lower <= mark <= upper:
+                setattr(statistics, column, getattr(statistics, column) + count)
+
+        # JSON object keys are always strings, so the histogram is keyed by the mark as a string.
+        key = str(mark)
+        histogram[key] = histogram.get(key, 0) + count
+
+        if histogram[key] <= 0:
+            del histogram[key]
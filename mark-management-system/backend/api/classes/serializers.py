@@ -0,0 +1,37 @@
+from typing import Any, Final, Iterable, List
+
+from pydantic import TypeAdapter
+
+from api.system.schemas.schemas import Class
+
+from api.utils.pagination import Page
+
+
+# Built once, so that a list of classes is validated in a single call into pydantic-core, rather than class by class.
+CLASSES_ADAPTER: Final[TypeAdapter[List[Class]]] = TypeAdapter(List[Class])
+
+
+def to_classes(classes: Iterable[Any]) -> List[Class]:
+    """
+    Validates classes as a list of `Class`, which loads their lecturer, students & marks, so that it must be called while
+    the session of the classes is usable, i.e. within `SessionRunner.run` rather than when FastAPI serialises the response.
+
+    Args:
+        classes: The classes, i.e. `models.Class` objects.
+
+    Returns:
+        List[Class]: A list of `Class` schematic objects.
+    """
+    return CLASSES_ADAPTER.validate_python(list(classes), from_attributes=True)
+
+def to_classes_page(page: Page) -> Page:
+    """
+    Validates the classes of a page, see `to_classes`.
+
+    Args:
+        page: A page of classes, i.e. `models.Class` objects.
+
+    Returns:
+        Page: The same page, containing `Class` schematic objects instead.
+    """
+    return page._replace(items=to_classes(page.items))
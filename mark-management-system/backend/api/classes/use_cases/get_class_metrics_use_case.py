@@ -1,33 +1,60 @@
-from statistics import mean, stdev
+import heapq
 
-from typing import Tuple
+from typing import Tuple, List, Optional, NamedTuple
 
 from api.system.schemas.schemas import MarksMetrics
 from api.system.schemas.schemas import ClassBaseMetric
 
-from api.marks.repositories.mark_repository import MarkRepository
+from api.classes.repositories.class_statistics_repository import ClassStatisticsRepository
 from api.users.repositories.user_repository import UserRepository
 
+from api.marks.statistics_cache import GLOBAL_SCOPE
+
+from api.marks.statistics import sample_stdev
+
+from api.utils.cache import ScopedCache
+
 from api.marks.errors.mark_not_found import MarkNotFound
 
 from api.users.errors.user_not_found import UserNotFound
 
 
+class ClassMoments(NamedTuple):
+    index: int
+    mean: int
+    stdev: int
+
+    code: str
+    name: str
+    credit: int
+    credit_level: int
+
+
 class GetClassMetricsUseCase:
     """
     The Use Case containing business logic for retrieving class data & calculating
     metrics from them.
     """
-    def __init__(self, mark_repository: MarkRepository, user_repository: UserRepository) -> None:
-        self.mark_repository = mark_repository
+    def __init__(
+            self,
+            class_statistics_repository: ClassStatisticsRepository,
+            user_repository: UserRepository,
+            statistics_cache: ScopedCache,
+        ) -> None:
+        self.class_statistics_repository = class_statistics_repository
         self.user_repository = user_repository
+        self.statistics_cache = statistics_cache
     
-    def execute(self, current_user: Tuple[str, bool, bool]) -> MarksMetrics:
+    def execute(self, current_user: Tuple[str, bool, bool], k: int = 3) -> MarksMetrics:
         """
-        Executes the Use Case to calculate metrics of all classes in the system.
+        Executes the Use Case to calculate metrics of all classes in the system, from the (materialised) statistics of each class.
+
+        The classes are ranked in a single pass, keeping only the `k` lowest & highest of each metric in a heap, rather than
+        sorting every class, and schema objects are only created for the classes which are returned.
 
         Args:
             current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+            k (default: 3): The number of classes to return for each metric.
 
         Raises:
             MarkNotFound: If no marks are found in the system.
@@ -42,50 +69,66 @@ class GetClassMetricsUseCase:
 
         if user is None:
             raise UserNotFound("User not found")
-        
-        marks = self.mark_repository.get_all_student_marks()
 
-        if not marks:
+        marks_metrics = self.statistics_cache.get_or_compute(GLOBAL_SCOPE, f"metrics:{k}", lambda: self.calculate_metrics(k))
+
+        if marks_metrics is None:
             raise MarkNotFound("No marks found")
 
-        if marks:
-            classes = {}
-
-            for code, name, credit, credit_level, mark in marks:
-                if mark:
-                    if code not in classes:
-                            class_base = ClassBaseMetric(
-                                name=name,
-                                code=code,
-                                credit=credit,
-                                credit_level=credit_level,
-                                mean=0,
-                                stdev=0,
-                            )
-
-                            classes[code] = {"class_base": class_base, "marks": [mark]}
-                    else:
-                        classes[code]["marks"].append(mark)
-
-            for code, data in classes.items():
-                class_base = data["class_base"]
-                class_base.mean = round(mean(data["marks"]))
-                
-                if len(data["marks"]) > 1:
-                    class_base.stdev = round(stdev(data["marks"]))
-
-            sorted_classes_by_mean = sorted(classes.items(), key=lambda class_: class_[1]["class_base"].mean)
-
-            lowest_performing_classes_sorted_list = [data[1]["class_base"] for data in sorted_classes_by_mean[:min(3, len(sorted_classes_by_mean))]]
-            highest_performing_classes_sorted_list = [data[1]["class_base"] for data in sorted_classes_by_mean[-min(3, len(sorted_classes_by_mean)):]]
-
-            sorted_classes_by_stdev = sorted(classes.items(), key=lambda class_: class_[1]["class_base"].stdev)
-            most_consistent_classes_sorted_list = [data[1]["class_base"] for data in sorted_classes_by_stdev[-min(3, len(sorted_classes_by_mean)):]]
-
-            marks_statistics = MarksMetrics(
-                lowest_performing_classes=lowest_performing_classes_sorted_list,
-                highest_performing_classes=highest_performing_classes_sorted_list,
-                most_consistent_classes=most_consistent_classes_sorted_list,
+        return marks_metrics
+
+    def calculate_metrics(self, k: int) -> Optional[MarksMetrics]:
+        # Each heap holds at most `k` classes, keyed so that the class which should be dropped first is always at the top.
+        # Ties are broken by the order of the classes, so that the result is the same as slicing the fully sorted classes.
+        lowest_performing_heap: List[Tuple[int, int, ClassMoments]] = []
+        highest_performing_heap: List[Tuple[int, int, ClassMoments]] = []
+        most_consistent_heap: List[Tuple[int, int, ClassMoments]] = []
+
+        for index, (_, code, name, credit, credit_level, mark_count, mark_sum, mark_sum_of_squares) in enumerate(
+            self.class_statistics_repository.get_class_moments()
+        ):
+            class_ = ClassMoments(
+                index=index,
+                mean=round(mark_sum / mark_count),
+                stdev=round(sample_stdev(mark_count, mark_sum, mark_sum_of_squares)),
+                code=code,
+                name=name,
+                credit=credit,
+                credit_level=credit_level,
             )
 
+            self.push(lowest_performing_heap, (-class_.mean, -index, class_), k)
+            self.push(highest_performing_heap, (class_.mean, index, class_), k)
+            self.push(most_consistent_heap, (class_.stdev, index, class_), k)
+
+        if not lowest_performing_heap:
+            return None
+
+        lowest_performing_classes = [class_ for _, _, class_ in sorted(lowest_performing_heap, reverse=True)]
+        highest_performing_classes = [class_ for _, _, class_ in sorted(highest_performing_heap)]
+        most_consistent_classes = [class_ for _, _, class_ in sorted(most_consistent_heap)]
+
+        # Every list is in ascending order of its metric.
+        marks_statistics = MarksMetrics(
+            lowest_performing_classes=[self.create_class_base_metric(class_) for class_ in lowest_performing_classes],
+            highest_performing_classes=[self.create_class_base_metric(class_) for class_ in highest_performing_classes],
+            most_consistent_classes=[self.create_class_base_metric(class_) for class_ in most_consistent_classes],
+        )
+
         return marks_statistics
+
+    def push(self, heap: List[Tuple[int, int, ClassMoments]], item: Tuple[int, int, ClassMoments], k: int) -> None:
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def create_class_base_metric(self, class_: ClassMoments) -> ClassBaseMetric:
+        return ClassBaseMetric(
+            name=class_.name,
+            code=class_.code,
+            credit=class_.credit,
+            credit_level=class_.credit_level,
+            mean=class_.mean,
+            stdev=class_.stdev,
+        )
@@ -1,12 +1,17 @@
-from statistics import mean, mode, median
-
-from typing import Tuple
+from typing import Tuple, Optional
 
 from api.system.schemas.schemas import MarksStatistics
 
-from api.classes.repositories.class_repository import ClassRepository
+from api.marks.repositories.mark_repository import MarkRepository
+from api.classes.repositories.class_statistics_repository import ClassStatisticsRepository
 from api.users.repositories.user_repository import UserRepository
 
+from api.marks.statistics_cache import class_scope
+
+from api.marks.statistics import summarise_class_statistics
+
+from api.utils.cache import ScopedCache
+
 from api.marks.errors.mark_not_found import MarkNotFound
 
 from api.users.errors.user_not_found import UserNotFound
@@ -17,9 +22,17 @@ class GetClassStatisticsUseCase:
     The Use Case containing business logic for retrieving class data & calculating
     statistics for that class.
     """
-    def __init__(self, class_repository: ClassRepository, user_repository: UserRepository) -> None:
-        self.class_repository = class_repository
+    def __init__(
+            self,
+            mark_repository: MarkRepository,
+            class_statistics_repository: ClassStatisticsRepository,
+            user_repository: UserRepository,
+            statistics_cache: ScopedCache,
+        ) -> None:
+        self.mark_repository = mark_repository
+        self.class_statistics_repository = class_statistics_repository
         self.user_repository = user_repository
+        self.statistics_cache = statistics_cache
         self.pass_rate = 40
     
     def execute(self, class_code: str, current_user: Tuple[str, bool, bool]) -> MarksStatistics:
@@ -45,40 +58,25 @@ class GetClassStatisticsUseCase:
         if user is None:
             raise UserNotFound("User not found")
         
-        marks = self.class_repository.get_marks_for_class(class_code)
+        marks_statistics = self.statistics_cache.get_or_compute(
+            class_scope(class_code),
+            "statistics",
+            lambda: self.calculate_statistics(class_code),
+        )
 
-        if not marks:
+        if marks_statistics is None:
             raise MarkNotFound("No marks found for the class")
 
-        mark_data = []
-
-        for current_mark in marks:
-            if current_mark[1]:
-                mark_data.append(current_mark[1])
-
-        if mark_data:
-            marks_statistics = MarksStatistics(
-                mean=round(mean(mark_data)),
-                median=round(median(mark_data)),
-                mode=round(mode(mark_data)),
-                pass_rate=round(sum(mark >= self.pass_rate for mark in mark_data) / len(marks) * 100),
-                first_bucket=len([mark for mark in mark_data if mark <= 40]),
-                second_bucket=len([mark for mark in mark_data if 40 <= mark <= 49]),
-                third_bucket=len([mark for mark in mark_data if 50 <= mark <= 59]),
-                fourth_bucket=len([mark for mark in mark_data if 60 <= mark <= 69]),
-                fifth_bucket=len([mark for mark in mark_data if 70 <= mark <= 100]),
-            )
-        else:
-            marks_statistics = MarksStatistics(
-                mean=-1,
-                median=-1,
-                mode=-1,
-                pass_rate=-1,
-                first_bucket=-1,
-                second_bucket=-1,
-                third_bucket=-1,
-                fourth_bucket=-1,
-                fifth_bucket=-1,
-            )
-
         return marks_statistics
+
+    def calculate_statistics(self, class_code: str) -> Optional[MarksStatistics]:
+        class_statistics = self.class_statistics_repository.find_by_class_code(class_code)
+
+        if class_statistics is None:
+            # The statistics of the class have not been built yet (i.e. before a backfill), so the marks are aggregated instead.
+            return self.mark_repository.get_marks_statistics(self.pass_rate, class_code=class_code)
+
+        if class_statistics.row_count > 0:
+            return summarise_class_statistics(class_statistics, self.pass_rate)
+
+        return None
@@ -1,11 +1,13 @@
-from typing import Tuple, List
-
-from api.system.schemas.schemas import Class as ClassSchema
+from typing import Tuple, Optional
 
 from api.classes.repositories.class_repository import ClassRepository
 
 from api.classes.errors.classes_not_found import ClassesNotFound
 
+from api.utils.pagination import Page
+from api.utils.pagination import build_page
+from api.utils.pagination import decode_cursor
+
 
 class GetClassesUseCase:
     """
@@ -14,7 +16,14 @@ class GetClassesUseCase:
     def __init__(self, class_repository: ClassRepository) -> None:
         self.class_repository = class_repository
     
-    def execute(self, skip: int, limit: int, current_user: Tuple[str, bool, bool]) -> List[ClassSchema]:
+    def execute(
+            self,
+            skip: int,
+            limit: int,
+            current_user: Tuple[str, bool, bool],
+            cursor: Optional[str] = None,
+            include_total: bool = False,
+        ) -> Page:
         """
         Executes the Use Case for retrieving a list of classes.
 
@@ -22,22 +31,27 @@ class GetClassesUseCase:
             skip: The amount to skip.
             limit: The maximum number of items to be retrieved.
             current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+            cursor (default: None): The cursor of the page to retrieve, as returned with the previous page.
+            include_total (default: False): Whether to include an estimate of the total number of classes.
         
         Raises:
+            InvalidCursor: If the cursor is malformed.
             PermissionError: If the requestor is not an administrator.
             ClassesNotFound: If no classes are returned from the repository.
 
         Returns:
-            List[ClassSchema]: A list of `ClassSchema` objects, containing the information about the classes.
+            Page: A page of `Class` objects, containing the information about the classes, and the cursor of the next page.
         """
         _, is_admin, _ = current_user
         
         if is_admin is False:
             raise PermissionError("Permission denied to access this resource")
         
-        classes = self.class_repository.get_classes(skip, limit)
+        classes = self.class_repository.get_classes(skip, limit, decode_cursor(cursor))
 
         if not classes:
             raise ClassesNotFound("Classes not found")
 
-        return classes
+        total_estimate = self.class_repository.estimate_classes() if include_total else None
+
+        return build_page(classes, limit, lambda class_: class_.id, total_estimate)
@@ -5,9 +5,48 @@ class Config:
     JWT_SECRET_KEY = os.environ.get("SECRET_KEY")
     JWT_REFRESH_SECRET_KEY = os.environ.get("REFRESH_SECRET_KEY")
     JWT_ALGORITHM = "HS256"
-    JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 43800
+    JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", 43800))
     JWT_REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7
 
+    # The library which verifies access tokens (`jose` or `pyjwt`), and how many verified tokens are remembered, for how long.
+    JWT_DECODER = os.environ.get("JWT_DECODER", "jose")
+    JWT_CACHE_MAXSIZE = int(os.environ.get("JWT_CACHE_MAXSIZE", 4096))
+    JWT_CACHE_TTL_SECONDS = int(os.environ.get("JWT_CACHE_TTL_SECONDS", 300))
+
+    # The cost of password hashes, existing hashes are rehashed at the new cost when their user next logs in.
+    BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+    # The number of processes which passwords are hashed in, where 0 hashes them in the request handlers instead.
+    BCRYPT_PROCESSES = int(os.environ.get("BCRYPT_PROCESSES", min(4, os.cpu_count() or 1)))
+
+    USER_CACHE_MAXSIZE = int(os.environ.get("USER_CACHE_MAXSIZE", 1024))
+    USER_CACHE_TTL_SECONDS = int(os.environ.get("USER_CACHE_TTL_SECONDS", 60))
+
+    MARKS_UPLOAD_CHUNK_SIZE = int(os.environ.get("MARKS_UPLOAD_CHUNK_SIZE", 1000))
+
+    # The cache of (mark) statistics, which is kept in memory unless the URL of a Redis (compatible) server is given.
+    STATISTICS_CACHE_URL = os.environ.get("STATISTICS_CACHE_URL")
+    STATISTICS_CACHE_MAXSIZE = int(os.environ.get("STATISTICS_CACHE_MAXSIZE", 1024))
+    STATISTICS_CACHE_TTL_SECONDS = int(os.environ.get("STATISTICS_CACHE_TTL_SECONDS", 300))
+
+    # The connection pool of each engine, which holds up to `DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW` connections.
+    DATABASE_POOL_SIZE = int(os.environ.get("DATABASE_POOL_SIZE", 5))
+    DATABASE_MAX_OVERFLOW = int(os.environ.get("DATABASE_MAX_OVERFLOW", 10))
+    DATABASE_POOL_TIMEOUT_SECONDS = int(os.environ.get("DATABASE_POOL_TIMEOUT_SECONDS", 30))
+    DATABASE_POOL_RECYCLE_SECONDS = int(os.environ.get("DATABASE_POOL_RECYCLE_SECONDS", 1800))
+    DATABASE_POOL_PRE_PING = os.environ.get("DATABASE_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+    # Only applied to PostgreSQL, a statement timeout of 0 disables it.
+    DATABASE_STATEMENT_TIMEOUT_MS = int(os.environ.get("DATABASE_STATEMENT_TIMEOUT_MS", 30000))
+    DATABASE_APPLICATION_NAME = os.environ.get("DATABASE_APPLICATION_NAME", "mark-management-system")
+
+    # Whether the hot read endpoints (marks, classes & statistics) use an `AsyncEngine` (asyncpg, or aiosqlite for SQLite),
+    # rather than holding a thread of the thread pool for as long as their queries run. Other endpoints are unaffected.
+    # The statistics cache is still synchronous, so a Redis cache (`STATISTICS_CACHE_URL`) is called on the event loop.
+    DATABASE_ASYNC = os.environ.get("MMS_DATABASE_ASYNC", "false").lower() in ("1", "true", "yes")
+
+    # The maximum number of sync handlers (and therefore sessions) which run at once, which is 40 by default in Starlette.
+    THREADPOOL_SIZE = int(os.environ.get("THREADPOOL_SIZE", 40))
+
 class ProductionConfig(Config):
     pass
 
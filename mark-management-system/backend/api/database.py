@@ -1,19 +1,139 @@
+from typing import Any, AsyncIterator, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine import make_url
 
 from sqlalchemy.orm import sessionmaker
 
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from api.config import Config
 from api.config import DevelopmentConfig
 from api.config import TestingConfig
 
+from api.utils.pool_metrics import InstrumentedQueuePool
+from api.utils.pool_metrics import InstrumentedAsyncAdaptedQueuePool
+
+from api.utils.upsert import DIALECT_INSERTS
+
 # Some of the code in this file can be found at: https://fastapi.tiangolo.com/tutorial/sql-databases/
 
+
+# The driver of the `AsyncEngine` of each database, regardless of the (sync) driver in the URL, i.e. `postgresql+psycopg2://`.
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def pool_options(url: URL) -> Dict[str, Any]:
+    """
+    Builds the connection pool options of an engine from the configuration.
+
+    Args:
+        url: The URL of the database.
+
+    Returns:
+        Dict[str, Any]: The keyword arguments of the pool, which are empty for an in-memory SQLite database (as it only has one connection).
+    """
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+
+    return {
+        "pool_size": Config.DATABASE_POOL_SIZE,
+        "max_overflow": Config.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": Config.DATABASE_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": Config.DATABASE_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": Config.DATABASE_POOL_PRE_PING,
+    }
+
+def create_database_engine(database_url: str) -> Engine:
+    """
+    Creates the (sync) engine, with a pool whose checkouts are recorded in `pool_metrics`.
+
+    Args:
+        database_url: The URL of the database.
+
+    Raises:
+        ValueError: If the database is neither PostgreSQL nor SQLite, as the repositories rely on `INSERT ... ON CONFLICT`.
+
+    Returns:
+        Engine: The engine.
+    """
+    url = make_url(database_url)
+
+    if url.get_backend_name() not in DIALECT_INSERTS:
+        raise ValueError(f"Unsupported database: {url.get_backend_name()}, the database must be PostgreSQL or SQLite")
+
+    options = pool_options(url)
+
+    if options:
+        options["poolclass"] = InstrumentedQueuePool
+
+    if url.get_backend_name() == "postgresql":
+        connect_args = {"application_name": Config.DATABASE_APPLICATION_NAME}
+
+        if Config.DATABASE_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["options"] = f"-c statement_timeout={Config.DATABASE_STATEMENT_TIMEOUT_MS}"
+
+        options["connect_args"] = connect_args
+
+    return create_engine(url, **options)
+
+def create_async_database_engine(database_url: str) -> AsyncEngine:
+    """
+    Creates the async engine of the same database as `create_database_engine`, with the same pool options.
+
+    Args:
+        database_url: The URL of the database.
+
+    Raises:
+        ValueError: If the database is neither PostgreSQL nor SQLite.
+
+    Returns:
+        AsyncEngine: The async engine.
+    """
+    url = make_url(database_url)
+
+    if url.get_backend_name() not in ASYNC_DRIVERS:
+        raise ValueError(f"Unsupported database: {url.get_backend_name()}, the database must be PostgreSQL or SQLite")
+
+    url = url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()])
+    options = pool_options(url)
+
+    if options:
+        options["poolclass"] = InstrumentedAsyncAdaptedQueuePool
+
+    if url.get_backend_name() == "postgresql":
+        server_settings = {"application_name": Config.DATABASE_APPLICATION_NAME}
+
+        if Config.DATABASE_STATEMENT_TIMEOUT_MS > 0:
+            server_settings["statement_timeout"] = str(Config.DATABASE_STATEMENT_TIMEOUT_MS)
+
+        options["connect_args"] = {"server_settings": server_settings}
+
+    return create_async_engine(url, **options)
+
+
 database_url = DevelopmentConfig.DATABASE_URL or TestingConfig.DATABASE_URL
 
 if database_url:
-    engine = create_engine(database_url)
+    engine = create_database_engine(database_url)
     
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = None
+AsyncSessionLocal = None
+
+if database_url and Config.DATABASE_ASYNC:
+    async_engine = create_async_database_engine(database_url)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 def get_db():
     """A generator that provides a session database pool."""
@@ -22,3 +142,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """An async generator that provides an `AsyncSession`, which requires `MMS_DATABASE_ASYNC` to be enabled."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("The async engine is disabled, set MMS_DATABASE_ASYNC to enable it")
+
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,4 +1,5 @@
-from fastapi import Depends, APIRouter, HTTPException
+from fastapi import Depends, APIRouter, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 
 from typing import Tuple, List
 
@@ -13,14 +14,23 @@ from api.marks.use_cases.delete_mark_use_case import DeleteMarkUseCase
 from api.marks.use_cases.get_marks_for_student_use_case import GetMarksForStudentUseCase
 from api.marks.use_cases.get_marks_for_class_use_case import GetMarksForClassUseCase
 from api.marks.use_cases.get_global_student_statistics_use_case import GetGlobalStudentStatisticsUseCase
+from api.marks.use_cases.create_marks_bulk_use_case import CreateMarksBulkUseCase
+from api.marks.use_cases.upload_marks_file_use_case import UploadMarksFileUseCase
+from api.marks.use_cases.export_marks_use_case import ExportMarksUseCase
+from api.marks.use_cases.resolve_marks_use_case import ResolveMarksUseCase
+from api.marks.use_cases.convert_myplace_file_use_case import ConvertMyPlaceFileUseCase
+from api.marks.use_cases.import_myplace_file_use_case import ImportMyPlaceFileUseCase
 
 from api.marks.errors.mark_already_exists import MarkAlreadyExists
 from api.marks.errors.mark_not_found import MarkNotFound
+from api.marks.errors.invalid_marks_file import InvalidMarksFile
 
 from api.users.errors.user_not_found import UserNotFound
 
 from api.students.errors.student_not_found import StudentNotFound
 
+from api.classes.errors.class_not_found import ClassNotFound
+
 from api.marks.dependencies import create_mark_use_case
 from api.marks.dependencies import get_mark_use_case
 from api.marks.dependencies import get_student_marks_use_case
@@ -30,8 +40,20 @@ from api.marks.dependencies import delete_mark_use_case
 from api.marks.dependencies import get_marks_for_student_use_case
 from api.marks.dependencies import get_marks_for_class_use_case
 from api.marks.dependencies import get_global_student_statistics_use_case
+from api.marks.dependencies import create_marks_bulk_use_case
+from api.marks.dependencies import upload_marks_file_use_case
+from api.marks.dependencies import export_marks_use_case
+from api.marks.dependencies import resolve_marks_use_case
+from api.marks.dependencies import convert_myplace_file_use_case
+from api.marks.dependencies import import_myplace_file_use_case
 
 from api.middleware.dependencies import get_current_user
+from api.middleware.dependencies import ConditionalGet
+from api.middleware.dependencies import get_session_runner
+
+from api.utils.session_runner import SessionRunner
+
+from api.marks.serializers import marks_rows_response
 
 
 marks = APIRouter()
@@ -84,6 +106,366 @@ def create_mark(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@marks.post("/api/v1/marks/bulk", response_model=schemas.MarksBulkResult)
+def create_marks_bulk(
+    request: schemas.MarksBulkCreate,
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    create_marks_bulk_use_case: CreateMarksBulkUseCase = Depends(create_marks_bulk_use_case),
+):
+    """
+    Creates many marks in the system at once, i.e. every row of an uploaded mark sheet, within a single request.    
+
+    Rows which cannot be created (e.g. the class or student does not exist, or the mark has already been uploaded) do not fail the request, 
+    instead they are reported back in the `results` with a `status` and a `detail`. If `overwrite` is set, marks which have already been uploaded are replaced instead, with a `status` of `updated`.
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `request`: A `schemas.MarksBulkCreate` object is required which contains a list of rows, each with a class code, registration number, mark and/or code, and whether to overwrite existing marks.  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `create_marks_bulk_use_case`: The class which handles the business logic for bulk mark creation.   
+
+    Raises:  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If the requestor is neither a lecturer nor an administrator.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `response_model`: The response is in the model of the `schemas.MarksBulkResult` schema, which contains the number of created, updated & failed rows and a result per row.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        return create_marks_bulk_use_case.execute(
+            request, current_user
+        )
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@marks.post("/api/v1/marks/resolve", response_model=List[schemas.MarksResolveResult])
+def resolve_marks(
+    request: schemas.MarksResolve,
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    resolve_marks_use_case: ResolveMarksUseCase = Depends(resolve_marks_use_case),
+):
+    """
+    Resolves the rows of a mark sheet, i.e. a list of class codes & registration numbers, to the identifiers of the classes, students and any existing marks in a single request.    
+
+    Rows which cannot be resolved (e.g. the class or student does not exist, or the mark has not been uploaded yet) have their identifiers set to `null`. 
+    Existing marks are only resolved for the classes of the requestor, unless they are an administrator.
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `request`: A `schemas.MarksResolve` object is required which contains a list of rows, each with a class code & registration number.  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `resolve_marks_use_case`: The class which handles the business logic for resolving the rows.   
+
+    Raises:  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If the requestor is neither a lecturer nor an administrator.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `response_model`: The response is in the model of a list of `schemas.MarksResolveResult`, one per row and in the same order, which contains the class, student & mark identifiers.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        return resolve_marks_use_case.execute(
+            request, current_user
+        )
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@marks.post("/api/v1/marks/upload")
+def upload_marks_file(
+    file: UploadFile,
+    overwrite: bool = False,
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    upload_marks_file_use_case: UploadMarksFileUseCase = Depends(upload_marks_file_use_case),
+):
+    """
+    Uploads a mark file (CSV) to the system, the file is parsed & inserted in chunks as it is read, rather than all at once.    
+
+    The response is streamed as NDJSON (one JSON object per line), where each line has a `type` of either:  
+        - `error`: A row which could not be created, with the `row` number in the file, a `status` and a `detail`.  
+        - `progress`: The number of `processed`, `created`, `updated` & `failed` rows so far, sent after every chunk.  
+        - `summary`: The final number of `processed`, `created`, `updated` & `failed` rows, sent once the whole file has been read.  
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `file`: The mark file, containing the CLASS_CODE, REG_NO, MARK & (optionally) MARK_CODE columns. Any other column, i.e. STUDENT_NAME, is ignored.  
+        - `overwrite` (default: False): Whether marks which already exist are replaced, i.e. when re-uploading a corrected file, rather than reported as errors.  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `upload_marks_file_use_case`: The class which handles the business logic for mark file ingestion.   
+
+    Raises:  
+        - `HTTPException`, 400: If the file is missing a header, or any of the required columns.  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If the requestor is neither a lecturer nor an administrator.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `StreamingResponse`: An `application/x-ndjson` stream of error, progress & summary lines.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        lines = upload_marks_file_use_case.execute(
+            file.file, current_user, overwrite
+        )
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidMarksFile as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+@marks.post("/api/v1/marks/myplace/convert")
+def convert_myplace_file(
+    file: UploadFile,
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    convert_myplace_file_use_case: ConvertMyPlaceFileUseCase = Depends(convert_myplace_file_use_case),
+):
+    """
+    Converts a MyPlace export (CSV) to a mark upload file, the file is converted & streamed back as it is read, rather than all at once.    
+
+    The mark of each row is the `OVERRIDE_MARK` if one is given, and the `CLASS_TOTAL` if not. The name & degree of each student are looked up in batches, 
+    and rows of students which cannot be found are left out, as they could not be uploaded.
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `file`: The MyPlace export, containing the CLASS_CODE, REG_NO, CLASS_TOTAL & (optionally) OVERRIDE_MARK columns. Any other column, i.e. DATE, is ignored.  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `convert_myplace_file_use_case`: The class which handles the business logic for MyPlace export conversion.   
+
+    Raises:  
+        - `HTTPException`, 400: If the file is missing a header, or any of the required columns.  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If the requestor is neither a lecturer nor an administrator.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `StreamingResponse`: A `text/csv` stream of the mark upload file, with the class_code, reg_no, mark, student_name, degree_level & degree_name columns.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        lines = convert_myplace_file_use_case.execute(
+            file.file, current_user
+        )
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidMarksFile as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        lines,
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="converted_to_mms_format.csv"'},
+    )
+
+@marks.post("/api/v1/marks/myplace/import")
+def import_myplace_file(
+    file: UploadFile,
+    overwrite: bool = False,
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    import_myplace_file_use_case: ImportMyPlaceFileUseCase = Depends(import_myplace_file_use_case),
+):
+    """
+    Uploads a MyPlace export (CSV) to the system as marks, the file is converted & inserted in chunks as it is read, without converting it to a mark upload file first.    
+
+    The mark of each row is the `OVERRIDE_MARK` if one is given, and the `CLASS_TOTAL` if not. The response is streamed exactly as the response of `/api/v1/marks/upload` is, 
+    i.e. as NDJSON `error`, `progress` & `summary` lines.
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `file`: The MyPlace export, containing the CLASS_CODE, REG_NO, CLASS_TOTAL & (optionally) OVERRIDE_MARK columns. Any other column, i.e. DATE, is ignored.  
+        - `overwrite` (default: False): Whether marks which already exist are replaced, rather than reported as errors.  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `import_myplace_file_use_case`: The class which handles the business logic for MyPlace export ingestion.   
+
+    Raises:  
+        - `HTTPException`, 400: If the file is missing a header, or any of the required columns.  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If the requestor is neither a lecturer nor an administrator.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `StreamingResponse`: An `application/x-ndjson` stream of error, progress & summary lines.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        lines = import_myplace_file_use_case.execute(
+            file.file, current_user, overwrite
+        )
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidMarksFile as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+@marks.get("/api/v1/marks/export")
+def export_marks(
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    export_marks_use_case: ExportMarksUseCase = Depends(export_marks_use_case),
+):
+    """
+    Exports a mark sheet (CSV) of every class the requestor can access, i.e. every class for an administrator, or the classes taught by a lecturer.    
+
+    The mark sheet is streamed from the database as it is written, rather than built in memory. The first four columns are those of the mark upload file.  
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `export_marks_use_case`: The class which handles the business logic for exporting mark sheets.   
+
+    Raises:  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If the requestor is neither a lecturer nor an administrator.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `StreamingResponse`: A `text/csv` stream of the mark sheet.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        chunks = export_marks_use_case.execute(current_user)
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="marks.csv"'},
+    )
+
+@marks.get("/api/v1/marks/class/{class_code}/export")
+def export_marks_for_class(
+    class_code: str,
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    export_marks_use_case: ExportMarksUseCase = Depends(export_marks_use_case),
+):
+    """
+    Exports the mark sheet (CSV) of a class, for an administrator or the lecturer of the class.    
+
+    The mark sheet is streamed from the database as it is written, rather than built in memory. The first four columns are those of the mark upload file.  
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `class_code`: The unique identifier of the class.  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `export_marks_use_case`: The class which handles the business logic for exporting mark sheets.   
+
+    Raises:  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If the requestor is neither a lecturer nor an administrator, or if the lecturer does not teach the class.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found, or if the class is not found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `StreamingResponse`: A `text/csv` stream of the mark sheet.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        chunks = export_marks_use_case.execute(current_user, class_code)
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ClassNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{class_code}_marks.csv"'},
+    )
+
 @marks.get("/api/v1/marks/{student_id}/{class_id}", response_model=schemas.Marks)
 def get_mark(
     student_id: int,
@@ -131,8 +513,9 @@ def get_mark(
         raise HTTPException(status_code=500, detail=str(e))
 
 @marks.get("/api/v1/marks", response_model=List[schemas.MarksRow])
-def get_student_marks(
+async def get_student_marks(
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_student_marks_use_case: GetStudentMarksUseCase = Depends(get_student_marks_use_case),
 ):
     """
@@ -144,6 +527,7 @@ def get_student_marks(
     Args:  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.  
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_student_marks_use_case`: The class which handles the business logic for mark retrieval per lecturer.   
 
     Raises:  
@@ -162,7 +546,7 @@ def get_student_marks(
         )    
 
     try:
-        return get_student_marks_use_case.execute(current_user)
+        return marks_rows_response(await session_runner.run(get_student_marks_use_case.execute, current_user))
     except MarkNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotFound as e:
@@ -262,9 +646,10 @@ def delete_mark(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-@marks.get("/api/v1/marks/statistics", response_model=schemas.MarksStatistics)
-def get_student_statistics(
+@marks.get("/api/v1/marks/statistics", response_model=schemas.MarksStatistics, dependencies=[Depends(ConditionalGet("marks", "classes"))])
+async def get_student_statistics(
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_student_statistics_use_case: GetStudentStatisticsUseCase = Depends(get_student_statistics_use_case),
 ):
     """
@@ -277,9 +662,11 @@ def get_student_statistics(
     Args:  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.  
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_student_statistics_use_case`: The class which handles the business logic for retrieving & calculating student marks.   
 
     Raises:  
+        - `HTTPException`, 304: If the `If-None-Match` header matches the `ETag` of the response, i.e. nothing has changed since.  
         - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
         - `HTTPException`, 404: If the user from the JWT cannot be found, or if no marks are found for the lecturer.  
         - `HTTPException`, 500: If any other system exception occurs.  
@@ -294,7 +681,7 @@ def get_student_statistics(
         )
 
     try:
-        return get_student_statistics_use_case.execute(current_user)
+        return await session_runner.run(get_student_statistics_use_case.execute, current_user)
     except MarkNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotFound as e:
@@ -302,9 +689,10 @@ def get_student_statistics(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-@marks.get("/api/v1/marks/global/statistics/all", response_model=schemas.MarksStatistics)
-def get_global_student_statistics(
+@marks.get("/api/v1/marks/global/statistics/all", response_model=schemas.MarksStatistics, dependencies=[Depends(ConditionalGet("marks"))])
+async def get_global_student_statistics(
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_global_student_statistics_use_case: GetGlobalStudentStatisticsUseCase = Depends(get_global_student_statistics_use_case),
 ):
     """
@@ -316,9 +704,11 @@ def get_global_student_statistics(
     Args:  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.  
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_global_student_statistics_use_case`: The class which handles the business logic for retrieving & calculating student marks.   
 
     Raises:  
+        - `HTTPException`, 304: If the `If-None-Match` header matches the `ETag` of the response, i.e. nothing has changed since.  
         - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
         - `HTTPException`, 403: If there has been a permission error.  
         - `HTTPException`, 404: If the user from the JWT cannot be found, or if no marks are found for the lecturer.  
@@ -334,7 +724,7 @@ def get_global_student_statistics(
         )
 
     try:
-        return get_global_student_statistics_use_case.execute(current_user)
+        return await session_runner.run(get_global_student_statistics_use_case.execute, current_user)
     except MarkNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotFound as e:
@@ -345,9 +735,10 @@ def get_global_student_statistics(
         raise HTTPException(status_code=500, detail=str(e))
 
 @marks.get("/api/v1/marks/{reg_no}", response_model=List[schemas.MarksRow])
-def get_marks_for_student(
+async def get_marks_for_student(
     reg_no: str,
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_marks_for_student_use_case: GetMarksForStudentUseCase = Depends(get_marks_for_student_use_case),
 ):
     """
@@ -360,6 +751,7 @@ def get_marks_for_student(
         - `reg_no`: The unique identifier of the student. 
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_marks_for_student_use_case`: The class which handles the business logic for mark retrieval for the student.   
 
     Raises:  
@@ -377,7 +769,7 @@ def get_marks_for_student(
         )    
 
     try:
-        return get_marks_for_student_use_case.execute(reg_no, current_user)
+        return marks_rows_response(await session_runner.run(get_marks_for_student_use_case.execute, reg_no, current_user))
     except MarkNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotFound as e:
@@ -388,9 +780,10 @@ def get_marks_for_student(
         raise HTTPException(status_code=500, detail=str(e))
 
 @marks.get("/api/v1/marks/class/{class_code}/all", response_model=List[schemas.MarksRow])
-def get_marks_for_class(
+async def get_marks_for_class(
     class_code: str,
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    session_runner: SessionRunner = Depends(get_session_runner),
     get_marks_for_class_use_case: GetMarksForClassUseCase = Depends(get_marks_for_class_use_case),
 ):
     """
@@ -403,6 +796,7 @@ def get_marks_for_class(
         - `class_code`: The unique identifier of the class.
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `session_runner`: Runs the use case, either in the thread pool or on the async engine (see `MMS_DATABASE_ASYNC`).  
         - `get_marks_for_class_use_case`: The class which handles the business logic for mark retrieval.   
 
     Raises:  
@@ -421,7 +815,7 @@ def get_marks_for_class(
         )    
 
     try:
-        return get_marks_for_class_use_case.execute(class_code, current_user)
+        return marks_rows_response(await session_runner.run(get_marks_for_class_use_case.execute, class_code, current_user))
     except MarkNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotFound as e:
@@ -4,6 +4,7 @@ from api.middleware.dependencies import MarkRepository
 from api.middleware.dependencies import UserRepository
 from api.middleware.dependencies import ClassRepository
 from api.middleware.dependencies import StudentRepository
+from api.middleware.dependencies import ScopedCache
 
 from api.marks.use_cases.create_mark_use_case import CreateMarkUseCase
 from api.marks.use_cases.get_mark_use_case import GetMarkUseCase
@@ -14,22 +15,38 @@ from api.marks.use_cases.delete_mark_use_case import DeleteMarkUseCase
 from api.marks.use_cases.get_marks_for_student_use_case import GetMarksForStudentUseCase
 from api.marks.use_cases.get_marks_for_class_use_case import GetMarksForClassUseCase
 from api.marks.use_cases.get_global_student_statistics_use_case import GetGlobalStudentStatisticsUseCase
+from api.marks.use_cases.create_marks_bulk_use_case import CreateMarksBulkUseCase
+from api.marks.use_cases.upload_marks_file_use_case import UploadMarksFileUseCase
+from api.marks.use_cases.export_marks_use_case import ExportMarksUseCase
+from api.marks.use_cases.resolve_marks_use_case import ResolveMarksUseCase
+from api.marks.use_cases.convert_myplace_file_use_case import ConvertMyPlaceFileUseCase
+from api.marks.use_cases.import_myplace_file_use_case import ImportMyPlaceFileUseCase
+
+from api.marks.validators import MarkValidator
+
+from api.config import Config
 
 from api.middleware.dependencies import get_mark_repository
 from api.middleware.dependencies import get_user_repository
 from api.middleware.dependencies import get_class_repository
 from api.middleware.dependencies import get_student_repository
+from api.middleware.dependencies import get_statistics_cache
+from api.middleware.dependencies import get_read_mark_repository
+from api.middleware.dependencies import get_read_user_repository
+from api.middleware.dependencies import get_read_student_repository
 
 
 def create_mark_use_case(
         mark_repository: MarkRepository = Depends(get_mark_repository),
         user_repository: UserRepository = Depends(get_user_repository),
         class_repository: ClassRepository = Depends(get_class_repository),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
     ) -> CreateMarkUseCase:
     return CreateMarkUseCase(
         mark_repository, 
         user_repository,
-        class_repository
+        class_repository,
+        statistics_cache,
     )
 
 def get_mark_use_case(
@@ -44,8 +61,8 @@ def get_mark_use_case(
     )
 
 def get_student_marks_use_case(
-        mark_repository: MarkRepository = Depends(get_mark_repository),
-        user_repository: UserRepository = Depends(get_user_repository)
+        mark_repository: MarkRepository = Depends(get_read_mark_repository),
+        user_repository: UserRepository = Depends(get_read_user_repository)
     ) -> GetStudentMarksUseCase:
     return GetStudentMarksUseCase(
         mark_repository,
@@ -53,40 +70,46 @@ def get_student_marks_use_case(
     )
 
 def get_student_statistics_use_case(
-        mark_repository: MarkRepository = Depends(get_mark_repository),
-        user_repository: UserRepository = Depends(get_user_repository)
+        mark_repository: MarkRepository = Depends(get_read_mark_repository),
+        user_repository: UserRepository = Depends(get_read_user_repository),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
     ) -> GetStudentStatisticsUseCase:
     return GetStudentStatisticsUseCase(
         mark_repository,
-        user_repository
+        user_repository,
+        statistics_cache,
     )
 
 def edit_mark_use_case(
         mark_repository: MarkRepository = Depends(get_mark_repository),
         user_repository: UserRepository = Depends(get_user_repository),
         class_repository: ClassRepository = Depends(get_class_repository),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
     ) -> EditMarkUseCase:
     return EditMarkUseCase(
         mark_repository,
         user_repository,
-        class_repository
+        class_repository,
+        statistics_cache,
     )
 
 def delete_mark_use_case(
         mark_repository: MarkRepository = Depends(get_mark_repository),
         user_repository: UserRepository = Depends(get_user_repository),
         class_repository: ClassRepository = Depends(get_class_repository),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
     ) -> DeleteMarkUseCase:
     return DeleteMarkUseCase(
         mark_repository,
         user_repository,
-        class_repository
+        class_repository,
+        statistics_cache,
     )
 
 def get_marks_for_student_use_case(
-        mark_repository: MarkRepository = Depends(get_mark_repository),
-        student_repository: StudentRepository = Depends(get_student_repository),
-        user_repository: UserRepository = Depends(get_user_repository),
+        mark_repository: MarkRepository = Depends(get_read_mark_repository),
+        student_repository: StudentRepository = Depends(get_read_student_repository),
+        user_repository: UserRepository = Depends(get_read_user_repository),
     ) -> GetMarksForStudentUseCase:
     return GetMarksForStudentUseCase(
         mark_repository,
@@ -95,8 +118,8 @@ def get_marks_for_student_use_case(
     )
 
 def get_marks_for_class_use_case(
-        mark_repository: MarkRepository = Depends(get_mark_repository),
-        user_repository: UserRepository = Depends(get_user_repository),
+        mark_repository: MarkRepository = Depends(get_read_mark_repository),
+        user_repository: UserRepository = Depends(get_read_user_repository),
     ) -> GetMarksForClassUseCase:
     return GetMarksForClassUseCase(
         mark_repository,
@@ -104,10 +127,105 @@ def get_marks_for_class_use_case(
     )
 
 def get_global_student_statistics_use_case(
-        mark_repository: MarkRepository = Depends(get_mark_repository),
-        user_repository: UserRepository = Depends(get_user_repository),
+        mark_repository: MarkRepository = Depends(get_read_mark_repository),
+        user_repository: UserRepository = Depends(get_read_user_repository),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
     ) -> GetGlobalStudentStatisticsUseCase:
     return GetGlobalStudentStatisticsUseCase(
         mark_repository,
         user_repository,
+        statistics_cache,
+    )
+
+def get_mark_validator() -> MarkValidator:
+    return MarkValidator()
+
+def create_marks_bulk_use_case(
+        mark_repository: MarkRepository = Depends(get_mark_repository),
+        user_repository: UserRepository = Depends(get_user_repository),
+        class_repository: ClassRepository = Depends(get_class_repository),
+        student_repository: StudentRepository = Depends(get_student_repository),
+        mark_validator: MarkValidator = Depends(get_mark_validator),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
+    ) -> CreateMarksBulkUseCase:
+    return CreateMarksBulkUseCase(
+        mark_repository,
+        user_repository,
+        class_repository,
+        student_repository,
+        mark_validator,
+        statistics_cache,
+    )
+
+def upload_marks_file_use_case(
+        mark_repository: MarkRepository = Depends(get_mark_repository),
+        user_repository: UserRepository = Depends(get_user_repository),
+        class_repository: ClassRepository = Depends(get_class_repository),
+        student_repository: StudentRepository = Depends(get_student_repository),
+        mark_validator: MarkValidator = Depends(get_mark_validator),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
+        config: Config = Depends(Config),
+    ) -> UploadMarksFileUseCase:
+    return UploadMarksFileUseCase(
+        mark_repository,
+        user_repository,
+        class_repository,
+        student_repository,
+        mark_validator,
+        statistics_cache,
+        config,
+    )
+
+def export_marks_use_case(
+        mark_repository: MarkRepository = Depends(get_mark_repository),
+        user_repository: UserRepository = Depends(get_user_repository),
+        class_repository: ClassRepository = Depends(get_class_repository),
+    ) -> ExportMarksUseCase:
+    return ExportMarksUseCase(
+        mark_repository,
+        user_repository,
+        class_repository,
+    )
+
+def resolve_marks_use_case(
+        mark_repository: MarkRepository = Depends(get_mark_repository),
+        user_repository: UserRepository = Depends(get_user_repository),
+        class_repository: ClassRepository = Depends(get_class_repository),
+        student_repository: StudentRepository = Depends(get_student_repository),
+    ) -> ResolveMarksUseCase:
+    return ResolveMarksUseCase(
+        mark_repository,
+        user_repository,
+        class_repository,
+        student_repository,
+    )
+
+def convert_myplace_file_use_case(
+        user_repository: UserRepository = Depends(get_user_repository),
+        student_repository: StudentRepository = Depends(get_student_repository),
+        config: Config = Depends(Config),
+    ) -> ConvertMyPlaceFileUseCase:
+    return ConvertMyPlaceFileUseCase(
+        user_repository,
+        student_repository,
+        config,
+    )
+
+def import_myplace_file_use_case(
+        mark_repository: MarkRepository = Depends(get_mark_repository),
+        user_repository: UserRepository = Depends(get_user_repository),
+        class_repository: ClassRepository = Depends(get_class_repository),
+        student_repository: StudentRepository = Depends(get_student_repository),
+        mark_validator: MarkValidator = Depends(get_mark_validator),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
+        config: Config = Depends(Config),
+    ) -> ImportMyPlaceFileUseCase:
+    return ImportMyPlaceFileUseCase(
+        mark_repository,
+        user_repository,
+        class_repository,
+        student_repository,
+        mark_validator,
+        statistics_cache,
+        config,
     )
@@ -0,0 +1,9 @@
+class InvalidMarksFile(Exception):
+    """
+    A custom subclass exception, raised when an uploaded mark file cannot be parsed, i.e. it is missing a required column.
+
+    Args:
+        message: A parameter which allows for a custom error message.
+    """
+    def __init__(self, message: str) -> None:
+        self.message = message
@@ -0,0 +1,139 @@
+import io
+import csv
+
+from typing import BinaryIO, Dict, Final, Iterable, Iterator, List, Tuple
+
+from api.students.repositories.student_repository import StudentRepository
+
+from api.marks.errors.invalid_marks_file import InvalidMarksFile
+
+
+# The columns of a MyPlace export which are required to convert it, `OVERRIDE_MARK` is optional.
+MYPLACE_REQUIRED_COLUMNS: Final[Tuple[str, ...]] = ("CLASS_CODE", "REG_NO", "CLASS_TOTAL")
+
+# The columns of the converted file, in the format of the mark upload file.
+MMS_COLUMNS: Final[Tuple[str, ...]] = ("class_code", "reg_no", "mark", "student_name", "degree_level", "degree_name")
+
+
+def open_myplace_file(file: BinaryIO) -> Tuple[csv.DictReader, io.TextIOWrapper]:
+    """
+    Opens a MyPlace export for reading, and checks that it has every required column.
+
+    Args:
+        file: The MyPlace export (CSV).
+
+    Raises:
+        InvalidMarksFile: If the file is missing a header, or any of the required columns.
+
+    Returns:
+        Tuple[csv.DictReader, io.TextIOWrapper]: The reader of the file, and the text wrapper around it, which must be detached once the file has been read.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+
+    try:
+        columns = {column.strip().upper() for column in reader.fieldnames or []}
+    except UnicodeDecodeError:
+        columns = set()
+
+    missing_columns = [column for column in MYPLACE_REQUIRED_COLUMNS if column not in columns]
+
+    if missing_columns:
+        text.detach()
+        raise InvalidMarksFile(f"The file is missing the following columns: {', '.join(missing_columns)}")
+
+    return reader, text
+
+def read_myplace_rows(reader: csv.DictReader) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    Reads a MyPlace export row by row, converting each row to a row of the mark upload file, where the mark is the
+    override mark if one is given, and the class total if not. Empty rows are skipped.
+
+    Args:
+        reader: The reader of the MyPlace export, see `open_myplace_file`.
+
+    Returns:
+        Iterator[Tuple[int, Dict[str, str]]]: An iterator of the row number in the export & the row, keyed by the (upper case) columns of the mark upload file.
+    """
+    # The header is the first row of the file, so the data starts on the second row, which matches spreadsheet numbering.
+    for row_number, row in enumerate(reader, start=2):
+        row = {(key or "").strip().upper(): (value or "").strip() for key, value in row.items()}
+
+        if not any(row.values()):
+            continue
+
+        yield row_number, {
+            "CLASS_CODE": row.get("CLASS_CODE", ""),
+            "REG_NO": row.get("REG_NO", ""),
+            "MARK": row.get("OVERRIDE_MARK") or row.get("CLASS_TOTAL", ""),
+        }
+
+def join_student_details(numbered_rows: Iterable[Tuple[int, Dict[str, str]]], student_repository: StudentRepository, chunk_size: int) -> Iterator[Dict[str, str]]:
+    """
+    Adds the name & degree of the student to each converted row, looking up `chunk_size` rows at a time. Rows of
+    students which cannot be found are skipped, as they cannot be uploaded.
+
+    Args:
+        numbered_rows: The converted rows, see `read_myplace_rows`.
+        student_repository: The repository used to look up the students.
+        chunk_size: The number of rows whose students are looked up in a single query.
+
+    Returns:
+        Iterator[Dict[str, str]]: An iterator of rows, keyed by `MMS_COLUMNS`.
+    """
+    chunk: List[Dict[str, str]] = []
+
+    for _, row in numbered_rows:
+        chunk.append(row)
+
+        if len(chunk) >= chunk_size:
+            yield from _join_chunk(chunk, student_repository)
+            chunk = []
+
+    if chunk:
+        yield from _join_chunk(chunk, student_repository)
+
+def to_csv_lines(rows: Iterable[Dict[str, str]]) -> Iterator[str]:
+    """
+    Writes rows as CSV, one line at a time, starting with the header.
+
+    Args:
+        rows: The rows, keyed by `MMS_COLUMNS`.
+
+    Returns:
+        Iterator[str]: An iterator of CSV lines.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=MMS_COLUMNS, lineterminator="\n")
+
+    writer.writeheader()
+
+    for row in rows:
+        writer.writerow(row)
+
+        yield buffer.getvalue()
+
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Only the header is left if there are no rows.
+    if buffer.getvalue():
+        yield buffer.getvalue()
+
+def _join_chunk(chunk: List[Dict[str, str]], student_repository: StudentRepository) -> Iterator[Dict[str, str]]:
+    students = {student.reg_no: student for student in student_repository.find_details_by_reg_nos(row["REG_NO"] for row in chunk)}
+
+    for row in chunk:
+        student = students.get(row["REG_NO"])
+
+        if student is None:
+            continue
+
+        yield {
+            "class_code": row["CLASS_CODE"],
+            "reg_no": row["REG_NO"],
+            "mark": row["MARK"],
+            "student_name": student.student_name,
+            "degree_level": student.degree_level,
+            "degree_name": student.degree_name,
+        }
@@ -1,15 +1,44 @@
-from typing import List, Optional
+from typing import List, Optional, Iterable, Iterator, Dict, Set, Tuple, Any, Final
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy import Boolean
+from sqlalchemy import literal_column
+
+from sqlalchemy.engine import Row
+
+from sqlalchemy.orm import Session, Query
 
 from api.system.models.models import Marks, Class, Student, Degree
 
 from api.system.schemas.schemas import MarksRow
 from api.system.schemas.schemas import MarksEdit
+from api.system.schemas.schemas import MarksStatistics
+
+from api.classes.repositories.class_statistics_repository import ClassStatisticsRepository
+from api.system.repositories.data_version_repository import DataVersionRepository
+
+from api.marks.statistics import MARK_BUCKETS
+from api.marks.statistics import summarise_histogram
+from api.marks.statistics import empty_statistics
+
+from api.utils.upsert import dialect_insert
+
+
+# What `MarkRepository.upsert_all` does with a mark for a student & class which already has one.
+ON_CONFLICT_SKIP: Final[str] = "skip"
+ON_CONFLICT_OVERWRITE: Final[str] = "overwrite"
+ON_CONFLICT_REPORT: Final[str] = "report"
+
+# The maximum number of marks per `INSERT` statement, which keeps each statement within the bind parameter limit of SQLite.
+UPSERT_BATCH_SIZE: Final[int] = 5000
 
 
 class MarkRepository:
-    """The repository layer which performs queries and operations on the database for `Marks` objects."""
+    """
+    The repository layer which performs queries and operations on the database for `Marks` objects.
+
+    Every write also updates the `ClassStatistics` of the class, within the same transaction.
+    """
 
     def __init__(self, db: Session):
         """
@@ -19,6 +48,8 @@ class MarkRepository:
             db: The database session.
         """
         self.db = db
+        self.class_statistics_repository = ClassStatisticsRepository(db)
+        self.data_version_repository = DataVersionRepository(db)
     
     def add(self, marks: Marks) -> None:
         """
@@ -28,9 +59,106 @@ class MarkRepository:
             marks: The object to be added.
         """
         self.db.add(marks)
+        self.db.flush()
+
+        self.class_statistics_repository.record(marks.class_id, [(marks.mark, 1)])
+        self.data_version_repository.bump(Marks.__tablename__)
+
         self.db.commit()
         self.db.refresh(marks)
 
+    def rollback(self) -> None:
+        """
+        Discards the changes which have not been committed, i.e. after a write has failed, so that the session can be used again.
+        """
+        self.db.rollback()
+
+    def upsert_all(self, marks: List[Marks], on_conflict: str = ON_CONFLICT_SKIP) -> List[Tuple[Optional[int], str]]:
+        """
+        Adds a list of objects into the database with `INSERT ... ON CONFLICT`, within a single transaction, where a conflict
+        is a mark for a student & class which already has one. The identifiers of written marks are set on the objects.
+
+        Args:
+            marks: The objects to be added.
+            on_conflict (default: "skip"): Either `ON_CONFLICT_SKIP` to leave the existing mark as it is, `ON_CONFLICT_OVERWRITE`
+                                           to replace its mark & code, or `ON_CONFLICT_REPORT` to leave it as it is and return its identifier.
+
+        Returns:
+            List[Tuple[Optional[int], str]]: The identifier & outcome of each mark, in the same order as the objects passed in. The outcome is one of
+                                             `inserted`, `updated` (when overwriting), `skipped` (without an identifier) or `conflict` (with the identifier of the existing mark).
+        """
+        if not marks:
+            return []
+
+        # A row can only be written once per statement, so the last mark of a student & class wins.
+        latest: Dict[Tuple[int, int], Marks] = {(int(mark.student_id), int(mark.class_id)): mark for mark in marks}
+
+        overwrite = on_conflict == ON_CONFLICT_OVERWRITE
+        is_postgresql = self.db.get_bind().dialect.name == "postgresql"
+
+        updated: Set[Tuple[int, int]] = set()
+
+        # On PostgreSQL the upsert itself returns whether each row was inserted, as a concurrent insert may land before it.
+        # SQLite serialises writes, so a mark which exists before the upsert is the one it updates.
+        if overwrite and not is_postgresql:
+            updated = set(self._find_ids_by_keys(latest.keys()))
+
+        returning = [Marks.id, Marks.student_id, Marks.class_id]
+
+        if overwrite and is_postgresql:
+            # `xmax` is only set on a row which the upsert updated, rather than inserted.
+            returning.append(literal_column("(xmax = 0)", Boolean).label("inserted"))
+
+        insert = dialect_insert(self.db)
+        written: Dict[Tuple[int, int], int] = {}
+
+        values = [
+            {"mark": mark.mark, "code": mark.code, "class_id": class_id, "student_id": student_id}
+            for (student_id, class_id), mark in latest.items()
+        ]
+
+        for start in range(0, len(values), UPSERT_BATCH_SIZE):
+            statement = insert(Marks).values(values[start:start + UPSERT_BATCH_SIZE])
+
+            if overwrite:
+                statement = statement.on_conflict_do_update(
+                    index_elements=[Marks.student_id, Marks.class_id],
+                    set_={"mark": statement.excluded.mark, "code": statement.excluded.code},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=[Marks.student_id, Marks.class_id])
+
+            for row in self.db.execute(statement.returning(*returning)):
+                written[(row.student_id, row.class_id)] = row.id
+
+                if overwrite and is_postgresql and not row.inserted:
+                    updated.add((row.student_id, row.class_id))
+
+        conflicts: Dict[Tuple[int, int], int] = {}
+
+        if on_conflict == ON_CONFLICT_REPORT:
+            conflicts = self._find_ids_by_keys(key for key in latest if key not in written)
+
+        self._record_upsert(latest, written, updated)
+        self.data_version_repository.bump(Marks.__tablename__)
+
+        self.db.commit()
+
+        results: List[Tuple[Optional[int], str]] = []
+
+        for mark in marks:
+            key = (int(mark.student_id), int(mark.class_id))
+
+            if key in written:
+                mark.id = written[key]
+                results.append((written[key], "updated" if key in updated else "inserted"))
+            elif key in conflicts:
+                results.append((conflicts[key], "conflict"))
+            else:
+                results.append((None, "skipped"))
+
+        return results
+
     def find_by_id(self, mark_id: int) -> Optional[Marks]:
         """
         Retrieves a mark by a given mark identifier.
@@ -55,6 +183,44 @@ class MarkRepository:
         """
         return self.db.query(Marks).filter_by(student_id=student_id, class_id=class_id).first()
 
+    def find_class_and_student_details(self, class_id: int, student_id: int) -> Optional[Row]:
+        """
+        Retrieves the details of the class & student of a mark, i.e. to tell which statistics the mark is part of.
+
+        Args:
+            class_id: The identifier of the class.
+            student_id: The identifier of the student.
+
+        Returns:
+            Optional[Row]: A row containing the class code, the identifier of the lecturer of the class & the registration number
+                           of the student, however can also return `None` if either cannot be found.
+        """
+        return (self.db.query(Class.code, Class.lecturer_id, Student.reg_no)
+            .filter(Class.id == class_id, Student.id == student_id)
+            .first()
+        )
+
+    def find_by_student_ids_and_class_ids(self, student_ids: Iterable[int], class_ids: Iterable[int]) -> List[Marks]:
+        """
+        Retrieves the identifiers of every mark which belongs to one of the given students and one of the given classes.
+
+        Args:
+            student_ids: The student identifiers.
+            class_ids: The class identifiers.
+        
+        Returns:
+            List[Marks]: A list of rows containing the `id`, `student_id` and `class_id` of each existing mark.
+        """
+        student_ids, class_ids = set(student_ids), set(class_ids)
+
+        if not (student_ids and class_ids):
+            return []
+
+        return (self.db.query(Marks.id, Marks.student_id, Marks.class_id)
+            .filter(Marks.student_id.in_(student_ids), Marks.class_id.in_(class_ids))
+            .all()
+        )
+
     def get_student_marks_for_lecturer(self, lecturer_id: int) -> List[MarksRow]:
         """
         Retrieves a list of student marks for a particular lecturer.
@@ -65,7 +231,16 @@ class MarkRepository:
         Returns:
             List[MarksRow]: A list of `MarksRow` schematic objects.
         """
-        return (self.db.query(Marks.id, Student.student_name, Student.reg_no, Class.code, Degree.level, Degree.name, Marks.mark, Marks.code)
+        return (self.db.query(
+                Marks.id,
+                Student.student_name,
+                Student.reg_no,
+                Class.code.label("class_code"),
+                Degree.level.label("degree_level"),
+                Degree.name.label("degree_name"),
+                Marks.mark,
+                Marks.code,
+            )
             .join(Marks, Marks.class_id == Class.id)
             .join(Student, Student.id == Marks.student_id)
             .join(Degree, Degree.id == Student.degree_id)
@@ -95,7 +270,17 @@ class MarkRepository:
         Returns:
             List[MarksRow]: A list of `MarksRow` schematic objects.
         """
-        return (self.db.query(Student.id, Student.student_name, Student.reg_no, Class.code, Class.name, Degree.level, Degree.name, Marks.mark, Marks.code)
+        return (self.db.query(
+                Student.id,
+                Student.student_name,
+                Student.reg_no,
+                Class.code.label("class_code"),
+                Class.name.label("class_name"),
+                Degree.level.label("degree_level"),
+                Degree.name.label("degree_name"),
+                Marks.mark,
+                Marks.code,
+            )
             .join(Marks, Marks.class_id == Class.id)
             .join(Student, Student.id == Marks.student_id)
             .join(Degree, Degree.id == Student.degree_id)
@@ -113,7 +298,17 @@ class MarkRepository:
         Returns:
             List[MarksRow]: A list of `MarksRow` schematic objects.
         """
-        return (self.db.query(Student.id, Student.student_name, Student.reg_no, Class.code, Class.name, Degree.level, Degree.name, Marks.mark, Marks.code)
+        return (self.db.query(
+                Student.id,
+                Student.student_name,
+                Student.reg_no,
+                Class.code.label("class_code"),
+                Class.name.label("class_name"),
+                Degree.level.label("degree_level"),
+                Degree.name.label("degree_name"),
+                Marks.mark,
+                Marks.code,
+            )
             .join(Marks, Marks.class_id == Class.id)
             .join(Student, Student.id == Marks.student_id)
             .join(Degree, Degree.id == Student.degree_id)
@@ -121,6 +316,38 @@ class MarkRepository:
             .all()
         )
     
+    def stream_marks_rows(self, lecturer_id: Optional[int] = None, class_code: Optional[str] = None, batch_size: int = 1000) -> Iterator[Row]:
+        """
+        Streams the marks (alongside the details of the student, class & degree) in the system, optionally only for the
+        classes of a lecturer, or for a single class, ordered by class & student.
+
+        The rows are fetched `batch_size` at a time from a server-side cursor (where the database supports one), so that
+        an export is never held in memory all at once.
+
+        Args:
+            lecturer_id (default: None): The lecturer, whose classes the marks should be streamed for.
+            class_code (default: None): The class, whose marks should be streamed.
+            batch_size (default: 1000): The number of rows fetched at a time.
+
+        Returns:
+            Iterator[Row]: An iterator of rows, each containing the class code, class name, registration number, student name, degree level, degree name, mark & mark code.
+        """
+        return (self._filter_marks(self.db.query(
+                Class.code.label("class_code"),
+                Class.name.label("class_name"),
+                Student.reg_no,
+                Student.student_name,
+                Degree.level.label("degree_level"),
+                Degree.name.label("degree_name"),
+                Marks.mark,
+                Marks.code,
+            ), lecturer_id, class_code)
+            .join(Student, Student.id == Marks.student_id)
+            .join(Degree, Degree.id == Student.degree_id)
+            .order_by(Class.code, Student.reg_no)
+            .yield_per(batch_size)
+        )
+
     def get_student_marks_for_class(self, class_id: int) -> List[Marks]:
         """
         Retrieves a list of student marks for a particular class.
@@ -133,6 +360,86 @@ class MarkRepository:
         """
         return self.db.query(Marks).filter_by(class_id=class_id).all()
     
+    def get_marks_statistics(self, pass_mark: int, lecturer_id: Optional[int] = None, class_code: Optional[str] = None) -> Optional[MarksStatistics]:
+        """
+        Calculates statistics (mean, median, mode, pass rate & the five performance buckets) of the marks in the system,
+        optionally only for the classes of a lecturer, or for a single class.
+
+        On PostgreSQL the statistics are calculated by the database in a single aggregate query, otherwise the database
+        groups the marks into a histogram (at most 101 rows), from which the statistics are calculated in a single pass.
+
+        Args:
+            pass_mark: The minimum mark which counts towards the pass rate.
+            lecturer_id (default: None): The lecturer, whose classes the statistics should be calculated for.
+            class_code (default: None): The class which the statistics should be calculated for.
+        
+        Returns:
+            Optional[MarksStatistics]: A `MarksStatistics` schematic object, where every field is -1 if only mark codes (and no marks) were uploaded.
+                                       Can also return `None` if there are no marks at all.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            return self._aggregate_marks_statistics(pass_mark, lecturer_id, class_code)
+
+        histogram: Dict[int, int] = {}
+        row_count = 0
+
+        query = self._filter_marks(self.db.query(Marks.mark, func.count()), lecturer_id, class_code)
+
+        for mark, count in query.group_by(Marks.mark):
+            row_count += count
+
+            if mark is not None:
+                histogram[mark] = count
+
+        if row_count == 0:
+            return None
+
+        return summarise_histogram(row_count, histogram, pass_mark)
+
+    def _filter_marks(self, query: Query, lecturer_id: Optional[int], class_code: Optional[str]) -> Query:
+        query = query.select_from(Marks).join(Class, Class.id == Marks.class_id)
+
+        if lecturer_id is not None:
+            query = query.filter(Class.lecturer_id == lecturer_id)
+
+        if class_code is not None:
+            query = query.filter(Class.code == class_code)
+
+        return query
+
+    def _aggregate_marks_statistics(self, pass_mark: int, lecturer_id: Optional[int], class_code: Optional[str]) -> Optional[MarksStatistics]:
+        mark = Marks.mark
+
+        query = self._filter_marks(self.db.query(
+            func.count(),
+            func.count(mark),
+            func.avg(mark),
+            func.percentile_cont(0.5).within_group(mark),
+            func.mode().within_group(mark),
+            func.count(mark).filter(mark >= pass_mark),
+            *[func.count(mark).filter(mark.between(lower, upper)) for lower, upper in MARK_BUCKETS],
+        ), lecturer_id, class_code)
+
+        row_count, mark_count, mean, median, mode, passed, *buckets = query.one()
+
+        if row_count == 0:
+            return None
+
+        if mark_count == 0:
+            return empty_statistics()
+
+        return MarksStatistics(
+            mean=round(float(mean)),
+            median=round(float(median)),
+            mode=mode,
+            pass_rate=round(passed / row_count * 100),
+            first_bucket=buckets[0],
+            second_bucket=buckets[1],
+            third_bucket=buckets[2],
+            fourth_bucket=buckets[3],
+            fifth_bucket=buckets[4],
+        )
+
     def update(self, mark: Marks, request: MarksEdit) -> None:
         """
         Updates the details of an existing mark.
@@ -141,9 +448,16 @@ class MarkRepository:
             mark: A mark object, which already exists in the database.
             request: An object that conforms with the `MarksEdit` schema, containing the new information of the mark.
         """
+        previous_mark = mark.mark
+
         mark.mark = request.mark
         mark.code = request.code
 
+        self.db.flush()
+
+        self.class_statistics_repository.record(mark.class_id, [(previous_mark, -1), (mark.mark, 1)])
+        self.data_version_repository.bump(Marks.__tablename__)
+
         self.db.commit()
 
     def delete(self, mark: Marks) -> None:
@@ -154,4 +468,40 @@ class MarkRepository:
             mark: A mark object, which already exists in the database.
         """
         self.db.delete(mark)
+        self.db.flush()
+
+        self.class_statistics_repository.record(mark.class_id, [(mark.mark, -1)])
+        self.data_version_repository.bump(Marks.__tablename__)
+
         self.db.commit()
+
+    def _find_ids_by_keys(self, keys: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], int]:
+        keys = set(keys)
+
+        if not keys:
+            return {}
+
+        rows = self.find_by_student_ids_and_class_ids(
+            (student_id for student_id, _ in keys), (class_id for _, class_id in keys)
+        )
+
+        # The query matches every combination of the students & classes, so only the requested pairs are kept.
+        return {(student_id, class_id): mark_id for mark_id, student_id, class_id in rows if (student_id, class_id) in keys}
+
+    def _record_upsert(self, latest: Dict[Tuple[int, int], Marks], written: Dict[Tuple[int, int], int], updated: Set[Tuple[int, int]]) -> None:
+        changes_by_class: Dict[int, List[Tuple[Any, int]]] = {}
+        overwritten_class_ids = set()
+
+        for key in written:
+            if key in updated:
+                overwritten_class_ids.add(key[1])
+            else:
+                changes_by_class.setdefault(key[1], []).append((latest[key].mark, 1))
+
+        # The previous mark of an overwritten row isn't returned by the upsert, so those classes are rebuilt instead.
+        if overwritten_class_ids:
+            self.class_statistics_repository.rebuild(overwritten_class_ids)
+
+        for class_id, changes in changes_by_class.items():
+            if class_id not in overwritten_class_ids:
+                self.class_statistics_repository.record(class_id, changes)
@@ -0,0 +1,37 @@
+from typing import Any, Dict, Final, Iterable, List
+
+from fastapi import Response
+
+from pydantic import TypeAdapter
+
+from api.system.schemas.schemas import MarksRow
+
+
+# Built once, so that a list of rows is validated & serialised in a single call into pydantic-core, rather than row by row.
+MARKS_ROWS_ADAPTER: Final[TypeAdapter[List[MarksRow]]] = TypeAdapter(List[MarksRow])
+
+
+def to_marks_rows(rows: Iterable[Dict[str, Any]]) -> List[MarksRow]:
+    """
+    Validates rows (keyed by the fields of `MarksRow`) as a list of `MarksRow` in bulk.
+
+    Args:
+        rows: The rows, i.e. `Row._asdict()` of a labelled query.
+
+    Returns:
+        List[MarksRow]: A list of `MarksRow` schematic objects.
+    """
+    return MARKS_ROWS_ADAPTER.validate_python(list(rows))
+
+def marks_rows_response(marks_rows: List[MarksRow]) -> Response:
+    """
+    Serialises (already validated) marks rows straight to JSON, which skips FastAPI validating the list against the
+    `response_model` a second time. The body is the same as FastAPI would return.
+
+    Args:
+        marks_rows: A list of `MarksRow` schematic objects.
+
+    Returns:
+        Response: A JSON response containing the rows.
+    """
+    return Response(content=MARKS_ROWS_ADAPTER.dump_json(marks_rows), media_type="application/json")
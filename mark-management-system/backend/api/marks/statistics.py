@@ -0,0 +1,155 @@
+from math import sqrt
+
+from typing import Dict, Final, Tuple
+
+from api.system.models.models import ClassStatistics
+
+from api.system.schemas.schemas import MarksStatistics
+
+
+# The minimum mark which counts as a pass.
+PASS_MARK: Final[int] = 40
+
+# The (inclusive) bounds of the five performance buckets of `MarksStatistics`.
+MARK_BUCKETS: Final[Tuple[Tuple[int, int], ...]] = ((0, 39), (40, 49), (50, 59), (60, 69), (70, 100))
+
+
+def summarise_histogram(row_count: int, histogram: Dict[int, int], pass_mark: int) -> MarksStatistics:
+    """
+    Calculates statistics from a histogram of marks, i.e. without holding every mark in memory.
+
+    Args:
+        row_count: The number of mark rows, including those with only a mark code, which the pass rate is out of.
+        histogram: A dictionary of each mark & the number of times it occurs.
+        pass_mark: The minimum mark which counts towards the pass rate.
+
+    Returns:
+        MarksStatistics: A `MarksStatistics` schematic object, where every field is -1 if the histogram is empty.
+    """
+    mark_count = sum(histogram.values())
+
+    if mark_count == 0:
+        return empty_statistics()
+
+    total, passed = 0, 0
+    buckets = [0] * len(MARK_BUCKETS)
+
+    for mark, count in histogram.items():
+        total += mark * count
+
+        if mark >= pass_mark:
+            passed += count
+
+        for index, (lower, upper) in enumerate(MARK_BUCKETS):
+            if lower <= mark <= upper:
+                buckets[index] += count
+
+    median, mode = median_and_mode(histogram)
+
+    return MarksStatistics(
+        mean=round(total / mark_count),
+        median=median,
+        mode=mode,
+        pass_rate=round(passed / row_count * 100),
+        first_bucket=buckets[0],
+        second_bucket=buckets[1],
+        third_bucket=buckets[2],
+        fourth_bucket=buckets[3],
+        fifth_bucket=buckets[4],
+    )
+
+def summarise_class_statistics(statistics: ClassStatistics, pass_mark: int) -> MarksStatistics:
+    """
+    Calculates statistics from the (materialised) statistics of a class, without reading any of the marks of the class.
+
+    Args:
+        statistics: The `ClassStatistics` of a class, with at least one mark row.
+        pass_mark: The minimum mark which counts towards the pass rate.
+
+    Returns:
+        MarksStatistics: A `MarksStatistics` schematic object, where every field is -1 if the class only has mark codes.
+    """
+    histogram = {int(mark): count for mark, count in statistics.histogram.items()}
+
+    # The stored pass count is only valid for the system pass mark, any other pass mark is counted from the histogram.
+    if statistics.mark_count == 0 or pass_mark != PASS_MARK:
+        return summarise_histogram(statistics.row_count, histogram, pass_mark)
+
+    median, mode = median_and_mode(histogram)
+
+    return MarksStatistics(
+        mean=round(statistics.mark_sum / statistics.mark_count),
+        median=median,
+        mode=mode,
+        pass_rate=round(statistics.pass_count / statistics.row_count * 100),
+        first_bucket=statistics.first_bucket,
+        second_bucket=statistics.second_bucket,
+        third_bucket=statistics.third_bucket,
+        fourth_bucket=statistics.fourth_bucket,
+        fifth_bucket=statistics.fifth_bucket,
+    )
+
+def median_and_mode(histogram: Dict[int, int]) -> Tuple[int, int]:
+    """
+    Calculates the (rounded) median & mode from a non-empty histogram of marks.
+
+    Args:
+        histogram: A dictionary of each mark & the number of times it occurs.
+
+    Returns:
+        Tuple[int, int]: The median & mode of the marks.
+    """
+    mark_count = sum(histogram.values())
+
+    seen = 0
+    lower_median, upper_median = None, None
+    mode, mode_count = None, 0
+
+    for mark in sorted(histogram):
+        count = histogram[mark]
+
+        # Ties are resolved in favour of the lowest mark, as PostgreSQL's `mode()` does.
+        if count > mode_count:
+            mode, mode_count = mark, count
+
+        # The median is the mean of the middle two marks (when there is an even number of marks), i.e. `percentile_cont(0.5)`.
+        if lower_median is None and seen + count > (mark_count - 1) // 2:
+            lower_median = mark
+
+        if upper_median is None and seen + count > mark_count // 2:
+            upper_median = mark
+
+        seen += count
+
+    return round((lower_median + upper_median) / 2), mode
+
+def sample_stdev(count: int, total: int, total_of_squares: int) -> float:
+    """
+    Calculates the sample standard deviation (as `statistics.stdev` does) from the count, sum & sum of squares of the marks.
+
+    Args:
+        count: The number of marks.
+        total: The sum of the marks.
+        total_of_squares: The sum of the squares of the marks.
+
+    Returns:
+        float: The sample standard deviation, or 0 if there are fewer than two marks.
+    """
+    if count < 2:
+        return 0
+
+    # Marks are integers, so the numerator is calculated exactly before dividing, which avoids any cancellation error.
+    return sqrt((count * total_of_squares - total * total) / (count * (count - 1)))
+
+def empty_statistics() -> MarksStatistics:
+    return MarksStatistics(
+        mean=-1,
+        median=-1,
+        mode=-1,
+        pass_rate=-1,
+        first_bucket=-1,
+        second_bucket=-1,
+        third_bucket=-1,
+        fourth_bucket=-1,
+        fifth_bucket=-1,
+    )
@@ -0,0 +1,45 @@
+from typing import Final, Tuple
+
+from api.utils.cache import ScopedCache
+from api.utils.cache import create_cache_backend
+
+from api.config import Config
+
+
+# Statistics are read far more often than marks are written, so they are cached per scope of the marks they are derived
+# from. Mark writes invalidate the scopes of the marks which they touch, the TTL bounds how stale anything else can get,
+# i.e. a class being renamed or reassigned to another lecturer.
+statistics_cache = ScopedCache(
+    create_cache_backend(
+        Config.STATISTICS_CACHE_URL,
+        Config.STATISTICS_CACHE_MAXSIZE,
+        Config.STATISTICS_CACHE_TTL_SECONDS,
+    )
+)
+
+# Every mark in the system, i.e. global statistics & class metrics.
+GLOBAL_SCOPE: Final[str] = "global"
+
+
+def lecturer_scope(lecturer_id: int) -> str:
+    return f"lecturer:{lecturer_id}"
+
+def class_scope(class_code: str) -> str:
+    return f"class:{class_code}"
+
+def student_scope(reg_no: str) -> str:
+    return f"student:{reg_no}"
+
+def mark_scopes(class_code: str, lecturer_id: int, reg_no: str) -> Tuple[str, ...]:
+    """
+    Retrieves every scope which a mark is part of.
+
+    Args:
+        class_code: The class code of the class of the mark.
+        lecturer_id: The identifier of the lecturer of the class.
+        reg_no: The registration number of the student of the mark.
+
+    Returns:
+        Tuple[str, ...]: The global, class, lecturer & student scopes.
+    """
+    return (GLOBAL_SCOPE, class_scope(class_code), lecturer_scope(lecturer_id), student_scope(reg_no))
@@ -0,0 +1,74 @@
+import io
+import csv
+
+from typing import Tuple, BinaryIO, Iterator
+
+from api.users.repositories.user_repository import UserRepository
+from api.students.repositories.student_repository import StudentRepository
+
+from api.marks.myplace import open_myplace_file
+from api.marks.myplace import read_myplace_rows
+from api.marks.myplace import join_student_details
+from api.marks.myplace import to_csv_lines
+
+from api.users.errors.user_not_found import UserNotFound
+
+from api.config import Config
+
+
+class ConvertMyPlaceFileUseCase:
+    """
+    The Use Case containing business logic for converting a MyPlace export (CSV) to a mark upload file, row by row.
+    """
+    def __init__(
+            self,
+            user_repository: UserRepository,
+            student_repository: StudentRepository,
+            config: Config,
+        ) -> None:
+        self.user_repository = user_repository
+        self.student_repository = student_repository
+        self.config = config
+
+    def execute(self, file: BinaryIO, current_user: Tuple[str, bool, bool]) -> Iterator[str]:
+        """
+        Executes the Use Case to convert a MyPlace export to a mark upload file, where the mark of each row is the override
+        mark if one is given, and the class total if not, alongside the name & degree of the student.
+
+        The user & the header of the file are checked up front, the rows themselves are only read once the returned
+        iterator is consumed, and the students are looked up `MARKS_UPLOAD_CHUNK_SIZE` rows at a time, so that neither
+        file is ever held in memory.
+
+        Args:
+            file: The MyPlace export, containing the CLASS_CODE, REG_NO, CLASS_TOTAL & (optionally) OVERRIDE_MARK columns.
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+
+        Raises:
+            UserNotFound: If the user (from the JWT) cannot be found.
+            PermissionError: If the user is not a lecturer, or an administrator.
+            InvalidMarksFile: If the file is missing a header, or any of the required columns.
+
+        Returns:
+            Iterator[str]: An iterator of CSV lines, starting with the header. Rows of students which cannot be found are left out.
+        """
+        user_email, is_admin, is_lecturer = current_user
+
+        user = self.user_repository.find_by_email(user_email)
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        if not (is_lecturer or is_admin):
+            raise PermissionError("Permission denied to access this resource")
+
+        reader, text = open_myplace_file(file)
+
+        return self.convert(reader, text)
+
+    def convert(self, reader: csv.DictReader, text: io.TextIOWrapper) -> Iterator[str]:
+        try:
+            yield from to_csv_lines(
+                join_student_details(read_myplace_rows(reader), self.student_repository, self.config.MARKS_UPLOAD_CHUNK_SIZE)
+            )
+        finally:
+            text.detach()
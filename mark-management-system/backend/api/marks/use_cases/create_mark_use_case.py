@@ -6,9 +6,14 @@ from api.system.schemas.schemas import MarksCreate
 from api.system.schemas.schemas import Marks as MarksSchema
 
 from api.marks.repositories.mark_repository import MarkRepository
+from api.marks.repositories.mark_repository import ON_CONFLICT_REPORT
 from api.users.repositories.user_repository import UserRepository
 from api.classes.repositories.class_repository import ClassRepository
 
+from api.marks.statistics_cache import mark_scopes
+
+from api.utils.cache import ScopedCache
+
 from api.marks.errors.mark_already_exists import MarkAlreadyExists
 from api.marks.errors.mark_and_code_not_provided import MarkAndCodeNotProvided
 
@@ -19,10 +24,17 @@ class CreateMarkUseCase:
     """
     The Use Case containing business logic for creating a new mark.
     """
-    def __init__(self, mark_repository: MarkRepository, user_repository: UserRepository, class_repository: ClassRepository) -> None:
+    def __init__(
+            self,
+            mark_repository: MarkRepository,
+            user_repository: UserRepository,
+            class_repository: ClassRepository,
+            statistics_cache: ScopedCache,
+        ) -> None:
         self.mark_repository = mark_repository
         self.user_repository = user_repository
         self.class_repository = class_repository
+        self.statistics_cache = statistics_cache
 
     def execute(self, request: MarksCreate, current_user: Tuple[str, bool, bool]) -> MarksSchema:
         """
@@ -52,9 +64,6 @@ class CreateMarkUseCase:
         if not (is_lecturer_of_class or is_admin):
             raise PermissionError("Permission denied to access this resource")
 
-        if self.mark_repository.find_by_student_id_and_class_id(request.student_id, request.class_id):
-            raise MarkAlreadyExists("Mark already exists")
-
         if request.code is None and request.mark is None:
             raise MarkAndCodeNotProvided("Neither Mark or Code as provided.")
 
@@ -78,6 +87,15 @@ class CreateMarkUseCase:
                 student_id=request.student_id
             )
 
-        self.mark_repository.add(mark)
+        # The unique index on the student & class decides whether the mark already exists, so concurrent requests can't both create it.
+        [(_, outcome)] = self.mark_repository.upsert_all([mark], ON_CONFLICT_REPORT)
+
+        if outcome == "conflict":
+            raise MarkAlreadyExists("Mark already exists")
+
+        details = self.mark_repository.find_class_and_student_details(mark.class_id, mark.student_id)
+
+        if details is not None:
+            self.statistics_cache.invalidate(*mark_scopes(*details))
 
         return mark
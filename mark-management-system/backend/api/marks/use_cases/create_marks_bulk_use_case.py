@@ -0,0 +1,175 @@
+from typing import Tuple, List, Dict, Set, Iterable
+
+from api.system.models.models import Marks
+
+from api.system.schemas.schemas import MarksBulkCreate
+from api.system.schemas.schemas import MarksBulkRow
+from api.system.schemas.schemas import MarksBulkRowResult
+from api.system.schemas.schemas import MarksBulkResult
+
+from api.marks.repositories.mark_repository import MarkRepository
+from api.marks.repositories.mark_repository import ON_CONFLICT_SKIP
+from api.marks.repositories.mark_repository import ON_CONFLICT_OVERWRITE
+from api.users.repositories.user_repository import UserRepository
+from api.classes.repositories.class_repository import ClassRepository
+from api.students.repositories.student_repository import StudentRepository
+
+from api.marks.validators import MarkValidator
+
+from api.marks.statistics_cache import mark_scopes
+
+from api.utils.cache import ScopedCache
+
+from api.users.errors.user_not_found import UserNotFound
+
+
+class CreateMarksBulkUseCase:
+    """
+    The Use Case containing business logic for creating many marks at once, i.e. an uploaded mark sheet.
+    """
+    def __init__(
+            self,
+            mark_repository: MarkRepository,
+            user_repository: UserRepository,
+            class_repository: ClassRepository,
+            student_repository: StudentRepository,
+            mark_validator: MarkValidator,
+            statistics_cache: ScopedCache,
+        ) -> None:
+        self.mark_repository = mark_repository
+        self.user_repository = user_repository
+        self.class_repository = class_repository
+        self.student_repository = student_repository
+        self.mark_validator = mark_validator
+        self.statistics_cache = statistics_cache
+
+    def execute(self, request: MarksBulkCreate, current_user: Tuple[str, bool, bool]) -> MarksBulkResult:
+        """
+        Executes the Use Case to create a list of marks in the system.
+
+        Class codes & registration numbers are resolved in set-based queries, permissions are checked once per class
+        and every new mark is inserted within a single statement. Rows which cannot be created are reported back
+        alongside the reason, rather than failing the whole request, unless `overwrite` is set in which case existing
+        marks are replaced instead.
+
+        Args:
+            request: A `MarksBulkCreate` object is required which contains the rows of the uploaded mark sheet.
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+
+        Raises:
+            UserNotFound: If the user (from the JWT) cannot be found.
+            PermissionError: If the user is not a lecturer, or an administrator.
+
+        Returns:
+            MarksBulkResult: A MarksBulkResult schema object containing the number of created & failed rows, as well as a result per row.
+        """
+        user_email, is_admin, is_lecturer = current_user
+
+        user = self.user_repository.find_by_email(user_email)
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        if not (is_lecturer or is_admin):
+            raise PermissionError("Permission denied to access this resource")
+
+        results = self.create_marks(enumerate(request.marks), user.id, is_admin, request.overwrite)
+
+        return self.summarise(results)
+
+    def create_marks(self, numbered_rows: Iterable[Tuple[int, MarksBulkRow]], user_id: int, is_admin: bool, overwrite: bool = False) -> List[MarksBulkRowResult]:
+        """
+        Validates, resolves and upserts a batch of mark rows, returning a result for every row.
+
+        Args:
+            numbered_rows: The rows to be created, each paired with the row number which is reported back in its result.
+            user_id: The identifier of the requestor, used to check whether they are the lecturer of each class.
+            is_admin: Whether the requestor is an administrator, in which case they may upload marks for any class.
+            overwrite (default: False): Whether existing marks are replaced, rather than reported as already existing.
+
+        Returns:
+            List[MarksBulkRowResult]: A list of results, in the same order as the rows passed in.
+        """
+        numbered_rows = list(numbered_rows)
+        rows = [row for _, row in numbered_rows]
+
+        classes = {class_.code: class_ for class_ in self.class_repository.find_by_codes(row.class_code for row in rows)}
+        students = {student.reg_no: student.id for student in self.student_repository.find_by_reg_nos(row.reg_no for row in rows)}
+
+        permitted_classes: Dict[int, bool] = {
+            class_.id: (class_.lecturer_id == user_id or is_admin) for class_ in classes.values()
+        }
+
+        # Marks which already exist in the database are found by the upsert itself, this only catches repeated rows.
+        seen_marks: Set[Tuple[int, int]] = set()
+
+        results: List[MarksBulkRowResult] = []
+        new_marks: List[Marks] = []
+        new_mark_results: List[Tuple[MarksBulkRowResult, Tuple[str, ...]]] = []
+        invalidated_scopes: Set[str] = set()
+
+        for row_number, row in numbered_rows:
+            result = MarksBulkRowResult(
+                row=row_number,
+                class_code=row.class_code,
+                reg_no=row.reg_no,
+                status="created",
+            )
+
+            results.append(result)
+
+            validation_errors = self.mark_validator.validate_mark_row(row.mark, row.code)
+            class_ = classes.get(row.class_code)
+            student_id = students.get(row.reg_no)
+
+            if validation_errors:
+                result.status, result.detail = "invalid", next(iter(validation_errors.values()))
+            elif class_ is None:
+                result.status, result.detail = "class_not_found", "Class not found"
+            elif not permitted_classes[class_.id]:
+                result.status, result.detail = "permission_denied", "Permission denied to access this resource"
+            elif student_id is None:
+                result.status, result.detail = "student_not_found", "Student not found"
+            elif (student_id, class_.id) in seen_marks:
+                result.status, result.detail = "already_exists", "Mark already exists"
+            else:
+                seen_marks.add((student_id, class_.id))
+
+                new_marks.append(
+                    Marks(
+                        mark=row.mark,
+                        code=row.code or None,
+                        class_id=class_.id,
+                        student_id=student_id,
+                    )
+                )
+                new_mark_results.append((result, mark_scopes(class_.code, class_.lecturer_id, row.reg_no)))
+
+        on_conflict = ON_CONFLICT_OVERWRITE if overwrite else ON_CONFLICT_SKIP
+
+        for (result, scopes), (mark_id, outcome) in zip(new_mark_results, self.mark_repository.upsert_all(new_marks, on_conflict)):
+            if outcome == "skipped":
+                result.status, result.detail = "already_exists", "Mark already exists"
+                continue
+
+            if outcome == "updated":
+                result.status = "updated"
+
+            result.mark_id = mark_id
+            invalidated_scopes.update(scopes)
+
+        # Once per batch, so that the statistics are only recomputed once the batch has been inserted.
+        self.statistics_cache.invalidate(*invalidated_scopes)
+
+        return results
+
+    def summarise(self, results: List[MarksBulkRowResult]) -> MarksBulkResult:
+        created = sum(result.status == "created" for result in results)
+        updated = sum(result.status == "updated" for result in results)
+
+        return MarksBulkResult(
+            created=created,
+            updated=updated,
+            failed=len(results) - created - updated,
+            results=results,
+        )
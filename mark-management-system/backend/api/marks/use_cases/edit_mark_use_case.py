@@ -8,6 +8,10 @@ from api.marks.repositories.mark_repository import MarkRepository
 from api.users.repositories.user_repository import UserRepository
 from api.classes.repositories.class_repository import ClassRepository
 
+from api.marks.statistics_cache import mark_scopes
+
+from api.utils.cache import ScopedCache
+
 from api.marks.errors.mark_not_found import MarkNotFound
 
 from api.users.errors.user_not_found import UserNotFound
@@ -17,10 +21,17 @@ class EditMarkUseCase:
     """
     The Use Case containing business logic for editing an existing mark.
     """
-    def __init__(self, mark_repository: MarkRepository, user_repository: UserRepository, class_repository: ClassRepository) -> None:
+    def __init__(
+            self,
+            mark_repository: MarkRepository,
+            user_repository: UserRepository,
+            class_repository: ClassRepository,
+            statistics_cache: ScopedCache,
+        ) -> None:
         self.mark_repository = mark_repository
         self.user_repository = user_repository
         self.class_repository = class_repository
+        self.statistics_cache = statistics_cache
     
     def execute(self, request: MarksEdit, current_user: Tuple[str, bool, bool]) -> MarksSchema:
         """
@@ -60,4 +71,9 @@ class EditMarkUseCase:
 
         self.mark_repository.update(mark, request)
 
+        details = self.mark_repository.find_class_and_student_details(mark.class_id, mark.student_id)
+
+        if details is not None:
+            self.statistics_cache.invalidate(*mark_scopes(*details))
+
         return mark
@@ -0,0 +1,113 @@
+import io
+import csv
+
+from typing import Tuple, Iterator, Optional
+
+from sqlalchemy.engine import Row
+
+from api.marks.repositories.mark_repository import MarkRepository
+from api.users.repositories.user_repository import UserRepository
+from api.classes.repositories.class_repository import ClassRepository
+
+from api.classes.errors.class_not_found import ClassNotFound
+
+from api.users.errors.user_not_found import UserNotFound
+
+
+class ExportMarksUseCase:
+    """
+    The Use Case containing business logic for exporting a mark sheet (CSV), row by row.
+    """
+    # The columns of the mark upload file come first, so that an export can be uploaded again.
+    COLUMNS = ("CLASS_CODE", "REG_NO", "MARK", "MARK_CODE", "STUDENT_NAME", "CLASS_NAME", "DEGREE_LEVEL", "DEGREE_NAME")
+
+    # The number of rows fetched from the database, and written to the response, at a time.
+    BATCH_SIZE = 1000
+
+    def __init__(
+            self,
+            mark_repository: MarkRepository,
+            user_repository: UserRepository,
+            class_repository: ClassRepository,
+        ) -> None:
+        self.mark_repository = mark_repository
+        self.user_repository = user_repository
+        self.class_repository = class_repository
+
+    def execute(self, current_user: Tuple[str, bool, bool], class_code: Optional[str] = None) -> Iterator[str]:
+        """
+        Executes the Use Case to export a mark sheet, either of a single class, or of every class the user can access, i.e.
+        every class for an administrator, or the classes they teach for a lecturer.
+
+        The user & the class are checked up front, the marks themselves are only read once the returned iterator is
+        consumed, so that the export is never held in memory.
+
+        Args:
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+            class_code (default: None): The class to export, or `None` for every class the user can access.
+
+        Raises:
+            UserNotFound: If the user (from the JWT) cannot be found.
+            PermissionError: If the user is neither a lecturer nor an administrator, or if a lecturer does not teach the class.
+            ClassNotFound: If the class cannot be found.
+
+        Returns:
+            Iterator[str]: An iterator of CSV chunks, starting with the header.
+        """
+        user_email, is_admin, is_lecturer = current_user
+
+        user = self.user_repository.find_by_email(user_email)
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        if not (is_lecturer or is_admin):
+            raise PermissionError("Permission denied to access this resource")
+
+        if class_code is not None:
+            class_ = self.class_repository.find_by_code(class_code)
+
+            if class_ is None:
+                raise ClassNotFound("Class not found")
+
+            if not is_admin and class_.lecturer_id != user.id:
+                raise PermissionError("Permission denied to access this resource")
+
+        rows = self.mark_repository.stream_marks_rows(
+            lecturer_id=None if is_admin else user.id,
+            class_code=class_code,
+            batch_size=self.BATCH_SIZE,
+        )
+
+        return self.write_csv(rows)
+
+    def write_csv(self, rows: Iterator[Row]) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(self.COLUMNS)
+
+        for count, row in enumerate(rows, start=1):
+            writer.writerow((
+                row.class_code,
+                row.reg_no,
+                "" if row.mark is None else row.mark,
+                row.code or "",
+                row.student_name,
+                row.class_name,
+                row.degree_level,
+                row.degree_name,
+            ))
+
+            if count % self.BATCH_SIZE == 0:
+                yield self.flush(buffer)
+
+        yield self.flush(buffer)
+
+    def flush(self, buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+
+        buffer.seek(0)
+        buffer.truncate()
+
+        return chunk
@@ -1,5 +1,3 @@
-from statistics import mean, mode, median
-
 from typing import Tuple
 
 from api.system.schemas.schemas import MarksStatistics
@@ -7,6 +5,10 @@ from api.system.schemas.schemas import MarksStatistics
 from api.marks.repositories.mark_repository import MarkRepository
 from api.users.repositories.user_repository import UserRepository
 
+from api.marks.statistics_cache import GLOBAL_SCOPE
+
+from api.utils.cache import ScopedCache
+
 from api.marks.errors.mark_not_found import MarkNotFound
 
 from api.users.errors.user_not_found import UserNotFound
@@ -16,9 +18,10 @@ class GetGlobalStudentStatisticsUseCase:
     """
     The Use Case containing business logic for retrieving and calculating all student marks in the system.
     """
-    def __init__(self, mark_repository: MarkRepository, user_repository: UserRepository) -> None:
+    def __init__(self, mark_repository: MarkRepository, user_repository: UserRepository, statistics_cache: ScopedCache) -> None:
         self.mark_repository = mark_repository
         self.user_repository = user_repository
+        self.statistics_cache = statistics_cache
         self.pass_rate = 40
     
     def execute(self, current_user: Tuple[str, bool, bool]) -> MarksStatistics:
@@ -46,27 +49,13 @@ class GetGlobalStudentStatisticsUseCase:
         if not (is_lecturer or is_admin):
             raise PermissionError("Permission denied to access this resource")
         
-        marks = self.mark_repository.get_all_student_marks()
+        marks_statistics = self.statistics_cache.get_or_compute(
+            GLOBAL_SCOPE,
+            "statistics",
+            lambda: self.mark_repository.get_marks_statistics(self.pass_rate),
+        )
 
-        if not marks:
+        if marks_statistics is None:
             raise MarkNotFound("No marks found in the system")
-        
-        mark_data = []
-
-        for current_mark in marks:
-            if current_mark.mark:
-                mark_data.append(current_mark.mark)
-
-        marks_statistics = MarksStatistics(
-            mean=round(mean(mark_data)),
-            median=round(median(mark_data)),
-            mode=round(mode(mark_data)),
-            pass_rate=round(sum(mark >= self.pass_rate for mark in mark_data) / len(marks) * 100),
-            first_bucket=len([mark for mark in mark_data if mark <= 39]),
-            second_bucket=len([mark for mark in mark_data if 40 <= mark <= 49]),
-            third_bucket=len([mark for mark in mark_data if 50 <= mark <= 59]),
-            fourth_bucket=len([mark for mark in mark_data if 60 <= mark <= 69]),
-            fifth_bucket=len([mark for mark in mark_data if 70 <= mark <= 100]),
-        )
 
         return marks_statistics
@@ -10,6 +10,8 @@ from api.marks.errors.mark_not_found import MarkNotFound
 
 from api.users.errors.user_not_found import UserNotFound
 
+from api.marks.serializers import to_marks_rows
+
 
 class GetMarksForClassUseCase:
     """
@@ -50,21 +52,4 @@ class GetMarksForClassUseCase:
         if not marks:
             raise MarkNotFound("Marks not found")
         
-        marks_data = []
-        
-        for mark in marks:
-            mark_row = MarksRow(
-                id=mark[0],
-                student_name=mark[1],
-                reg_no=mark[2],
-                class_code=mark[3],
-                class_name=mark[4],
-                degree_level=mark[5],
-                degree_name=mark[6],
-                mark=mark[7],
-                code=mark[8],
-            )
-
-            marks_data.append(mark_row)
-    
-        return marks_data
+        return to_marks_rows(mark._asdict() for mark in marks)
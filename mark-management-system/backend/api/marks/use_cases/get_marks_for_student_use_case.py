@@ -12,6 +12,8 @@ from api.students.errors.student_not_found import StudentNotFound
 
 from api.users.errors.user_not_found import UserNotFound
 
+from api.marks.serializers import to_marks_rows
+
 
 class GetMarksForStudentUseCase:
     """
@@ -55,21 +57,4 @@ class GetMarksForStudentUseCase:
         if not marks:
             raise MarkNotFound("Marks not found")
         
-        marks_data = []
-
-        for mark in marks:
-            mark_row = MarksRow(
-                id=mark[0],
-                student_name=mark[1],
-                reg_no=mark[2],
-                class_code=mark[3],
-                class_name=mark[4],
-                degree_level=mark[5],
-                degree_name=mark[6],
-                mark=mark[7],
-                code=mark[8],
-            )
-
-            marks_data.append(mark_row)
-    
-        return marks_data
+        return to_marks_rows(mark._asdict() for mark in marks)
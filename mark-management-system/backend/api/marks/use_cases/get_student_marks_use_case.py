@@ -9,6 +9,8 @@ from api.marks.errors.mark_not_found import MarkNotFound
 
 from api.users.errors.user_not_found import UserNotFound
 
+from api.marks.serializers import to_marks_rows
+
 
 class GetStudentMarksUseCase:
     """
@@ -49,21 +51,4 @@ class GetStudentMarksUseCase:
         if not marks:
             raise MarkNotFound("No results found for the lecturer")
         
-        marks_row = []
-
-        for current_mark in marks:
-            mark_row = MarksRow(
-                id=current_mark[0],
-                student_name=current_mark[1],
-                reg_no=current_mark[2],
-                class_code=current_mark[3],
-                class_name=None,
-                degree_level=current_mark[4],
-                degree_name=current_mark[5],
-                mark=current_mark[6],
-                code=current_mark[7],
-            )
-            
-            marks_row.append(mark_row)
-
-        return marks_row
+        return to_marks_rows({**mark._asdict(), "class_name": None} for mark in marks)
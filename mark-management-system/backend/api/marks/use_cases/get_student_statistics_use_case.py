@@ -1,5 +1,3 @@
-from statistics import mean, mode, median
-
 from typing import Tuple
 
 from api.system.schemas.schemas import MarksStatistics
@@ -7,6 +5,10 @@ from api.system.schemas.schemas import MarksStatistics
 from api.marks.repositories.mark_repository import MarkRepository
 from api.users.repositories.user_repository import UserRepository
 
+from api.marks.statistics_cache import lecturer_scope
+
+from api.utils.cache import ScopedCache
+
 from api.marks.errors.mark_not_found import MarkNotFound
 
 from api.users.errors.user_not_found import UserNotFound
@@ -17,9 +19,10 @@ class GetStudentStatisticsUseCase:
     The Use Case containing business logic for retrieving and calculating student marks for a particular
     lecturer.
     """
-    def __init__(self, mark_repository: MarkRepository, user_repository: UserRepository) -> None:
+    def __init__(self, mark_repository: MarkRepository, user_repository: UserRepository, statistics_cache: ScopedCache) -> None:
         self.mark_repository = mark_repository
         self.user_repository = user_repository
+        self.statistics_cache = statistics_cache
         self.pass_rate = 40
     
     def execute(self, current_user: Tuple[str, bool, bool]) -> MarksStatistics:
@@ -43,27 +46,13 @@ class GetStudentStatisticsUseCase:
         if user is None:
             raise UserNotFound("User not found")
         
-        marks = self.mark_repository.get_student_marks_for_lecturer(user.id)
+        marks_statistics = self.statistics_cache.get_or_compute(
+            lecturer_scope(user.id),
+            "statistics",
+            lambda: self.mark_repository.get_marks_statistics(self.pass_rate, lecturer_id=user.id),
+        )
 
-        if not marks:
+        if marks_statistics is None:
             raise MarkNotFound("No results found for the lecturer")
-        
-        mark_data = []
-
-        for current_mark in marks:
-            if current_mark[6]:
-                mark_data.append(current_mark[6])
-
-        marks_statistics = MarksStatistics(
-            mean=round(mean(mark_data)),
-            median=round(median(mark_data)),
-            mode=round(mode(mark_data)),
-            pass_rate=round(sum(mark >= self.pass_rate for mark in mark_data) / len(marks) * 100),
-            first_bucket=len([mark for mark in mark_data if mark <= 40]),
-            second_bucket=len([mark for mark in mark_data if 40 <= mark <= 49]),
-            third_bucket=len([mark for mark in mark_data if 50 <= mark <= 59]),
-            fourth_bucket=len([mark for mark in mark_data if 60 <= mark <= 69]),
-            fifth_bucket=len([mark for mark in mark_data if 70 <= mark <= 100]),
-        )
 
         return marks_statistics
@@ -0,0 +1,57 @@
+import io
+import csv
+
+from typing import Tuple, BinaryIO, Iterator
+
+from api.marks.use_cases.upload_marks_file_use_case import UploadMarksFileUseCase
+
+from api.marks.myplace import open_myplace_file
+from api.marks.myplace import read_myplace_rows
+
+from api.users.errors.user_not_found import UserNotFound
+
+
+class ImportMyPlaceFileUseCase(UploadMarksFileUseCase):
+    """
+    The Use Case containing business logic for ingesting a MyPlace export (CSV) as marks, without converting it to a mark upload file first.
+    """
+    def execute(self, file: BinaryIO, current_user: Tuple[str, bool, bool], overwrite: bool = False) -> Iterator[str]:
+        """
+        Executes the Use Case to ingest a MyPlace export in the system, where the mark of each row is the override mark if
+        one is given, and the class total if not.
+
+        The user & the header of the file are checked up front, the rows themselves are converted & ingested as the
+        returned iterator is consumed, `MARKS_UPLOAD_CHUNK_SIZE` rows at a time, exactly as a mark upload file is.
+
+        Args:
+            file: The MyPlace export, containing the CLASS_CODE, REG_NO, CLASS_TOTAL & (optionally) OVERRIDE_MARK columns.
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+            overwrite (default: False): Whether existing marks are replaced, i.e. when importing a corrected export.
+
+        Raises:
+            UserNotFound: If the user (from the JWT) cannot be found.
+            PermissionError: If the user is not a lecturer, or an administrator.
+            InvalidMarksFile: If the file is missing a header, or any of the required columns.
+
+        Returns:
+            Iterator[str]: An iterator of NDJSON lines, containing the failed rows, progress after each chunk and a final summary.
+        """
+        user_email, is_admin, is_lecturer = current_user
+
+        user = self.user_repository.find_by_email(user_email)
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        if not (is_lecturer or is_admin):
+            raise PermissionError("Permission denied to access this resource")
+
+        reader, text = open_myplace_file(file)
+
+        return self.ingest_myplace(reader, text, user.id, is_admin, overwrite)
+
+    def ingest_myplace(self, reader: csv.DictReader, text: io.TextIOWrapper, user_id: int, is_admin: bool, overwrite: bool) -> Iterator[str]:
+        try:
+            yield from self.ingest_rows(read_myplace_rows(reader), user_id, is_admin, overwrite)
+        finally:
+            text.detach()
@@ -0,0 +1,86 @@
+from typing import Tuple, List, Dict
+
+from api.system.schemas.schemas import MarksResolve
+from api.system.schemas.schemas import MarksResolveResult
+
+from api.marks.repositories.mark_repository import MarkRepository
+from api.users.repositories.user_repository import UserRepository
+from api.classes.repositories.class_repository import ClassRepository
+from api.students.repositories.student_repository import StudentRepository
+
+from api.users.errors.user_not_found import UserNotFound
+
+
+class ResolveMarksUseCase:
+    """
+    The Use Case containing business logic for resolving the rows of a mark sheet, i.e. before it is uploaded.
+    """
+    def __init__(
+            self,
+            mark_repository: MarkRepository,
+            user_repository: UserRepository,
+            class_repository: ClassRepository,
+            student_repository: StudentRepository,
+        ) -> None:
+        self.mark_repository = mark_repository
+        self.user_repository = user_repository
+        self.class_repository = class_repository
+        self.student_repository = student_repository
+
+    def execute(self, request: MarksResolve, current_user: Tuple[str, bool, bool]) -> List[MarksResolveResult]:
+        """
+        Executes the Use Case to resolve a list of class codes & registration numbers to the identifiers of the classes,
+        students and any existing marks, in three set-based queries regardless of the number of rows.
+
+        Args:
+            request: A `MarksResolve` object is required which contains the class code & registration number of each row.
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+
+        Raises:
+            UserNotFound: If the user (from the JWT) cannot be found.
+            PermissionError: If the user is not a lecturer, or an administrator.
+
+        Returns:
+            List[MarksResolveResult]: A list of results, in the same order as the rows, where an identifier is `None` if the class, student or mark
+                                      does not exist. Existing marks are only resolved for the classes of the requestor, unless they are an administrator.
+        """
+        user_email, is_admin, is_lecturer = current_user
+
+        user = self.user_repository.find_by_email(user_email)
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        if not (is_lecturer or is_admin):
+            raise PermissionError("Permission denied to access this resource")
+
+        rows = request.rows
+
+        classes = {code: (class_id, lecturer_id) for class_id, code, lecturer_id in self.class_repository.find_ids_by_codes(row.class_code for row in rows)}
+        students = {reg_no: student_id for student_id, reg_no in self.student_repository.find_ids_by_reg_nos(row.reg_no for row in rows)}
+
+        permitted_class_ids = [class_id for class_id, lecturer_id in classes.values() if lecturer_id == user.id or is_admin]
+
+        marks: Dict[Tuple[int, int], int] = {
+            (student_id, class_id): mark_id for mark_id, student_id, class_id in self.mark_repository.find_by_student_ids_and_class_ids(
+                students.values(), permitted_class_ids
+            )
+        }
+
+        results: List[MarksResolveResult] = []
+
+        for row in rows:
+            class_id, _ = classes.get(row.class_code, (None, None))
+            student_id = students.get(row.reg_no)
+
+            results.append(
+                MarksResolveResult(
+                    class_code=row.class_code,
+                    reg_no=row.reg_no,
+                    class_id=class_id,
+                    student_id=student_id,
+                    mark_id=marks.get((student_id, class_id)),
+                )
+            )
+
+        return results
@@ -0,0 +1,215 @@
+import io
+import csv
+import json
+
+from typing import Tuple, List, Dict, BinaryIO, Iterator, Iterable
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from api.system.schemas.schemas import MarksBulkRow
+from api.system.schemas.schemas import MarksBulkRowResult
+
+from api.marks.repositories.mark_repository import MarkRepository
+from api.users.repositories.user_repository import UserRepository
+from api.classes.repositories.class_repository import ClassRepository
+from api.students.repositories.student_repository import StudentRepository
+
+from api.marks.use_cases.create_marks_bulk_use_case import CreateMarksBulkUseCase
+
+from api.marks.validators import MarkValidator
+
+from api.utils.cache import ScopedCache
+
+from api.marks.errors.invalid_marks_file import InvalidMarksFile
+
+from api.users.errors.user_not_found import UserNotFound
+
+from api.config import Config
+
+
+class UploadMarksFileUseCase(CreateMarksBulkUseCase):
+    """
+    The Use Case containing business logic for ingesting an uploaded mark file (CSV), chunk by chunk.
+    """
+    REQUIRED_COLUMNS = ("CLASS_CODE", "REG_NO", "MARK")
+
+    def __init__(
+            self,
+            mark_repository: MarkRepository,
+            user_repository: UserRepository,
+            class_repository: ClassRepository,
+            student_repository: StudentRepository,
+            mark_validator: MarkValidator,
+            statistics_cache: ScopedCache,
+            config: Config,
+        ) -> None:
+        super().__init__(
+            mark_repository,
+            user_repository,
+            class_repository,
+            student_repository,
+            mark_validator,
+            statistics_cache,
+        )
+        self.config = config
+
+    def execute(self, file: BinaryIO, current_user: Tuple[str, bool, bool], overwrite: bool = False) -> Iterator[str]:
+        """
+        Executes the Use Case to ingest a mark file in the system.
+
+        The user & the header of the file are checked up front, the rows themselves are only read once the returned
+        iterator is consumed, `MARKS_UPLOAD_CHUNK_SIZE` rows at a time, so that the file is never held in memory.
+
+        Args:
+            file: The uploaded CSV file, in the format of the mark upload file.
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+            overwrite (default: False): Whether existing marks are replaced, i.e. when re-uploading a corrected file.
+
+        Raises:
+            UserNotFound: If the user (from the JWT) cannot be found.
+            PermissionError: If the user is not a lecturer, or an administrator.
+            InvalidMarksFile: If the file is missing a header, or any of the required columns.
+
+        Returns:
+            Iterator[str]: An iterator of NDJSON lines, containing the failed rows, progress after each chunk and a final summary.
+        """
+        user_email, is_admin, is_lecturer = current_user
+
+        user = self.user_repository.find_by_email(user_email)
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        if not (is_lecturer or is_admin):
+            raise PermissionError("Permission denied to access this resource")
+
+        text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        reader = csv.DictReader(text)
+
+        try:
+            columns = {column.strip().upper() for column in reader.fieldnames or []}
+        except UnicodeDecodeError:
+            columns = set()
+
+        missing_columns = [column for column in self.REQUIRED_COLUMNS if column not in columns]
+
+        if missing_columns:
+            text.detach()
+            raise InvalidMarksFile(f"The file is missing the following columns: {', '.join(missing_columns)}")
+
+        return self.ingest(reader, text, user.id, is_admin, overwrite)
+
+    def ingest(self, reader: csv.DictReader, text: io.TextIOWrapper, user_id: int, is_admin: bool, overwrite: bool) -> Iterator[str]:
+        try:
+            yield from self.ingest_rows(self.read_rows(reader), user_id, is_admin, overwrite)
+        finally:
+            text.detach()
+
+    def ingest_rows(self, numbered_rows: Iterable[Tuple[int, Dict[str, str]]], user_id: int, is_admin: bool, overwrite: bool) -> Iterator[str]:
+        """
+        Creates marks from rows in the format of the mark upload file, `MARKS_UPLOAD_CHUNK_SIZE` rows at a time, i.e. rows
+        which are read from an uploaded file, or converted from another format as they are read.
+
+        A chunk which the database rejects (i.e. an integrity error) is rolled back & reported as a single error, with its rows
+        counted as failed, and the summary is always the last line, even if the rows can no longer be read.
+
+        Args:
+            numbered_rows: The rows, keyed by the (upper case) column names, each paired with the row number which is reported back in errors.
+            user_id: The identifier of the requestor, used to check whether they are the lecturer of each class.
+            is_admin: Whether the requestor is an administrator, in which case they may upload marks for any class.
+            overwrite: Whether existing marks are replaced, rather than reported as errors.
+
+        Returns:
+            Iterator[str]: An iterator of NDJSON lines, containing the failed rows, progress after each chunk and a final summary.
+        """
+        processed, created, updated = 0, 0, 0
+        chunk: List[Tuple[int, Dict[str, str]]] = []
+        last_row_number = 1
+
+        try:
+            rows = iter(numbered_rows)
+
+            # Each pass reads the next chunk from the same iterator, until it is exhausted.
+            while True:
+                for row_number, row in rows:
+                    last_row_number = row_number
+                    chunk.append((row_number, row))
+
+                    if len(chunk) >= self.config.MARKS_UPLOAD_CHUNK_SIZE:
+                        break
+
+                if not chunk:
+                    break
+
+                try:
+                    results = self.create_chunk(chunk, user_id, is_admin, overwrite)
+                except SQLAlchemyError:
+                    # None of the rows of the chunk were saved, however the rows of the next chunk may still be.
+                    self.mark_repository.rollback()
+
+                    results = []
+
+                    yield self.to_line("error", {
+                        "row": chunk[0][0],
+                        "status": "database_error",
+                        "detail": f"Rows {chunk[0][0]} to {chunk[-1][0]} could not be saved, as the database rejected them",
+                    })
+
+                for result in results:
+                    if result.status == "created":
+                        created += 1
+                    elif result.status == "updated":
+                        updated += 1
+                    else:
+                        yield self.to_line("error", result.model_dump())
+
+                processed += len(chunk)
+                chunk = []
+
+                yield self.to_line("progress", {"processed": processed, "created": created, "updated": updated, "failed": processed - created - updated})
+        except (csv.Error, UnicodeDecodeError) as e:
+            yield self.to_line("error", {"row": last_row_number + 1, "status": "invalid", "detail": f"The file could not be read: {e}"})
+
+        yield self.to_line("summary", {"processed": processed, "created": created, "updated": updated, "failed": processed - created - updated})
+
+    def create_chunk(self, chunk: List[Tuple[int, Dict[str, str]]], user_id: int, is_admin: bool, overwrite: bool) -> List[MarksBulkRowResult]:
+        results: List[MarksBulkRowResult] = []
+        numbered_rows: List[Tuple[int, MarksBulkRow]] = []
+
+        for row_number, row in chunk:
+            bulk_row = self.parse_row(row)
+
+            if isinstance(bulk_row, MarksBulkRowResult):
+                bulk_row.row = row_number
+                results.append(bulk_row)
+            else:
+                numbered_rows.append((row_number, bulk_row))
+
+        return results + self.create_marks(numbered_rows, user_id, is_admin, overwrite)
+
+    def read_rows(self, reader: csv.DictReader) -> Iterator[Tuple[int, Dict[str, str]]]:
+        # The header is the first row of the file, so the data starts on the second row, which matches spreadsheet numbering.
+        for row_number, row in enumerate(reader, start=2):
+            yield row_number, {(key or "").strip().upper(): (value or "").strip() for key, value in row.items()}
+
+    def parse_row(self, row: Dict[str, str]) -> MarksBulkRow | MarksBulkRowResult:
+        class_code, reg_no = row.get("CLASS_CODE", ""), row.get("REG_NO", "")
+        mark, code = row.get("MARK", ""), row.get("MARK_CODE", "")
+
+        invalid = MarksBulkRowResult(row=0, class_code=class_code, reg_no=reg_no, status="invalid")
+
+        if not class_code or not reg_no:
+            invalid.detail = "Row doesn't contain all necessary information"
+            return invalid
+
+        if mark:
+            try:
+                mark = int(mark)
+            except ValueError:
+                invalid.detail = "Mark should be an integer"
+                return invalid
+
+        return MarksBulkRow(class_code=class_code, reg_no=reg_no, mark=mark if mark != "" else None, code=code or None)
+
+    def to_line(self, type: str, content: Dict) -> str:
+        return json.dumps({"type": type, **content}) + "\n"
@@ -0,0 +1,31 @@
+from typing import Dict, Any, Final, Set
+
+
+class MarkValidator:
+    """A utility class which validates marks & mark codes, following the rules of the mark upload file."""
+    LOWER_MARK_BOUND: Final[int] = 0
+    UPPER_MARK_BOUND: Final[int] = 100
+
+    def __init__(self) -> None:
+        self.validation_errors = {}
+
+        self.mark_codes_present: Set[str] = {"EX", "FO", "IA", "PM"}
+        self.mark_codes_absent: Set[str] = {"ABS", "EN", "UM"}
+
+    def validate_mark(self, mark: int | None, code: str | None) -> None:
+        if mark is None and not code:
+            self.validation_errors["mark"] = "Neither Mark or Code was provided"
+        elif mark is not None:
+            if not (self.LOWER_MARK_BOUND <= mark <= self.UPPER_MARK_BOUND):
+                self.validation_errors["mark"] = "Mark should be between 0 and 100"
+
+            if code and code not in self.mark_codes_present:
+                self.validation_errors["code"] = "Invalid mark code given that there is a mark. The options are: EX, FO, IA, PM"
+        elif code not in self.mark_codes_absent:
+            self.validation_errors["code"] = "A valid mark code is required if no mark is provided. The options are: ABS, EN, UM"
+
+    def validate_mark_row(self, mark: int | None, code: str | None) -> Dict[str, Any]:
+        self.validation_errors = {}
+        self.validate_mark(mark, code)
+
+        return self.validation_errors
@@ -0,0 +1,17 @@
+from typing import Any, Dict, Optional
+
+from jose import jwt, JWTError
+
+from api.middleware.decoders.token_decoder import TokenDecoder
+
+
+class JoseTokenDecoder(TokenDecoder):
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        self.secret_key = secret_key
+        self.algorithms = [algorithm]
+
+    def decode(self, token: str) -> Optional[Dict[str, Any]]:
+        try:
+            return jwt.decode(token, self.secret_key, algorithms=self.algorithms)
+        except JWTError:
+            return None
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from typing import Any, Dict, Optional
+
+
+class TokenDecoder(ABC):
+    @abstractmethod
+    def decode(self, token: str) -> Optional[Dict[str, Any]]:
+        """Verifies & decodes a JWT, returning its claims, or `None` if it is invalid, expired or corrupt."""
+        pass
@@ -1,22 +1,38 @@
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, Response
 from fastapi.security import OAuth2PasswordBearer
 
 from sqlalchemy.orm import Session
 
-from typing import Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from jose import jwt, JWTError
+from typing import Optional, Tuple
 
 from api.database import get_db
+from api.database import get_async_db
 
 from api.users.repositories.user_repository import UserRepository
 from api.roles.repositories.roles_repository import RolesRepository
 from api.classes.repositories.class_repository import ClassRepository
+from api.classes.repositories.class_statistics_repository import ClassStatisticsRepository
 from api.students.repositories.student_repository import StudentRepository
 from api.degrees.repositories.degree_repository import DegreeRepository
 from api.marks.repositories.mark_repository import MarkRepository
 from api.personal_circumstances.repositories.personal_circumstance_repostitory import PersonalCircumstanceRepository
 from api.academic_misconducts.repositories.academic_misconduct_repository import AcademicMisconductRepository
+from api.system.repositories.data_version_repository import DataVersionRepository
+
+from api.marks.statistics_cache import statistics_cache
+
+from api.middleware.token_verifier import TokenVerifier
+from api.middleware.token_verifier import create_token_decoder
+
+from api.users.tokens import REFRESH_TOKEN_TYPE
+
+from api.utils.cache import ScopedCache
+from api.utils.session_runner import SessionRunner
+from api.utils.session_runner import AsyncSessionRunner
+from api.utils.etag import make_etag
+from api.utils.etag import etag_matches
 
 from api.config import Config
 
@@ -26,6 +42,12 @@ oauth2_scheme = OAuth2PasswordBearer(
     scheme_name="JWT"
 )
 
+token_verifier = TokenVerifier(
+    create_token_decoder(Config.JWT_DECODER, Config.JWT_SECRET_KEY, Config.JWT_ALGORITHM),
+    Config.JWT_CACHE_MAXSIZE,
+    Config.JWT_CACHE_TTL_SECONDS,
+)
+
 
 def get_roles_repository(db: Session = Depends(get_db)) -> RolesRepository:
     return RolesRepository(db)
@@ -36,6 +58,9 @@ def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
 def get_class_repository(db: Session = Depends(get_db)) -> ClassRepository:
     return ClassRepository(db)
 
+def get_class_statistics_repository(db: Session = Depends(get_db)) -> ClassStatisticsRepository:
+    return ClassStatisticsRepository(db)
+
 def get_student_repository(db: Session = Depends(get_db)) -> StudentRepository:
     return StudentRepository(db)
 
@@ -51,34 +76,112 @@ def get_personal_circumstance_repository(db: Session = Depends(get_db)) -> Perso
 def get_academic_misconduct_repository(db: Session = Depends(get_db)) -> AcademicMisconductRepository:
     return AcademicMisconductRepository(db)
 
+def get_data_version_repository(db: Session = Depends(get_db)) -> DataVersionRepository:
+    return DataVersionRepository(db)
+
+def get_statistics_cache() -> ScopedCache:
+    return statistics_cache
 
-def get_current_user(token: str = Depends(oauth2_scheme)) -> Optional[Tuple[str, bool, bool]]:
+
+def get_sync_session_runner(db: Session = Depends(get_db)) -> SessionRunner:
+    return SessionRunner(db)
+
+def get_async_session_runner(db: AsyncSession = Depends(get_async_db)) -> SessionRunner:
+    return AsyncSessionRunner(db)
+
+# The runner of the `async def` (hot read) handlers, whose use cases are created from `get_session` & run with `SessionRunner.run`.
+get_session_runner = get_async_session_runner if Config.DATABASE_ASYNC else get_sync_session_runner
+
+def get_session(session_runner: SessionRunner = Depends(get_session_runner)) -> Session:
+    return session_runner.session
+
+# The repositories of the `async def` handlers, which may only be used through `SessionRunner.run`.
+
+def get_read_user_repository(db: Session = Depends(get_session)) -> UserRepository:
+    return UserRepository(db)
+
+def get_read_class_repository(db: Session = Depends(get_session)) -> ClassRepository:
+    return ClassRepository(db)
+
+def get_read_class_statistics_repository(db: Session = Depends(get_session)) -> ClassStatisticsRepository:
+    return ClassStatisticsRepository(db)
+
+def get_read_student_repository(db: Session = Depends(get_session)) -> StudentRepository:
+    return StudentRepository(db)
+
+def get_read_mark_repository(db: Session = Depends(get_session)) -> MarkRepository:
+    return MarkRepository(db)
+
+def get_read_data_version_repository(db: Session = Depends(get_session)) -> DataVersionRepository:
+    return DataVersionRepository(db)
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> Optional[Tuple[str, bool, bool]]:
     """
     Serves as the primary middleware of the application. Retrieves a user's information given a JWT token.
 
+    A token is only verified the first time it is seen, after which its claims are remembered until it expires, see `TokenVerifier`.
+
     Args:
         token: The JWT token which the information is extracted from.
 
-    Raises:
-        JWTError: If the decoding fails, a JWTError is "raised", i.e. returns None.
-
     Returns:
         Optional[Tuple[str, bool, bool]]: Returns a Tuple containing user_email, an is_admin boolean flag and a is_lecturer boolean flag. 
-                                          If a token isn't found, or if no secret key is found, or if decoding fails "None" is returned.
+                                          If a token isn't found, or if no secret key is found, or if decoding fails, or if it is a refresh token "None" is returned.
     """
     if not token:
         return None
 
-    try:
-        if Config.JWT_SECRET_KEY:
-            payload = jwt.decode(token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM])
+    if Config.JWT_SECRET_KEY:
+        payload = token_verifier.verify(token)
 
-            if payload is not None:
-                user_email = payload.get("sub")
-                is_admin = payload.get("is_admin")
-                is_lecturer = payload.get("is_lecturer")
+        # A refresh token is only accepted by the refresh endpoint. Access tokens issued before the `type` claim was added
+        # don't have one, and are accepted until they expire, so that users aren't all logged out at once.
+        if payload is not None and payload.get("type") != REFRESH_TOKEN_TYPE:
+            user_email = payload.get("sub")
+            is_admin = payload.get("is_admin")
+            is_lecturer = payload.get("is_lecturer")
 
-                return (str(user_email), bool(is_admin), bool(is_lecturer))
-        return None
-    except JWTError:
-        return None
+            return (str(user_email), bool(is_admin), bool(is_lecturer))
+    return None
+
+
+class ConditionalGet:
+    """
+    A dependency which answers conditional GET requests. The ETag of a response is derived from the versions of the tables
+    it reads, the requestor & the request itself, so that it changes whenever any of them do, without running the endpoint.
+
+    If the `If-None-Match` header of the request matches, a 304 is raised before any dependency declared after this one
+    (i.e. the use case) is created, otherwise the `ETag` header is set on the response.
+
+    Usage:
+        @router.get("/api/v1/...", dependencies=[Depends(ConditionalGet("marks", "classes"))])
+    """
+    def __init__(self, *tables: str) -> None:
+        """
+        Args:
+            tables: The names of the tables which the response is derived from.
+        """
+        self.tables = tables
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        current_user: Optional[Tuple[str, bool, bool]] = Depends(get_current_user),
+        session_runner: SessionRunner = Depends(get_session_runner),
+        data_version_repository: DataVersionRepository = Depends(get_read_data_version_repository),
+    ) -> None:
+        # Unauthenticated requests are left for the endpoint to reject.
+        if current_user is None:
+            return
+
+        versions = await session_runner.run(data_version_repository.get_versions, self.tables)
+
+        etag = make_etag(*sorted(versions.items()), *current_user, request.url.path, request.url.query)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
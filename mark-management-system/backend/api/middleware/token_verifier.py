@@ -0,0 +1,76 @@
+import time
+import hashlib
+
+from typing import Any, Dict, Optional
+
+from api.middleware.decoders.token_decoder import TokenDecoder
+from api.middleware.decoders.jose_token_decoder import JoseTokenDecoder
+from api.middleware.decoders.pyjwt_token_decoder import PyJWTTokenDecoder
+
+from api.utils.ttl_cache import TTLCache
+
+
+class TokenVerifier:
+    """
+    Verifies JWTs, remembering the claims of every verified token (by its digest, rather than the token itself) until it
+    expires, so that a token which is sent with every request is only verified once.
+
+    A token is remembered for at most `ttl` seconds, which bounds how long a token is still accepted after the secret key
+    is rotated.
+    """
+    def __init__(self, decoder: TokenDecoder, maxsize: int, ttl: float) -> None:
+        self.decoder = decoder
+        self.verified = TTLCache(maxsize, ttl)
+
+    def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verifies & decodes a JWT.
+
+        Args:
+            token: The encoded JWT.
+
+        Returns:
+            Optional[Dict[str, Any]]: The claims of the token, however can also return `None` if it is invalid, expired or corrupt.
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+
+        entry = self.verified.get(digest)
+
+        if entry is not None:
+            claims, expires_at = entry
+
+            if expires_at is None or expires_at > time.time():
+                return claims
+
+            self.verified.delete(digest)
+
+        claims = self.decoder.decode(token)
+
+        if claims is not None:
+            self.verified.set(digest, (claims, claims.get("exp")))
+
+        return claims
+
+
+def create_token_decoder(backend: str, secret_key: str, algorithm: str) -> TokenDecoder:
+    """
+    Creates the decoder of access tokens.
+
+    Args:
+        backend: The library which verifies tokens, either `jose` or `pyjwt`.
+        secret_key: The secret key which tokens are signed with.
+        algorithm: The algorithm which tokens are signed with.
+
+    Raises:
+        ValueError: If the backend is not known.
+
+    Returns:
+        TokenDecoder: The decoder of the backend.
+    """
+    if backend == "jose":
+        return JoseTokenDecoder(secret_key, algorithm)
+
+    if backend == "pyjwt":
+        return PyJWTTokenDecoder(secret_key, algorithm)
+
+    raise ValueError(f"Unknown JWT decoder: {backend}")
@@ -0,0 +1,25 @@
+import json
+import hashlib
+
+from typing import Any
+
+
+def content_hash(student_id: Any, details: str, semester: str, cat: Any, comments: str) -> str:
+    """
+    Calculates the hash of the content of a personal circumstance, which two personal circumstances share if and only
+    if they are duplicates, so that duplicates can be found through an index rather than comparing the long text columns.
+
+    Args:
+        student_id: The identifier of the student.
+        details: The details of the personal circumstance.
+        semester: The semester of the personal circumstance.
+        cat: The category of the personal circumstance.
+        comments: The comments of the personal circumstance.
+
+    Returns:
+        str: The hex encoded SHA-256 digest of the content.
+    """
+    # A JSON array keeps the boundaries between the fields, i.e. ("ab", "c") and ("a", "bc") have different hashes.
+    content = json.dumps([int(student_id), details, semester, int(cat), comments], separators=(",", ":"))
+
+    return hashlib.sha256(content.encode()).hexdigest()
@@ -5,6 +5,7 @@ from typing import Tuple, List
 from api.system.schemas import schemas
 
 from api.personal_circumstances.use_cases.create_personal_circumstance_use_case import CreatePersonalCircumstanceUseCase
+from api.personal_circumstances.use_cases.create_personal_circumstances_bulk_use_case import CreatePersonalCircumstancesBulkUseCase
 from api.personal_circumstances.use_cases.get_personal_circumstances_for_student_use_case import GetPersonalCircumstancesForStudentUseCase
 
 from api.personal_circumstances.errors.personal_circumstances_already_exist import PersonalCircumstanceAlreadyExists
@@ -17,6 +18,7 @@ from api.students.errors.student_not_found import StudentNotFound
 from api.middleware.dependencies import get_current_user
 
 from api.personal_circumstances.dependencies import create_personal_circumstance_use_case
+from api.personal_circumstances.dependencies import create_personal_circumstances_bulk_use_case
 from api.personal_circumstances.dependencies import get_personal_circumstances_for_student_use_case
 
 
@@ -68,6 +70,50 @@ def create_personal_circumstance(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@personal_circumstances.post("/api/v1/personal-circumstances/bulk", response_model=schemas.PersonalCircumstancesBulkResult)
+def create_personal_circumstances_bulk(
+    request: schemas.PersonalCircumstancesBulkCreate,
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    create_personal_circumstances_bulk_use_case: CreatePersonalCircumstancesBulkUseCase = Depends(create_personal_circumstances_bulk_use_case),
+):
+    """
+    Creates many personal circumstances in the system at once, i.e. every row of an uploaded file, within a single request.
+
+    Rows which cannot be created (e.g. the student does not exist, or the personal circumstance already exists) do not fail the request, 
+    instead they are reported back in the `results` with a `status` and a `detail`.
+
+    Args:  
+        - `request`: A `schemas.PersonalCircumstancesBulkCreate` object is required which contains a list of personal circumstances, each with the student to which it will be assigned to.  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `create_personal_circumstances_bulk_use_case`: The class which handles the business logic for bulk personal circumstances creation.   
+
+    Raises:  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If there has been a permission error.  
+        - `HTTPException`, 404: If the user from the JWT cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `response_model`: The response is in the model of the `schemas.PersonalCircumstancesBulkResult` schema, which contains the number of created & failed rows and a result per row.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        return create_personal_circumstances_bulk_use_case.execute(
+            request, current_user
+        )
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @personal_circumstances.get("/api/v1/personal-circumstances/{reg_no}", response_model=List[schemas.PersonalCircumstancesBase])
 def get_personal_circumstances_for_student(
     reg_no: str,
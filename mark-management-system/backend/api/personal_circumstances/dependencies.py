@@ -5,6 +5,7 @@ from api.middleware.dependencies import UserRepository
 from api.middleware.dependencies import StudentRepository
 
 from api.personal_circumstances.use_cases.create_personal_circumstance_use_case import CreatePersonalCircumstanceUseCase
+from api.personal_circumstances.use_cases.create_personal_circumstances_bulk_use_case import CreatePersonalCircumstancesBulkUseCase
 from api.personal_circumstances.use_cases.get_personal_circumstances_for_student_use_case import GetPersonalCircumstancesForStudentUseCase
 
 from api.middleware.dependencies import get_personal_circumstance_repository
@@ -23,6 +24,17 @@ def create_personal_circumstance_use_case(
         student_repository,
     )
 
+def create_personal_circumstances_bulk_use_case(
+        personal_circumstance_repository: PersonalCircumstanceRepository = Depends(get_personal_circumstance_repository),
+        user_repository: UserRepository = Depends(get_user_repository),
+        student_repository: StudentRepository = Depends(get_student_repository),
+    ) -> CreatePersonalCircumstancesBulkUseCase:
+    return CreatePersonalCircumstancesBulkUseCase(
+        personal_circumstance_repository, 
+        user_repository,
+        student_repository,
+    )
+
 def get_personal_circumstances_for_student_use_case(
         personal_circumstance_repository: PersonalCircumstanceRepository = Depends(get_personal_circumstance_repository),
         user_repository: UserRepository = Depends(get_user_repository),
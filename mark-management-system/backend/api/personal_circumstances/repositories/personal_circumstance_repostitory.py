@@ -1,4 +1,7 @@
-from typing import List
+from typing import List, Optional, Iterable, Set, Dict, Final
+
+from sqlalchemy import and_
+from sqlalchemy import or_
 
 from sqlalchemy.orm import Session
 
@@ -7,6 +10,14 @@ from api.system.models.models import PersonalCircumstance
 from api.system.schemas.schemas import PersonalCircumstancesCreate
 from api.system.schemas.schemas import PersonalCircumstancesBase
 
+from api.personal_circumstances.content_hash import content_hash
+
+from api.utils.upsert import dialect_insert
+
+
+# The maximum number of personal circumstances per `INSERT` statement, which keeps each statement within the bind parameter limit of SQLite.
+INSERT_BATCH_SIZE: Final[int] = 5000
+
 
 class PersonalCircumstanceRepository:
     """The repository layer which performs queries and operations on the database for `PersonalCircumstanc` objects."""
@@ -20,18 +31,69 @@ class PersonalCircumstanceRepository:
         """
         self.db = db
     
-    def add(self, personal_circumstance: PersonalCircumstancesBase) -> None:
+    def add(self, personal_circumstance: PersonalCircumstance) -> bool:
         """
-        Adds an object into the database.
+        Adds an object into the database, unless a personal circumstance with the same content already exists.
 
         Args:
             personal_circumstance: The object to be added.
+
+        Returns:
+            bool: True if the personal circumstance was added, false if it already exists, i.e. it was added concurrently.
         """
-        self.db.add(personal_circumstance)
+        return self.add_all([personal_circumstance])[0] is not None
+
+    def add_all(self, personal_circumstances: List[PersonalCircumstance]) -> List[Optional[int]]:
+        """
+        Adds a list of objects into the database with `INSERT ... ON CONFLICT DO NOTHING` on the content hash, in batches
+        within a single transaction, so that concurrent imports of the same personal circumstance only add it once. The
+        identifiers of the added personal circumstances are set on the objects.
+
+        Args:
+            personal_circumstances: The objects to be added, which must not contain duplicates of one another.
+
+        Returns:
+            List[Optional[int]]: The identifiers of the newly added personal circumstances, in the same order as the objects passed in,
+                                 where `None` is a personal circumstance which already exists.
+        """
+        if not personal_circumstances:
+            return []
+
+        for personal_circumstance in personal_circumstances:
+            self._set_content_hash(personal_circumstance)
+
+        insert = dialect_insert(self.db)
+        inserted: Dict[str, int] = {}
+
+        values = [
+            {
+                "details": personal_circumstance.details,
+                "semester": personal_circumstance.semester,
+                "cat": personal_circumstance.cat,
+                "comments": personal_circumstance.comments,
+                "student_id": personal_circumstance.student_id,
+                "content_hash": personal_circumstance.content_hash,
+            }
+            for personal_circumstance in personal_circumstances
+        ]
+
+        for start in range(0, len(values), INSERT_BATCH_SIZE):
+            statement = (insert(PersonalCircumstance)
+                .values(values[start:start + INSERT_BATCH_SIZE])
+                .on_conflict_do_nothing(index_elements=[PersonalCircumstance.content_hash])
+                .returning(PersonalCircumstance.id, PersonalCircumstance.content_hash)
+            )
+
+            inserted.update({hash_: personal_circumstance_id for personal_circumstance_id, hash_ in self.db.execute(statement)})
+
         self.db.commit()
-        self.db.refresh(personal_circumstance)
 
-    def find_by_details(self, request: PersonalCircumstancesCreate, student_id: int) -> List[PersonalCircumstance]:
+        for personal_circumstance in personal_circumstances:
+            personal_circumstance.id = inserted.get(personal_circumstance.content_hash)
+
+        return [personal_circumstance.id for personal_circumstance in personal_circumstances]
+
+    def find_by_details(self, request: PersonalCircumstancesCreate, student_id: int) -> Optional[PersonalCircumstance]:
         """
         Checks whether a given request is already in the database.
 
@@ -42,13 +104,58 @@ class PersonalCircumstanceRepository:
         Returns:
             Optional[PersonalCircumstance]: The first result from the database that matches the filter, otherwise None.
         """
-        return self.db.query(PersonalCircumstance).filter_by(
-            details=request.details,
-            semester=request.semester,
-            cat=request.cat,
-            comments=request.comments,
-            student_id=student_id,
-        ).first()
+        hash_ = content_hash(student_id, request.details, request.semester, request.cat, request.comments)
+
+        # Personal circumstances which have not been backfilled yet don't have a content hash, so they are matched by their columns.
+        return self.db.query(PersonalCircumstance).filter(or_(
+            PersonalCircumstance.content_hash == hash_,
+            and_(
+                PersonalCircumstance.content_hash.is_(None),
+                PersonalCircumstance.student_id == student_id,
+                PersonalCircumstance.details == request.details,
+                PersonalCircumstance.semester == request.semester,
+                PersonalCircumstance.cat == request.cat,
+                PersonalCircumstance.comments == request.comments,
+            ),
+        )).first()
+
+    def find_existing_content_hashes(self, content_hashes: Iterable[str], student_ids: Iterable[int]) -> Set[str]:
+        """
+        Retrieves which of the given content hashes already belong to a personal circumstance, in a single indexed query.
+
+        The personal circumstances of the given students which have not been backfilled yet (i.e. without a content hash)
+        are hashed as they are read, so that they are found as well.
+
+        Args:
+            content_hashes: The content hashes, see `content_hash`.
+            student_ids: The identifiers of the students, which the content hashes belong to.
+
+        Returns:
+            Set[str]: The content hashes which are already in the database.
+        """
+        content_hashes, student_ids = set(content_hashes), set(student_ids)
+
+        if not content_hashes:
+            return set()
+
+        existing = {
+            existing for (existing,) in self.db.query(PersonalCircumstance.content_hash)
+                .filter(PersonalCircumstance.content_hash.in_(content_hashes))
+        }
+
+        legacy_rows = (self.db.query(
+                PersonalCircumstance.student_id,
+                PersonalCircumstance.details,
+                PersonalCircumstance.semester,
+                PersonalCircumstance.cat,
+                PersonalCircumstance.comments,
+            )
+            .filter(PersonalCircumstance.content_hash.is_(None), PersonalCircumstance.student_id.in_(student_ids))
+        )
+
+        existing.update(content_hash(*row) for row in legacy_rows)
+
+        return existing & content_hashes
 
     def get_by_student_id(self, student_id: int) -> List[PersonalCircumstance]:
         """
@@ -61,3 +168,12 @@ class PersonalCircumstanceRepository:
             Optional[PersonalCircumstance]: A List[PersonalCircumstance] from the database.
         """
         return self.db.query(PersonalCircumstance).filter_by(student_id=student_id).all()
+
+    def _set_content_hash(self, personal_circumstance: PersonalCircumstance) -> None:
+        personal_circumstance.content_hash = content_hash(
+            personal_circumstance.student_id,
+            personal_circumstance.details,
+            personal_circumstance.semester,
+            personal_circumstance.cat,
+            personal_circumstance.comments,
+        )
@@ -72,6 +72,8 @@ class CreatePersonalCircumstanceUseCase:
             student_id=student.id
         )
 
-        self.personal_circumstance_repository.add(personal_circumstance)
+        # A concurrent request may have added the same personal circumstance since it was checked for above.
+        if not self.personal_circumstance_repository.add(personal_circumstance):
+            raise PersonalCircumstanceAlreadyExists("Personal Circumstance already exists")
         
         return personal_circumstance
@@ -0,0 +1,122 @@
+from typing import Tuple, List, Set
+
+from api.system.models.models import PersonalCircumstance
+
+from api.system.schemas.schemas import PersonalCircumstancesBulkCreate
+from api.system.schemas.schemas import PersonalCircumstancesBulkRowResult
+from api.system.schemas.schemas import PersonalCircumstancesBulkResult
+
+from api.personal_circumstances.repositories.personal_circumstance_repostitory import PersonalCircumstanceRepository
+from api.users.repositories.user_repository import UserRepository
+from api.students.repositories.student_repository import StudentRepository
+
+from api.personal_circumstances.content_hash import content_hash
+
+from api.users.errors.user_not_found import UserNotFound
+
+
+class CreatePersonalCircumstancesBulkUseCase:
+    """
+    The Use Case containing business logic for creating many personal circumstances at once, i.e. an uploaded file.
+    """
+    def __init__(
+            self,
+            personal_circumstance_repository: PersonalCircumstanceRepository,
+            user_repository: UserRepository,
+            student_repository: StudentRepository
+        ) -> None:
+        self.personal_circumstance_repository = personal_circumstance_repository
+        self.user_repository = user_repository
+        self.student_repository = student_repository
+
+    def execute(self, request: PersonalCircumstancesBulkCreate, current_user: Tuple[str, bool, bool]) -> PersonalCircumstancesBulkResult:
+        """
+        Executes the Use Case to create a list of personal circumstances in the system.
+
+        Registration numbers are resolved, and duplicates are found by their content hash, in one query each, and every new
+        personal circumstance is inserted in a single batch. Rows which cannot be created are reported back alongside the
+        reason, rather than failing the whole request.
+
+        Args:
+            request: A `PersonalCircumstancesBulkCreate` object is required which contains the rows of the uploaded file.
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+
+        Raises:
+            UserNotFound: If the user from the JWT token is not found.
+            PermissionError: If the user is not valid and a lecturer, or if they are not an administrator.
+
+        Returns:
+            PersonalCircumstancesBulkResult: A PersonalCircumstancesBulkResult schema object containing the number of created & failed rows, as well as a result per row.
+        """
+        user_email, is_admin, is_lecturer = current_user
+
+        user = self.user_repository.find_by_email(user_email)
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        if not ((user and is_lecturer) or is_admin):
+            raise PermissionError("Permission denied to access this resource")
+
+        rows = request.personal_circumstances
+
+        students = {reg_no: student_id for student_id, reg_no in self.student_repository.find_ids_by_reg_nos(row.reg_no for row in rows)}
+
+        content_hashes = [
+            content_hash(students[row.reg_no], row.details, row.semester, row.cat, row.comments) if row.reg_no in students else None
+            for row in rows
+        ]
+
+        # Rows repeated within the request are added to this set as they are created, so that only the first is created.
+        existing_hashes: Set[str] = self.personal_circumstance_repository.find_existing_content_hashes(
+            (hash_ for hash_ in content_hashes if hash_ is not None),
+            students.values(),
+        )
+
+        results: List[PersonalCircumstancesBulkRowResult] = []
+        new_personal_circumstances: List[PersonalCircumstance] = []
+        new_personal_circumstance_results: List[PersonalCircumstancesBulkRowResult] = []
+
+        for row_number, (row, hash_) in enumerate(zip(rows, content_hashes)):
+            result = PersonalCircumstancesBulkRowResult(
+                row=row_number,
+                reg_no=row.reg_no,
+                status="created",
+            )
+
+            results.append(result)
+
+            if hash_ is None:
+                result.status, result.detail = "student_not_found", "Student not found"
+            elif hash_ in existing_hashes:
+                result.status, result.detail = "already_exists", "Personal Circumstance already exists"
+            else:
+                existing_hashes.add(hash_)
+
+                new_personal_circumstances.append(
+                    PersonalCircumstance(
+                        details=row.details,
+                        semester=row.semester,
+                        cat=row.cat,
+                        comments=row.comments,
+                        student_id=students[row.reg_no],
+                    )
+                )
+                new_personal_circumstance_results.append(result)
+
+        personal_circumstance_ids = self.personal_circumstance_repository.add_all(new_personal_circumstances)
+
+        for result, personal_circumstance_id in zip(new_personal_circumstance_results, personal_circumstance_ids):
+            # A concurrent import may have added the same personal circumstance since the content hashes were checked.
+            if personal_circumstance_id is None:
+                result.status, result.detail = "already_exists", "Personal Circumstance already exists"
+            else:
+                result.personal_circumstance_id = personal_circumstance_id
+
+        created = sum(1 for personal_circumstance_id in personal_circumstance_ids if personal_circumstance_id is not None)
+
+        return PersonalCircumstancesBulkResult(
+            created=created,
+            failed=len(results) - created,
+            results=results,
+        )
@@ -8,6 +8,8 @@ from api.system.models.models import User
 
 from api.system.schemas.schemas import RoleUsersData
 
+from api.users.repositories.user_repository import user_cache
+
 class RolesRepository:
     """The repository layer which performs queries and operations on the database for `Roles` & `RoleUsers` objects."""
 
@@ -72,6 +74,8 @@ class RolesRepository:
         self.db.commit()
         self.db.refresh(user)
 
+        user_cache.delete(user.email_address)
+
     def remove_user(self, role_user: RoleUsers, user: User) -> None:
         """
         Removes an association from the database.
@@ -84,3 +88,5 @@ class RolesRepository:
         
         self.db.commit()
         self.db.refresh(user)
+
+        user_cache.delete(user.email_address)
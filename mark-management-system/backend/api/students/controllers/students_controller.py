@@ -1,6 +1,6 @@
-from fastapi import Depends, APIRouter, HTTPException
+from fastapi import Depends, APIRouter, HTTPException, Response
 
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 from api.system.schemas import schemas
 
@@ -9,6 +9,8 @@ from api.students.use_cases.get_student_use_case import GetStudentUseCase
 from api.students.use_cases.get_students_use_case import GetStudentsUseCase
 from api.students.use_cases.get_student_statistics_use_case import GetStudentStatisticsUseCase
 
+from api.system.errors.invalid_cursor import InvalidCursor
+
 from api.students.errors.student_already_exists import StudentAlreadyExists
 from api.students.errors.student_not_found import StudentNotFound
 
@@ -23,6 +25,8 @@ from api.students.dependencies import get_student_statistics_use_case
 
 from api.middleware.dependencies import get_current_user
 
+from api.utils.pagination import set_page_headers
+
 
 students = APIRouter()
 
@@ -120,8 +124,11 @@ def get_student(
     
 @students.get("/api/v1/students", response_model=List[schemas.StudentBase])
 def get_students(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
     get_students_use_case: GetStudentsUseCase = Depends(get_students_use_case),
 ):
@@ -133,19 +140,23 @@ def get_students(
 
     Args:
         - `skip` (default: 0): A parameter which determines how many objects to skip.  
-        - `limit` (default: 100): A parameter which determines the maximum amount of users to return.  
+        - `limit` (default: 100): A parameter which determines the maximum amount of students to return.  
+        - `cursor` (default: None): The cursor of the page to return, as given by the `X-Next-Cursor` header of the previous page.  
+        - `include_total` (default: false): Whether to include an estimate of the total number of students in the `X-Total-Estimate` header.  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
         - `get_students_use_case`: The class which handles the business logic for retrieving all students.
 
     Raises:  
         - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 400: If the `cursor` is malformed.  
         - `HTTPException`, 403: If there has been a permission error.  
         - `HTTPException`, 404: If the user (lecturer) from the JWT has not been found, or if the student is not found.  
         - `HTTPException`, 500: If any other system exception occurs.  
 
     Returns:  
         - `response_model`: The response is in the model of the `schemas.StudentBase` schema, which contains a limited amount of information about the student.
+                             The `X-Next-Cursor` header is set if there is a next page.  
     """
     if current_user is None:
         raise HTTPException(
@@ -154,7 +165,12 @@ def get_students(
         )    
 
     try:
-        return get_students_use_case.execute(skip, limit, current_user)
+        page = get_students_use_case.execute(skip, limit, current_user, cursor, include_total)
+        set_page_headers(response, page)
+
+        return page.items
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except StudentNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except UserNotFound as e:
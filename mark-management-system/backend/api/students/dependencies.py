@@ -2,7 +2,7 @@ from fastapi import Depends
 
 from api.middleware.dependencies import StudentRepository
 from api.middleware.dependencies import UserRepository
-from api.middleware.dependencies import ClassRepository
+from api.middleware.dependencies import ScopedCache
 
 from api.students.use_cases.create_student_use_case import CreateStudentUseCase
 from api.students.use_cases.get_student_use_case import GetStudentUseCase
@@ -11,7 +11,7 @@ from api.students.use_cases.get_student_statistics_use_case import GetStudentSta
 
 from api.middleware.dependencies import get_student_repository
 from api.middleware.dependencies import get_user_repository
-from api.middleware.dependencies import get_class_repository
+from api.middleware.dependencies import get_statistics_cache
 
 
 def create_student_use_case(
@@ -26,12 +26,10 @@ def create_student_use_case(
 def get_student_use_case(
         student_repository: StudentRepository = Depends(get_student_repository),
         user_repository: UserRepository = Depends(get_user_repository),
-        class_repository: ClassRepository = Depends(get_class_repository),
     ) -> GetStudentUseCase:
     return GetStudentUseCase(
         student_repository,
-        user_repository, 
-        class_repository
+        user_repository
     )
 
 def get_students_use_case(
@@ -45,9 +43,11 @@ def get_students_use_case(
 
 def get_student_statistics_use_case(
         student_repository: StudentRepository = Depends(get_student_repository),
-        user_repository: UserRepository = Depends(get_user_repository)
+        user_repository: UserRepository = Depends(get_user_repository),
+        statistics_cache: ScopedCache = Depends(get_statistics_cache),
     ) -> GetStudentStatisticsUseCase:
     return GetStudentStatisticsUseCase(
         student_repository,
-        user_repository, 
+        user_repository,
+        statistics_cache,
     )
@@ -1,15 +1,25 @@
-from typing import List, Optional
+from typing import List, Optional, Iterable
+
+from sqlalchemy.engine import Row
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from api.system.models.models import Student
 from api.system.models.models import Class
 from api.system.models.models import Marks
 from api.system.models.models import Degree
+from api.system.models.models import AcademicMisconduct
 
 from api.system.schemas.schemas import StudentBase
 from api.system.schemas.schemas import StudentStatistics
 
+from api.system.repositories.data_version_repository import DataVersionRepository
+
+from api.utils.pagination import keyset
+from api.utils.pagination import estimate_count
+
 
 class StudentRepository:
     """The repository layer which performs queries and operations on the database for `Student` objects."""
@@ -22,6 +32,7 @@ class StudentRepository:
             db: The database session.
         """
         self.db = db
+        self.data_version_repository = DataVersionRepository(db)
     
     def add(self, student: Student) -> None:
         """
@@ -31,6 +42,7 @@ class StudentRepository:
             student: The object to be added.
         """
         self.db.add(student)
+        self.data_version_repository.bump(Student.__tablename__)
         self.db.commit()
         self.db.refresh(student)
 
@@ -46,6 +58,83 @@ class StudentRepository:
         """
         return self.db.query(Student).filter_by(reg_no=reg_no).first()
 
+    def find_profile_by_reg_no(self, reg_no: str) -> Optional[Student]:
+        """
+        Retrieves a student by a given registration number, alongside everything shown on their profile, i.e. their degree,
+        personal circumstances, classes and academic misconducts, in three queries rather than one per relationship (and class).
+
+        Args:
+            reg_no: The registration number.
+        
+        Returns:
+            Optional[Student]: A `Student` object from the database, however can also return `None` if not found.
+        """
+        return (self.db.query(Student)
+            .options(
+                joinedload(Student.degree),
+                joinedload(Student.personal_circumstances),
+                selectinload(Student.classes),
+                selectinload(Student.academic_misconducts).joinedload(AcademicMisconduct.class_),
+            )
+            .filter_by(reg_no=reg_no)
+            .first()
+        )
+
+    def find_by_reg_nos(self, reg_nos: Iterable[str]) -> List[Student]:
+        """
+        Retrieves every student matching one of the given registration numbers, in a single query.
+
+        Args:
+            reg_nos: The registration numbers.
+        
+        Returns:
+            List[Student]: A list of `Student`(s) from the database, registration numbers which do not exist are simply not present in the result.
+        """
+        reg_nos = set(reg_nos)
+
+        if not reg_nos:
+            return []
+
+        return self.db.query(Student).filter(Student.reg_no.in_(reg_nos)).all()
+
+    def find_ids_by_reg_nos(self, reg_nos: Iterable[str]) -> List[Row]:
+        """
+        Retrieves the identifiers of every student matching one of the given registration numbers, in a single query, without loading the students.
+
+        Args:
+            reg_nos: The registration numbers.
+        
+        Returns:
+            List[Row]: A list of rows containing the `id` and `reg_no` of each student, registration numbers which do not exist are simply not present in the result.
+        """
+        reg_nos = set(reg_nos)
+
+        if not reg_nos:
+            return []
+
+        return self.db.query(Student.id, Student.reg_no).filter(Student.reg_no.in_(reg_nos)).all()
+
+    def find_details_by_reg_nos(self, reg_nos: Iterable[str]) -> List[Row]:
+        """
+        Retrieves the name & degree of every student matching one of the given registration numbers, in a single query, without loading the students.
+
+        Args:
+            reg_nos: The registration numbers.
+        
+        Returns:
+            List[Row]: A list of rows containing the `reg_no`, `student_name`, `degree_level` and `degree_name` of each student, registration numbers which do not exist are simply not present in the result.
+        """
+        reg_nos = set(reg_nos)
+
+        if not reg_nos:
+            return []
+
+        return (self.db.query(Student.reg_no, Student.student_name, Degree.level.label("degree_level"), Degree.name.label("degree_name"))
+            .join(Degree, Degree.id == Student.degree_id)
+            .filter(Student.reg_no.in_(reg_nos))
+            .all()
+        )
+
     def find_by_id(self, student_id: int) -> Optional[Student]:
         """
         Retrieves a class by a given student id.
@@ -58,18 +147,28 @@ class StudentRepository:
         """
         return self.db.query(Student).filter_by(id=student_id).first()
 
-    def get_students(self, skip: int, limit: int) -> List[StudentBase]:
+    def get_students(self, skip: int, limit: int, after_id: Optional[int] = None) -> List[StudentBase]:
         """
-        Retrieves a list of classes, given a skip and a limit.
+        Retrieves a list of students ordered by their identifier, given a skip, a limit and optionally a cursor.
 
         Args:
             skip: The amount to skip.
-            limit: The maximum number of items to be retrieved.
+            limit: The maximum number of items to be retrieved, one more is returned if there is a next page.
+            after_id (default: None): The identifier of the last student of the previous page.
         
         Returns:
             List[Student]: A list of `Student`(s) from the database, however can also return `[]` if none are found.
         """
-        return self.db.query(Student).offset(skip).limit(limit).all()
+        return keyset(self.db.query(Student), Student.id, after_id, skip, limit).all()
+
+    def estimate_students(self) -> int:
+        """
+        Estimates the number of students in the system.
+
+        Returns:
+            int: The (estimated) number of students.
+        """
+        return estimate_count(self.db, Student.__tablename__, self.db.query(Student))
 
     def get_marks_and_details_for_student(self, reg_no: str) -> List[StudentStatistics]:
         """
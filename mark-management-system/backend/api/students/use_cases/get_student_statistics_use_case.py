@@ -5,6 +5,10 @@ from api.system.schemas.schemas import StudentStatistics
 from api.students.repositories.student_repository import StudentRepository
 from api.users.repositories.user_repository import UserRepository
 
+from api.marks.statistics_cache import student_scope
+
+from api.utils.cache import ScopedCache
+
 from api.users.errors.user_not_found import UserNotFound
 
 
@@ -12,9 +16,10 @@ class GetStudentStatisticsUseCase:
     """
     The Use Case containing business logic for calculating a student's statistics.
     """
-    def __init__(self, student_repository: StudentRepository, user_repository: UserRepository) -> None:
+    def __init__(self, student_repository: StudentRepository, user_repository: UserRepository, statistics_cache: ScopedCache) -> None:
         self.student_repository = student_repository
         self.user_repository = user_repository
+        self.statistics_cache = statistics_cache
         self.pass_rate = 40
     
     def execute(self, reg_no: str, current_user: Tuple[str, bool, bool]) -> StudentStatistics:
@@ -37,7 +42,10 @@ class GetStudentStatisticsUseCase:
 
         if user is None:
             raise UserNotFound("User not found")
-        
+
+        return self.statistics_cache.get_or_compute(student_scope(reg_no), "statistics", lambda: self.calculate_statistics(reg_no))
+
+    def calculate_statistics(self, reg_no: str) -> StudentStatistics:
         marks_for_student = self.student_repository.get_marks_and_details_for_student(reg_no)
 
         marks = [mark[7] for mark in marks_for_student if mark[7] is not None and marks_for_student]
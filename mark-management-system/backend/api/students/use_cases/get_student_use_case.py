@@ -1,4 +1,4 @@
-from typing import Tuple, List
+from typing import Tuple, List, Dict
 
 from api.system.models.models import Student
 from api.system.models.models import Degree
@@ -12,7 +12,6 @@ from api.system.schemas.schemas import PersonalCircumstancesBase
 
 from api.students.repositories.student_repository import StudentRepository
 from api.users.repositories.user_repository import UserRepository
-from api.classes.repositories.class_repository import ClassRepository
 
 from api.students.errors.student_not_found import StudentNotFound
 
@@ -23,10 +22,9 @@ class GetStudentUseCase:
     """
     The Use Case containing business logic for retrieving a student.
     """
-    def __init__(self, student_repository: StudentRepository, user_repository: UserRepository, class_repository: ClassRepository) -> None:
+    def __init__(self, student_repository: StudentRepository, user_repository: UserRepository) -> None:
         self.student_repository = student_repository
         self.user_repository = user_repository
-        self.class_repository = class_repository
     
     def execute(self, reg_no: str, current_user: Tuple[str, bool, bool]) -> StudentSchema:
         """
@@ -54,7 +52,7 @@ class GetStudentUseCase:
         if not ((user and is_lecturer) or is_admin):
             raise PermissionError("Permission denied to access this resource")
         
-        student = self.student_repository.find_by_reg_no(reg_no)
+        student = self.student_repository.find_profile_by_reg_no(reg_no)
 
         if student is None:
             raise StudentNotFound("Student not found")
@@ -71,40 +69,38 @@ class GetStudentUseCase:
         )
 
     def construct_classes_with_academic_misconduct(self, student: Student) -> List[ClassWithMisconduct]:
+        academic_misconducts_by_class: Dict[int, List[AcademicMisconductCreate]] = {}
+
+        # Only the misconducts of the student are loaded, rather than every misconduct of each of their classes.
+        for misconduct in student.academic_misconducts:
+            academic_misconducts_by_class.setdefault(misconduct.class_id, []).append(
+                AcademicMisconductCreate(
+                    reg_no=student.reg_no,
+                    class_code=misconduct.class_.code if misconduct.class_ else "",
+                    date=misconduct.date,
+                    outcome=misconduct.outcome,
+                )
+            )
+
         classes_with_academic_misconduct = []
 
         for class_ in student.classes:
-            academic_misconducts = []
-
-            for misconduct in class_.academic_misconducts:
-                if misconduct.student_id == student.id:
-                    class_ = self.class_repository.find_by_id(misconduct.class_id)
-
-                    misconduct_item = AcademicMisconductCreate(
-                        reg_no=student.reg_no,
-                        class_code=class_.code,
-                        date=misconduct.date,
-                        outcome=misconduct.outcome,
-                    )
-
-                    academic_misconducts.append(misconduct_item)
-            
             class_with_misconduct = ClassWithMisconduct(
                 name=class_.name,
                 code=class_.code,
                 credit=class_.credit,
                 credit_level=class_.credit_level,
-                academic_misconducts=academic_misconducts
+                academic_misconducts=academic_misconducts_by_class.get(class_.id, [])
             )
         
             classes_with_academic_misconduct.append(class_with_misconduct)
 
         return classes_with_academic_misconduct
 
-    def construct_personal_circumstances(self, personal_circumstances: PersonalCircumstance) -> List[PersonalCircumstancesBase]:
+    def construct_personal_circumstances(self, circumstances: List[PersonalCircumstance]) -> List[PersonalCircumstancesBase]:
         personal_circumstances = []
 
-        for circumstance in personal_circumstances:
+        for circumstance in circumstances:
             personal_circumstance = PersonalCircumstancesBase(
                 details=circumstance.details,
                 semester=circumstance.semester,
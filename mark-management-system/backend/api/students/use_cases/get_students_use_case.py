@@ -1,6 +1,4 @@
-from typing import Tuple, List
-
-from api.system.schemas.schemas import StudentBase
+from typing import Tuple, Optional
 
 from api.students.repositories.student_repository import StudentRepository
 from api.users.repositories.user_repository import UserRepository
@@ -9,6 +7,10 @@ from api.students.errors.student_not_found import StudentNotFound
 
 from api.users.errors.user_not_found import UserNotFound
 
+from api.utils.pagination import Page
+from api.utils.pagination import build_page
+from api.utils.pagination import decode_cursor
+
 
 class GetStudentsUseCase:
     """
@@ -18,20 +20,32 @@ class GetStudentsUseCase:
         self.student_repository = student_repository
         self.user_repository = user_repository
     
-    def execute(self, skip: int, limit: int, current_user: Tuple[str, bool, bool]) -> List[StudentBase]:
+    def execute(
+            self,
+            skip: int,
+            limit: int,
+            current_user: Tuple[str, bool, bool],
+            cursor: Optional[str] = None,
+            include_total: bool = False,
+        ) -> Page:
         """
         Executes the Use Case to retrieve all students from the system.
 
         Args:
+            skip: The amount to skip.
+            limit: The maximum number of items to be retrieved.
             current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+            cursor (default: None): The cursor of the page to retrieve, as returned with the previous page.
+            include_total (default: False): Whether to include an estimate of the total number of students.
 
         Raises:
+            InvalidCursor: If the cursor is malformed.
             PermissionError: If the user is not a user and a lecturer, or an administrator.
             StudentNotFound: If the student cannot be found, given the identifier.
             UserNotFound: If the user (from the JWT) cannot be found.
         
         Returns:
-            StudentBase: A List of StudentBase schema objects containing information about the student.
+            Page: A page of StudentBase schema objects containing information about the students, and the cursor of the next page.
         """
         user_email, is_admin, is_lecturer = current_user
 
@@ -43,9 +57,11 @@ class GetStudentsUseCase:
         if not ((user and is_lecturer) or is_admin):
             raise PermissionError("Permission denied to access this resource")
         
-        students = self.student_repository.get_students(skip, limit)
+        students = self.student_repository.get_students(skip, limit, decode_cursor(cursor))
 
         if not students:
             raise StudentNotFound("Students not found")
 
-        return students
+        total_estimate = self.student_repository.estimate_students() if include_total else None
+
+        return build_page(students, limit, lambda student: student.id, total_estimate)
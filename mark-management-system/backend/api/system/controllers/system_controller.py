@@ -0,0 +1,54 @@
+from fastapi import Depends, APIRouter, HTTPException
+
+from typing import Tuple
+
+from api.system.schemas import schemas
+
+from api.system.use_cases.get_database_metrics_use_case import GetDatabaseMetricsUseCase
+
+from api.system.dependencies import get_database_metrics_use_case
+
+from api.middleware.dependencies import get_current_user
+
+
+system = APIRouter()
+
+
+@system.get("/api/v1/system/metrics/database", response_model=schemas.DatabasePoolMetrics)
+def get_database_metrics(
+    current_user: Tuple[str, bool, bool] = Depends(get_current_user),
+    get_database_metrics_use_case: GetDatabaseMetricsUseCase = Depends(get_database_metrics_use_case),
+):
+    """
+    Retrieves metrics of the database connection pool, i.e. how saturated it is and how long requests wait for a connection.    
+
+    **Note**: This feature is endpoint-only for now, no frontend exists for it.    
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
+                      The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
+        - `get_database_metrics_use_case`: The class which handles the business logic for retrieving the metrics of the connection pool.   
+
+    Raises:  
+        - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 403: If there has been a permission error, i.e. if the `is_admin` flag is false.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `response_model`: The response is in the model of the `schemas.DatabasePoolMetrics` schema, which contains the state of the pool and the checkout wait times.  
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid JWT provided",
+        )
+
+    try:
+        return get_database_metrics_use_case.execute(current_user)
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,12 @@
+from api.database import engine
+
+from api.system.use_cases.get_database_metrics_use_case import GetDatabaseMetricsUseCase
+
+from api.utils.pool_metrics import pool_metrics
+
+
+def get_database_metrics_use_case() -> GetDatabaseMetricsUseCase:
+    return GetDatabaseMetricsUseCase(
+        engine,
+        pool_metrics
+    )
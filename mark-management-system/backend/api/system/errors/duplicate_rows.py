@@ -0,0 +1,12 @@
+class DuplicateRows(Exception):
+    """
+    A custom subclass exception, raised when a unique index cannot be created on an existing table,
+    as some of its rows are duplicates of one another, which must be resolved by hand first.
+
+    Args:
+        message: A parameter which allows for a custom error message.
+    """
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+        super().__init__(message)
@@ -0,0 +1,10 @@
+class InvalidCursor(Exception):
+    """
+    A custom subclass exception, raised when a pagination cursor cannot be decoded,
+    i.e. if it has been modified, or was not issued by the system.
+
+    Args:
+        message: A parameter which allows for a custom error message.
+    """
+    def __init__(self, message: str) -> None:
+        self.message = message
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date
+from sqlalchemy import Column, Integer, BigInteger, String, ForeignKey, Date, JSON, Index
 
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
@@ -82,6 +82,29 @@ class Class(Base):
     students = relationship("Student", secondary="marks", back_populates="classes")
     degrees = relationship("Degree", secondary="degree_classes", back_populates="classes")
 
+    statistics = relationship("ClassStatistics", back_populates="class_", uselist=False, cascade="all, delete-orphan")
+
+class ClassStatistics(Base):
+    __tablename__ = "class_statistics"
+
+    class_id = Column(Integer, ForeignKey("classes.id", ondelete="CASCADE"), primary_key=True)
+
+    row_count = Column(Integer, nullable=False, default=0)
+    mark_count = Column(Integer, nullable=False, default=0)
+    mark_sum = Column(BigInteger, nullable=False, default=0)
+    mark_sum_of_squares = Column(BigInteger, nullable=False, default=0)
+    pass_count = Column(Integer, nullable=False, default=0)
+
+    first_bucket = Column(Integer, nullable=False, default=0)
+    second_bucket = Column(Integer, nullable=False, default=0)
+    third_bucket = Column(Integer, nullable=False, default=0)
+    fourth_bucket = Column(Integer, nullable=False, default=0)
+    fifth_bucket = Column(Integer, nullable=False, default=0)
+
+    histogram = Column(JSON, nullable=False, default=dict)
+
+    class_ = relationship("Class", back_populates="statistics")
+
 class Marks(Base):
     __tablename__ = "marks"
 
@@ -93,6 +116,11 @@ class Marks(Base):
     class_id = Column(Integer, ForeignKey("classes.id"), index=True)
     student_id = Column(Integer, ForeignKey("students.id"), index=True)
 
+    # A student has at most one mark per class, which is also the conflict target of `MarkRepository.upsert_all`.
+    __table_args__ = (
+        Index("ix_marks_student_id_class_id", "student_id", "class_id", unique=True),
+    )
+
 class DegreeClasses(Base):
     __tablename__ = "degree_classes"
 
@@ -111,6 +139,10 @@ class PersonalCircumstance(Base):
     cat = Column(Integer, nullable=False)
     comments = Column(String(256), nullable=False)
 
+    # The `content_hash` of the student, details, semester, category & comments, which is how duplicates are found & prevented.
+    # The hash of personal circumstances which were added before it existed is backfilled when the app starts, see `upgrade_schema`.
+    content_hash = Column(String(64), index=True, unique=True)
+
     student_id = Column(Integer, ForeignKey("students.id"), index=True)
 
     student = relationship("Student", back_populates="personal_circumstances")
@@ -128,3 +160,9 @@ class AcademicMisconduct(Base):
 
     student = relationship("Student", back_populates="academic_misconducts")
     class_ = relationship("Class", back_populates="academic_misconducts")
+
+class DataVersion(Base):
+    __tablename__ = "data_versions"
+
+    name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
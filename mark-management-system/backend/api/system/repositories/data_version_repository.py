@@ -0,0 +1,59 @@
+from typing import Dict, Iterable
+
+from sqlalchemy.orm import Session
+
+from api.system.models.models import DataVersion
+
+from api.utils.upsert import dialect_insert
+
+
+class DataVersionRepository:
+    """
+    The repository layer which performs queries and operations on the database for `DataVersion` objects, a counter per
+    table which is incremented whenever the table is written to, i.e. to tell whether a cached response is still valid.
+    """
+
+    def __init__(self, db: Session) -> None:
+        """
+        Initializes the repository with a databance instance via Dependency Inversion.
+
+        Args:
+            db: The database session.
+        """
+        self.db = db
+
+    def get_versions(self, names: Iterable[str]) -> Dict[str, int]:
+        """
+        Retrieves the versions of tables, in a single query.
+
+        Args:
+            names: The names of the tables.
+
+        Returns:
+            Dict[str, int]: A dictionary of each table & its version, where a table which has never been written to is at version 0.
+        """
+        names = list(names)
+        versions = dict(self.db.query(DataVersion.name, DataVersion.version).filter(DataVersion.name.in_(names)))
+
+        return {name: versions.get(name, 0) for name in names}
+
+    def bump(self, *names: str) -> None:
+        """
+        Increments the versions of tables. The changes are not committed, so that they are committed alongside the write
+        itself (which also means that concurrent writes to a table wait on each other to increment its version).
+
+        The version is incremented with `INSERT ... ON CONFLICT DO UPDATE`, so that the first concurrent writes to a table
+        don't both try to create its row.
+
+        Args:
+            names: The names of the tables.
+        """
+        insert = dialect_insert(self.db)
+
+        for name in names:
+            statement = insert(DataVersion).values(name=name, version=1)
+
+            self.db.execute(statement.on_conflict_do_update(
+                index_elements=[DataVersion.name],
+                set_={"version": DataVersion.version + 1},
+            ))
@@ -0,0 +1,158 @@
+from typing import Final, Iterable
+
+from sqlalchemy import func
+from sqlalchemy import inspect
+from sqlalchemy import text
+
+from sqlalchemy.engine import Engine
+
+from sqlalchemy.orm import Session
+
+from sqlalchemy.schema import Index
+
+from api.system.models.models import Marks
+from api.system.models.models import PersonalCircumstance
+
+from api.personal_circumstances.content_hash import content_hash
+
+from api.system.errors.duplicate_rows import DuplicateRows
+
+
+# `Base.metadata.create_all` only creates the tables which don't exist yet, so the indexes (and columns) which were added
+# to existing tables are created here instead, every time the app starts. Each step checks whether it has already been
+# applied first, so that starting the app against an up to date database only costs a few catalog queries.
+
+
+# The number of personal circumstances whose content hash is backfilled per transaction.
+BACKFILL_BATCH_SIZE: Final[int] = 1000
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Brings the tables of an existing database up to date with the models, after `Base.metadata.create_all`.
+
+    Args:
+        engine: The engine of the database.
+
+    Raises:
+        DuplicateRows: If a unique index cannot be created, as some rows are duplicates of one another.
+    """
+    create_marks_unique_index(engine)
+    upgrade_personal_circumstances(engine)
+
+def create_marks_unique_index(engine: Engine) -> None:
+    """
+    Creates the unique index on `marks(student_id, class_id)`, which `MarkRepository.upsert_all` relies on, unless it exists.
+
+    Args:
+        engine: The engine of the database.
+
+    Raises:
+        DuplicateRows: If a student has more than one mark for a class.
+    """
+    index = _unique_index(Marks.__table__.indexes)
+
+    if _has_index(engine, Marks.__tablename__, index.name):
+        return
+
+    with Session(engine) as db:
+        duplicates = (db.query(Marks.student_id, Marks.class_id, func.count())
+            .group_by(Marks.student_id, Marks.class_id)
+            .having(func.count() > 1)
+            .all()
+        )
+
+    if duplicates:
+        raise DuplicateRows(
+            f"Cannot create the unique index {index.name}, as {len(duplicates)} student(s) have more than one mark for a class: "
+            + ", ".join(f"student {student_id} has {count} marks for class {class_id}" for student_id, class_id, count in duplicates)
+        )
+
+    index.create(bind=engine, checkfirst=True)
+
+def upgrade_personal_circumstances(engine: Engine) -> None:
+    """
+    Adds the `content_hash` column of personal circumstances, calculates the hash of every personal circumstance which is
+    missing one & creates the unique index on it, which `PersonalCircumstanceRepository.add_all` relies on. The index on
+    `content_hash` was not unique at first, so it is replaced.
+
+    Args:
+        engine: The engine of the database.
+
+    Raises:
+        DuplicateRows: If personal circumstances are duplicates of one another, i.e. they have the same content hash.
+    """
+    table = PersonalCircumstance.__table__
+    column = table.c.content_hash
+
+    if column.name not in {existing["name"] for existing in inspect(engine).get_columns(table.name)}:
+        with engine.begin() as connection:
+            connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(engine.dialect)}"))
+
+    index = _unique_index(table.indexes)
+
+    for existing in inspect(engine).get_indexes(table.name):
+        if existing["name"] == index.name and not existing["unique"]:
+            with engine.begin() as connection:
+                connection.execute(text(f"DROP INDEX {index.name}"))
+
+    if _has_index(engine, table.name, index.name):
+        return
+
+    backfill_content_hashes(engine)
+
+    with Session(engine) as db:
+        duplicates = (db.query(func.min(PersonalCircumstance.id), func.count())
+            .group_by(PersonalCircumstance.content_hash)
+            .having(func.count() > 1)
+            .all()
+        )
+
+    if duplicates:
+        raise DuplicateRows(
+            f"Cannot create the unique index {index.name}, as {len(duplicates)} personal circumstance(s) have duplicates: "
+            + ", ".join(f"personal circumstance {personal_circumstance_id} has {count - 1} duplicate(s)" for personal_circumstance_id, count in duplicates)
+        )
+
+    index.create(bind=engine, checkfirst=True)
+
+def backfill_content_hashes(engine: Engine) -> int:
+    """
+    Calculates the content hash of every personal circumstance which is missing one, in batches of `BACKFILL_BATCH_SIZE`.
+
+    Args:
+        engine: The engine of the database.
+
+    Returns:
+        int: The number of personal circumstances which were backfilled.
+    """
+    backfilled = 0
+
+    with Session(engine) as db:
+        while True:
+            personal_circumstances = (db.query(PersonalCircumstance)
+                .filter(PersonalCircumstance.content_hash.is_(None))
+                .limit(BACKFILL_BATCH_SIZE)
+                .all()
+            )
+
+            if not personal_circumstances:
+                return backfilled
+
+            for personal_circumstance in personal_circumstances:
+                personal_circumstance.content_hash = content_hash(
+                    personal_circumstance.student_id,
+                    personal_circumstance.details,
+                    personal_circumstance.semester,
+                    personal_circumstance.cat,
+                    personal_circumstance.comments,
+                )
+
+            db.commit()
+            backfilled += len(personal_circumstances)
+
+def _unique_index(indexes: Iterable[Index]) -> Index:
+    return next(index for index in indexes if index.unique)
+
+def _has_index(engine: Engine, table_name: str, index_name: str) -> bool:
+    return any(index["name"] == index_name for index in inspect(engine).get_indexes(table_name))
@@ -63,6 +63,50 @@ class Marks(MarksBase):
     class Config:
         from_attributes = True
 
+class MarksBulkRow(BaseModel):
+    class_code: str
+    reg_no: str
+
+    mark: int | None = None
+    code: str | None = None
+
+class MarksBulkCreate(BaseModel):
+    marks: List[MarksBulkRow]
+
+    overwrite: bool = False
+
+class MarksBulkRowResult(BaseModel):
+    row: int
+
+    class_code: str
+    reg_no: str
+    status: str
+    detail: str | None = None
+
+    mark_id: int | None = None
+
+class MarksBulkResult(BaseModel):
+    created: int
+    updated: int = 0
+    failed: int
+
+    results: List[MarksBulkRowResult] = []
+
+class MarksResolveRow(BaseModel):
+    class_code: str
+    reg_no: str
+
+class MarksResolve(BaseModel):
+    rows: List[MarksResolveRow]
+
+class MarksResolveResult(BaseModel):
+    class_code: str
+    reg_no: str
+
+    class_id: int | None = None
+    student_id: int | None = None
+    mark_id: int | None = None
+
 class MarksStatistics(BaseModel):
     mean: int
     median: int
@@ -117,6 +161,13 @@ class UserLogin(BaseModel):
     email_address: str
     password: str
 
+class TokenRefresh(BaseModel):
+    refresh_token: str
+
+class AccessToken(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+
 class UserEdit(BaseModel):
     id: int
     
@@ -196,6 +247,31 @@ class AcademicMisconduct(AcademicMisconductBase):
     class Config:
         orm_mode = True
 
+class AcademicMisconductBulkRow(BaseModel):
+    date: str
+    outcome: str
+    reg_no: str
+    class_code: str
+
+class AcademicMisconductBulkCreate(BaseModel):
+    academic_misconducts: List[AcademicMisconductBulkRow]
+
+class AcademicMisconductBulkRowResult(BaseModel):
+    row: int
+
+    reg_no: str
+    class_code: str
+    status: str
+    detail: str | None = None
+
+    academic_misconduct_id: int | None = None
+
+class AcademicMisconductBulkResult(BaseModel):
+    created: int
+    failed: int
+
+    results: List[AcademicMisconductBulkRowResult] = []
+
 
 class ClassWithMisconduct(ClassBase):
     academic_misconducts: List[AcademicMisconductCreate] | None
@@ -215,6 +291,24 @@ class PersonalCircumstances(PersonalCircumstancesBase):
     class Config:
         orm_mode = True
 
+class PersonalCircumstancesBulkCreate(BaseModel):
+    personal_circumstances: List[PersonalCircumstancesCreate]
+
+class PersonalCircumstancesBulkRowResult(BaseModel):
+    row: int
+
+    reg_no: str
+    status: str
+    detail: str | None = None
+
+    personal_circumstance_id: int | None = None
+
+class PersonalCircumstancesBulkResult(BaseModel):
+    created: int
+    failed: int
+
+    results: List[PersonalCircumstancesBulkRowResult] = []
+
 class StudentBase(BaseModel):
     reg_no: str
     student_name: str
@@ -267,6 +361,18 @@ class UserDetails(UserBase):
     class Config:
         from_attributes = True
 
+class DatabasePoolMetrics(BaseModel):
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    saturation: float
+
+    checkouts: int
+    checkout_timeouts: int
+    checkout_wait_mean_ms: float
+    checkout_wait_max_ms: float
+
 
 User.model_rebuild()
 Class.model_rebuild()
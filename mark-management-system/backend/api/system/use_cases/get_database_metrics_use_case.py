@@ -0,0 +1,58 @@
+from typing import Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from api.system.schemas.schemas import DatabasePoolMetrics
+
+from api.utils.pool_metrics import PoolMetrics
+
+
+class GetDatabaseMetricsUseCase:
+    """
+    The Use Case containing business logic for retrieving metrics of the database connection pool.
+    """
+    def __init__(self, engine: Engine, pool_metrics: PoolMetrics) -> None:
+        self.engine = engine
+        self.pool_metrics = pool_metrics
+
+    def execute(self, current_user: Tuple[str, bool, bool]) -> DatabasePoolMetrics:
+        """
+        Executes the Use Case to retrieve metrics of the database connection pool.
+
+        The saturation is the share of the connections the pool may open (including overflow) which are checked out, i.e.
+        once it reaches 1, requests wait for a connection.
+
+        Args:
+            current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+
+        Raises:
+            PermissionError: If the requestor is not an administrator.
+
+        Returns:
+            DatabasePoolMetrics: A `DatabasePoolMetrics` schematic object, containing the state of the pool & the checkout counters.
+        """
+        _, is_admin, _ = current_user
+
+        if is_admin is False:
+            raise PermissionError("Permission denied to access this resource")
+
+        pool = self.engine.pool
+
+        # Pools other than a `QueuePool` (i.e. of an in-memory SQLite database) do not have a size, nor any overflow.
+        if isinstance(pool, QueuePool):
+            pool_size, max_overflow = pool.size(), max(pool._max_overflow, 0)
+            checked_out, overflow = pool.checkedout(), max(pool.overflow(), 0)
+        else:
+            pool_size, max_overflow, checked_out, overflow = 0, 0, 0, 0
+
+        capacity = pool_size + max_overflow
+
+        return DatabasePoolMetrics(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            checked_out=checked_out,
+            overflow=overflow,
+            saturation=checked_out / capacity if capacity else 0.0,
+            **self.pool_metrics.snapshot(),
+        )
@@ -1,22 +1,26 @@
-from fastapi import Depends, APIRouter, HTTPException
+from fastapi import Depends, APIRouter, HTTPException, Response
 from fastapi.security import OAuth2PasswordRequestForm
 
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 from api.system.schemas import schemas
 
 from api.users.use_cases.create_user_use_case import CreateUserUseCase
 from api.users.use_cases.login_user_use_case import LoginUserUseCase
+from api.users.use_cases.refresh_access_token_use_case import RefreshAccessTokenUseCase
 from api.users.use_cases.get_users_use_case import GetUsersUseCase
 from api.users.use_cases.get_user_use_case import GetUserUseCase
 from api.users.use_cases.get_lecturers_use_case import GetLecturersUseCase
 from api.users.use_cases.get_lecturer_use_case import GetLecturerUseCase
 from api.users.use_cases.edit_user_use_case import EditUserUseCase
 
+from api.system.errors.invalid_cursor import InvalidCursor
+
 from api.users.errors.user_already_exists import UserAlreadyExists
 from api.users.errors.users_not_found import UsersNotFound
 from api.users.errors.user_not_found import UserNotFound
 from api.users.errors.invalid_credentials import InvalidCredentials
+from api.users.errors.invalid_refresh_token import InvalidRefreshToken
 from api.users.errors.lecturers_not_found import LecturersNotFound
 
 from api.users.dependencies import get_email_address_validator
@@ -24,6 +28,7 @@ from api.users.dependencies import get_password_validator
 
 from api.users.dependencies import create_user_use_case
 from api.users.dependencies import login_user_use_case
+from api.users.dependencies import refresh_access_token_use_case
 from api.users.dependencies import get_users_use_case
 from api.users.dependencies import get_user_use_case
 from api.users.dependencies import get_lecturers_use_case
@@ -32,6 +37,8 @@ from api.users.dependencies import edit_user_use_case
 
 from api.middleware.dependencies import get_current_user
 
+from api.utils.pagination import set_page_headers
+
 from api.users.validators import EmailAddressValidator
 from api.users.validators import PasswordValidator
 
@@ -40,7 +47,7 @@ users = APIRouter()
 
 
 @users.post("/api/v1/users", response_model=schemas.User)
-def create_user(
+async def create_user(
     request: schemas.UserCreate,
     create_user_use_case: CreateUserUseCase = Depends(create_user_use_case),
     email_address_validator: EmailAddressValidator = Depends(get_email_address_validator),
@@ -81,14 +88,14 @@ def create_user(
         )
 
     try:
-        return create_user_use_case.execute(request)
+        return await create_user_use_case.execute(request)
     except UserAlreadyExists as e:
         raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
 @users.post("/api/v1/users/login", response_model=schemas.UserDetails)
-def authenticate_user(
+async def authenticate_user(
     form_data: OAuth2PasswordRequestForm = Depends(),
     login_user_use_case: LoginUserUseCase = Depends(login_user_use_case),
 ):
@@ -111,7 +118,7 @@ def authenticate_user(
         - `response_model`: The response is in the model of the `schemas.UserDetails` schema, which contains mostly data with regards to authentication, i.e. a JWT token and a refresh token.  
     """
     try:
-        return login_user_use_case.execute(form_data)
+        return await login_user_use_case.execute(form_data)
     except UserNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidCredentials as e:
@@ -119,10 +126,45 @@ def authenticate_user(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@users.post("/api/v1/users/refresh", response_model=schemas.AccessToken)
+def refresh_access_token(
+    request: schemas.TokenRefresh,
+    refresh_access_token_use_case: RefreshAccessTokenUseCase = Depends(refresh_access_token_use_case),
+):
+    """
+    Exchanges a refresh token for a new access token, without the password of the user.    
+
+    **Note**: If you are viewing the below documentation from OpenAPI, or Redocly API docs, be aware that the documentation is mainly concerning the code, and that there may be some differences.
+    OpenAPI and Redocly API docs only show FastAPI (Pydantic) responses, i.e. 200 & 422, and ignore custom exceptions.
+
+    Args:  
+        - `request`: A `schemas.TokenRefresh` object is required which contains the refresh token, as returned when logging in.  
+        - `refresh_access_token_use_case`: The class which handles the business logic for refreshing access tokens.   
+
+    Raises:  
+        - `HTTPException`, 401: If the refresh token is invalid, expired or corrupt.  
+        - `HTTPException`, 404: If the user cannot be found.  
+        - `HTTPException`, 500: If any other system exception occurs.  
+
+    Returns:  
+        - `response_model`: The response is in the model of the `schemas.AccessToken` schema, which contains the new access token.  
+    """
+    try:
+        return refresh_access_token_use_case.execute(request)
+    except InvalidRefreshToken as e:
+        raise HTTPException(status_code=401, detail=str(e))
+    except UserNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @users.get("/api/v1/users", response_model=List[schemas.User])
 def get_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
     get_users_use_case: GetUsersUseCase = Depends(get_users_use_case),
 ):
@@ -135,18 +177,22 @@ def get_users(
     Args:  
         - `skip` (default: 0): A parameter which determines how many objects to skip.  
         - `limit` (default: 100): A parameter which determines the maximum amount of users to return.  
+        - `cursor` (default: None): The cursor of the page to return, as given by the `X-Next-Cursor` header of the previous page.  
+        - `include_total` (default: false): Whether to include an estimate of the total number of users in the `X-Total-Estimate` header.  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
         - `get_users_use_case`: The class which handles the business logic for user retrieval.  
 
     Raises:  
         - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 400: If the `cursor` is malformed.  
         - `HTTPException`, 403: If there has been a permission error.  
         - `HTTPException`, 404: If no users have been found and returned.  
         - `HTTPException`, 500: If any other system exception occurs.  
 
     Returns:  
         - `response_model`: The response is in the model of the `List[schemas.User]` schema, which returns a list of Users.
+                             The `X-Next-Cursor` header is set if there is a next page.  
     """
     if current_user is None:
         raise HTTPException(
@@ -155,7 +201,12 @@ def get_users(
         )
 
     try:
-        return get_users_use_case.execute(skip, limit, current_user)
+        page = get_users_use_case.execute(skip, limit, current_user, cursor, include_total)
+        set_page_headers(response, page)
+
+        return page.items
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except UsersNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except PermissionError as e:
@@ -267,8 +318,11 @@ def edit_user(
 
 @users.get("/api/v1/lecturers", response_model=List[schemas.Lecturer])
 def get_lecturers(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     current_user: Tuple[str, bool, bool] = Depends(get_current_user),
     get_lecturers_use_case: GetLecturersUseCase = Depends(get_lecturers_use_case),
 ):
@@ -280,19 +334,23 @@ def get_lecturers(
 
     Args:  
         - `skip` (default: 0): A parameter which determines how many objects to skip.  
-        - `limit` (default: 100): A parameter which determines the maximum amount of users to return.  
+        - `limit` (default: 100): A parameter which determines the maximum amount of lecturers to return.  
+        - `cursor` (default: None): The cursor of the page to return, as given by the `X-Next-Cursor` header of the previous page.  
+        - `include_total` (default: false): Whether to include an estimate of the total number of lecturers in the `X-Total-Estimate` header.  
         - `current_user`: A middleware object `current_user` which contains a Tuple of a string, boolean and a boolean.   
                       The initial string is the user_email (which is extracted from the JWT), followed by is_admin & is_lecturer flags.  
         - `get_lecturers_use_case`: The class which handles the business logic for lecturer retrieval.  
 
     Raises:  
         - `HTTPException`, 401: If the `current_user` is None, i.e. if the JWT is invalid, missing or corrupt.  
+        - `HTTPException`, 400: If the `cursor` is malformed.  
         - `HTTPException`, 403: If there has been a permission error.  
         - `HTTPException`, 404: If no users have been found and returned.  
         - `HTTPException`, 500: If any other system exception occurs.  
 
     Returns:  
         - `response_model`: The response is in the model of the `List[schemas.Lecturer]` schema, which returns a list of Lecturers.
+                             The `X-Next-Cursor` header is set if there is a next page.  
     """
     if current_user is None:
         raise HTTPException(
@@ -301,7 +359,12 @@ def get_lecturers(
         )
 
     try:
-        return get_lecturers_use_case.execute(skip, limit, current_user)
+        page = get_lecturers_use_case.execute(skip, limit, current_user, cursor, include_total)
+        set_page_headers(response, page)
+
+        return page.items
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except LecturersNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
     except PermissionError as e:
@@ -2,12 +2,16 @@ from fastapi import Depends
 
 from api.middleware.dependencies import UserRepository
 from api.middleware.dependencies import ClassRepository
-from api.middleware.dependencies import MarkRepository
 
 from api.users.hashers.bcrypt_hasher import BCryptHasher
+from api.users.hashers.hashing_pool import get_hashing_pool
+
+from api.middleware.decoders.token_decoder import TokenDecoder
+from api.middleware.token_verifier import create_token_decoder
 
 from api.users.use_cases.create_user_use_case import CreateUserUseCase
 from api.users.use_cases.login_user_use_case import LoginUserUseCase
+from api.users.use_cases.refresh_access_token_use_case import RefreshAccessTokenUseCase
 from api.users.use_cases.get_users_use_case import GetUsersUseCase
 from api.users.use_cases.get_user_use_case import GetUserUseCase
 from api.users.use_cases.get_lecturers_use_case import GetLecturersUseCase
@@ -21,11 +25,13 @@ from api.config import Config
 
 from api.middleware.dependencies import get_user_repository
 from api.middleware.dependencies import get_class_repository
-from api.middleware.dependencies import get_mark_repository
 
 
 def get_bcrypt_hasher() -> BCryptHasher:
-    return BCryptHasher()
+    return BCryptHasher(Config.BCRYPT_ROUNDS, get_hashing_pool(Config.BCRYPT_PROCESSES))
+
+def get_refresh_token_decoder() -> TokenDecoder:
+    return create_token_decoder(Config.JWT_DECODER, Config.JWT_REFRESH_SECRET_KEY, Config.JWT_ALGORITHM)
 
 def get_email_address_validator() -> EmailAddressValidator:
     return EmailAddressValidator()
@@ -53,26 +59,33 @@ def login_user_use_case(
         config
     )
 
+def refresh_access_token_use_case(
+        user_repository: UserRepository = Depends(get_user_repository),
+        refresh_token_decoder: TokenDecoder = Depends(get_refresh_token_decoder),
+        config: Config = Depends(Config)
+    ) -> RefreshAccessTokenUseCase:
+    return RefreshAccessTokenUseCase(
+        user_repository,
+        refresh_token_decoder,
+        config
+    )
+
 def get_lecturers_use_case(
         user_repository: UserRepository = Depends(get_user_repository),
         class_repository: ClassRepository = Depends(get_class_repository),
-        mark_repository: MarkRepository = Depends(get_mark_repository),
     ) -> GetLecturersUseCase:
     return GetLecturersUseCase(
         user_repository, 
         class_repository,
-        mark_repository,
     )
 
 def get_lecturer_use_case(
         user_repository: UserRepository = Depends(get_user_repository),
         class_repository: ClassRepository = Depends(get_class_repository),
-        mark_repository: MarkRepository = Depends(get_mark_repository),
     ) -> GetLecturerUseCase:
     return GetLecturerUseCase(
         user_repository, 
         class_repository,
-        mark_repository,
     )
 
 def edit_user_use_case(
@@ -0,0 +1,9 @@
+class InvalidRefreshToken(Exception):
+    """
+    A custom subclass exception, raised when a refresh token is invalid, expired or corrupt.
+
+    Args:
+        message: A parameter which allows for a custom error message.
+    """
+    def __init__(self, message: str) -> None:
+        self.message = message
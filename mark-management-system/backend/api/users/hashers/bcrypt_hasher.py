@@ -1,11 +1,54 @@
-from bcrypt import hashpw, checkpw, gensalt
+import bcrypt
+import asyncio
+
+from concurrent.futures import Executor
+
+from starlette.concurrency import run_in_threadpool
+
+from typing import Any, Callable, Optional
 
 from api.users.hashers.hasher import Hasher
 
 
 class BCryptHasher(Hasher):
+    """
+    Hashes passwords with bcrypt, at a cost of `rounds` (i.e. 2^rounds iterations), optionally in an executor.
+
+    The `_async` variants are awaited by async request handlers, so that no thread is held whilst a password is hashed
+    in the executor, rather than blocking a thread of the threadpool until the hash is done.
+    """
+    def __init__(self, rounds: int = 12, executor: Optional[Executor] = None) -> None:
+        self.rounds = rounds
+        self.executor = executor
+
     def hash(self, password: str) -> str:
-        return hashpw(password.encode("utf-8"), gensalt()).decode("utf-8")
+        return self._run(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt(self.rounds)).decode("utf-8")
 
     def check(self, hashed_password: str, password: str) -> bool:
-        return checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
\ No newline at end of file
+        return self._run(bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    async def hash_async(self, password: str) -> str:
+        return (await self._run_async(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt(self.rounds))).decode("utf-8")
+
+    async def check_async(self, hashed_password: str, password: str) -> bool:
+        return await self._run_async(bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # A bcrypt hash is formatted as `$2b$<rounds>$<salt & hash>`.
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        if self.executor is None:
+            return function(*args)
+
+        return self.executor.submit(function, *args).result()
+
+    async def _run_async(self, function: Callable[..., Any], *args: Any) -> Any:
+        # Without an executor the hash is calculated in the threadpool, which bcrypt releases the GIL in.
+        if self.executor is None:
+            return await run_in_threadpool(function, *args)
+
+        return await asyncio.wrap_future(self.executor.submit(function, *args))
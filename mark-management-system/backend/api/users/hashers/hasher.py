@@ -9,3 +9,7 @@ class Hasher(ABC):
     @abstractmethod
     def check(self, hashed_password: str, password: str) -> bool:
         pass
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        pass
@@ -0,0 +1,44 @@
+import threading
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
+from typing import Optional
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_hashing_pool(max_workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Retrieves the process pool which passwords are hashed in, so that hashing neither holds the GIL nor competes with
+    the request handlers for CPU beyond `max_workers` cores. The pool is created on first use & shared by the process.
+
+    Args:
+        max_workers: The number of processes in the pool, where 0 disables the pool.
+
+    Returns:
+        Optional[ProcessPoolExecutor]: The process pool, however can also return `None` if it is disabled, in which case
+                                       passwords are hashed in the calling thread.
+    """
+    global _pool
+
+    if max_workers <= 0:
+        return None
+
+    with _lock:
+        if _pool is None:
+            # The server is multi-threaded, so the workers are spawned rather than forked.
+            _pool = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+        return _pool
+
+def shutdown_hashing_pool() -> None:
+    """Shuts down the process pool, if it has been created."""
+    global _pool
+
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
@@ -1,14 +1,32 @@
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
 from api.system.models.models import User
+from api.system.models.models import Role
 from api.system.models.models import RoleUsers
 
 from api.system.schemas.schemas import UserEdit
 
+from api.system.repositories.data_version_repository import DataVersionRepository
+
 from api.users.hashers.bcrypt_hasher import BCryptHasher
 
+from api.utils.ttl_cache import TTLCache
+
+from api.utils.pagination import keyset
+from api.utils.pagination import estimate_count
+
+from api.config import Config
+
+
+# Every authenticated request resolves the user from the email (the JWT subject), so a snapshot of the user & their
+# roles is kept in memory for a short while. Entries are evicted whenever the user or their roles are changed.
+user_cache = TTLCache(Config.USER_CACHE_MAXSIZE, Config.USER_CACHE_TTL_SECONDS)
+
 
 class UserRepository:
     """The repository layer which performs queries and operations on the database for `User` objects."""
@@ -21,6 +39,7 @@ class UserRepository:
             db: The database session.
         """
         self.db = db
+        self.data_version_repository = DataVersionRepository(db)
 
     def add(self, user: User) -> None:
         """
@@ -34,6 +53,8 @@ class UserRepository:
         
         self.db.refresh(user)
 
+        user_cache.delete(user.email_address)
+
     def find_by_id(self, user_id: int) -> Optional[User]:
         """
         Retrieves a user by a given user_id identifier.
@@ -46,43 +67,107 @@ class UserRepository:
         """
         return self.db.query(User).filter_by(id=user_id).first()
 
-    def find_by_email(self, email_address: str) -> Optional[User]:
+    def find_by_email(self, email_address: str, use_cache: bool = True) -> Optional[User]:
         """
-        Retrieves a user by a given email_address identifier.
+        Retrieves a user by a given email_address identifier, with their roles loaded.
+
+        If the user has been retrieved recently, a cached snapshot is merged into the session instead of querying the database.
 
         Args:
             email_address: The user's email_address, the identifier..
+            use_cache: Whether a cached snapshot of the user can be used, the database is always queried (and the cache refreshed) if not.
         
         Returns:
             Optional[User]: A `User` from the database, however can also return `None` if not found.
         """
-        return self.db.query(User).filter_by(email_address=email_address).first()
+        if use_cache:
+            snapshot = user_cache.get(email_address)
+
+            if snapshot is not None:
+                return self.db.merge(snapshot, load=False)
+
+        user = self.db.query(User).options(selectinload(User.roles)).filter_by(email_address=email_address).first()
+
+        if user is not None:
+            user_cache.set(email_address, self._snapshot(user))
+
+        return user
+
+    def _snapshot(self, user: User) -> User:
+        """
+        Creates a detached copy of a user & their roles, which can be shared between sessions (via `Session.merge`).
+
+        Args:
+            user: The user to be copied, with their roles loaded.
+
+        Returns:
+            User: A detached `User` object, which is not attached to any session.
+        """
+        roles = []
+
+        for role in user.roles:
+            role_snapshot = Role(id=role.id, title=role.title)
+            make_transient_to_detached(role_snapshot)
+
+            roles.append(role_snapshot)
+
+        snapshot = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+        make_transient_to_detached(snapshot)
+
+        set_committed_value(snapshot, "roles", roles)
+
+        return snapshot
     
-    def get_users(self, skip: int, limit: int) -> List[User]:
+    def get_users(self, skip: int, limit: int, after_id: Optional[int] = None) -> List[User]:
         """
-        Retrieves a list of users in the system, given a skip and a limit.
+        Retrieves a list of users in the system ordered by their identifier, given a skip, a limit and optionally a cursor.
 
         Args:
             skip: The amount to skip.
-            limit: The maximum number of items to be retrieved.
+            limit: The maximum number of items to be retrieved, one more is returned if there is a next page.
+            after_id (default: None): The identifier of the last user of the previous page.
         
         Returns:
             List[User]: A list of `User` schematic objects, however can also return an empty list if nothing is found.
         """
-        return self.db.query(User).offset(skip).limit(limit).all()
+        return keyset(self.db.query(User), User.id, after_id, skip, limit).all()
+
+    def estimate_users(self) -> int:
+        """
+        Estimates the number of users in the system.
+
+        Returns:
+            int: The (estimated) number of users.
+        """
+        return estimate_count(self.db, User.__tablename__, self.db.query(User))
 
-    def get_lecturers(self, skip: int, limit: int) -> List[User]:
+    def get_lecturers(self, skip: int, limit: int, after_id: Optional[int] = None) -> List[User]:
         """
-        Retrieves a list of users with the `Lecturer` role in the system, given a skip and a limit.
+        Retrieves a list of users with the `Lecturer` role in the system ordered by their identifier, given a skip, a limit
+        and optionally a cursor.
 
         Args:
             skip: The amount to skip.
-            limit: The maximum number of items to be retrieved.
+            limit: The maximum number of items to be retrieved, one more is returned if there is a next page.
+            after_id (default: None): The identifier of the last lecturer of the previous page.
         
         Returns:
             List[User]: A list of `User` schematic objects, however can also return an empty list if nothing is found.
         """
-        return self.db.query(User).join(RoleUsers, User.id == RoleUsers.user_id).filter(RoleUsers.role_id == 2).offset(skip).limit(limit).all()
+        return keyset(self._lecturers(), User.id, after_id, skip, limit).all()
+
+    def count_lecturers(self) -> int:
+        """
+        Counts the number of users with the `Lecturer` role in the system. Only a subset of the users are lecturers, so the
+        table statistics cannot be used, however the count only reads the (small) `role_users` table.
+
+        Returns:
+            int: The number of lecturers.
+        """
+        return self.db.query(RoleUsers).filter(RoleUsers.role_id == 2).count()
+
+    def _lecturers(self):
+        return self.db.query(User).join(RoleUsers, User.id == RoleUsers.user_id).filter(RoleUsers.role_id == 2)
 
     def update(self, user: User, request: UserEdit, hasher: BCryptHasher) -> None:
         """
@@ -102,4 +187,21 @@ class UserRepository:
         if (request.password and request.confirm_password) and (request.password == request.confirm_password):
             user.password = hasher.hash(request.password)
 
+        self.data_version_repository.bump(User.__tablename__)
         self.db.commit()
+
+        user_cache.delete(user.email_address)
+
+    def update_password(self, user: User, hashed_password: str) -> None:
+        """
+        Replaces the password hash of an existing user, i.e. when it is rehashed at a different cost.
+
+        Args:
+            user: A user object, which already exists in the database.
+            hashed_password: The new password hash.
+        """
+        user.password = hashed_password
+
+        self.db.commit()
+
+        user_cache.delete(user.email_address)
@@ -0,0 +1,34 @@
+from typing import List, Final
+
+from jose import jwt
+from datetime import datetime, timedelta
+
+from api.system.models.models import Role
+
+from api.config import Config
+
+
+# The `type` claim of each kind of token, so that one kind is never accepted as the other, even if both share a secret key.
+ACCESS_TOKEN_TYPE: Final[str] = "access"
+REFRESH_TOKEN_TYPE: Final[str] = "refresh"
+
+def create_access_token(config: Config, subject: str, roles: List[Role]) -> str:
+    """Creates & returns an encoded JWT which contains the token type, expiry date, subject (email), and two flags: is_admin & is_lecturer."""
+    expire = datetime.utcnow() + timedelta(minutes=config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    is_admin = any(role.title == "admin" for role in roles)
+    is_lecturer = any(role.title == "lecturer" for role in roles)
+
+    to_encode = ({"type": ACCESS_TOKEN_TYPE, "exp": expire, "sub": str(subject), "is_admin": is_admin, "is_lecturer": is_lecturer})
+    encoded_jwt = jwt.encode(to_encode, config.JWT_SECRET_KEY, algorithm=config.JWT_ALGORITHM)
+
+    return encoded_jwt
+
+def create_refresh_token(config: Config, subject: str) -> str:
+    """Creates & returns an encoded JWT whcih contains the token type, expiry date and the subject (email)."""
+    expires_delta = datetime.utcnow() + timedelta(minutes=config.JWT_REFRESH_TOKEN_EXPIRE_MINUTES)
+    
+    to_encode = {"type": REFRESH_TOKEN_TYPE, "exp": expires_delta, "sub": str(subject)}
+    encoded_jwt = jwt.encode(to_encode, config.JWT_REFRESH_SECRET_KEY, config.JWT_ALGORITHM)
+    
+    return encoded_jwt
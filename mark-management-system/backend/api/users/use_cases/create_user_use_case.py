@@ -1,3 +1,5 @@
+from starlette.concurrency import run_in_threadpool
+
 from api.system.models.models import User
 
 from api.system.schemas.schemas import UserCreate
@@ -18,10 +20,13 @@ class CreateUserUseCase:
         self.user_repository = user_repository
         self.bcrypt_hasher = bcrypt_hasher
     
-    def execute(self, request: UserCreate) -> UserSchema:
+    async def execute(self, request: UserCreate) -> UserSchema:
         """
         Executes the Use Case to create a user given a request.
 
+        The password is hashed in the hashing pool without holding a thread, whereas the (blocking) queries are run in the
+        threadpool, as the session is synchronous.
+
         Args:
             request: A `UserCreate` object is required which contains the necessary user details for user creation.
 
@@ -31,10 +36,10 @@ class CreateUserUseCase:
         Returns:
             UserSchema: A UserSchema schema object containing the email_address, first_name and last_name.
         """
-        if self.user_repository.find_by_email(request.email_address):
+        if await run_in_threadpool(self.user_repository.find_by_email, request.email_address, use_cache=False):
             raise UserAlreadyExists("User already exists")
         
-        hashed_password = self.bcrypt_hasher.hash(request.password)
+        hashed_password = await self.bcrypt_hasher.hash_async(request.password)
 
         user = User(
             email_address=request.email_address,
@@ -43,6 +48,7 @@ class CreateUserUseCase:
             password=hashed_password
         )
 
-        self.user_repository.add(user)
+        await run_in_threadpool(self.user_repository.add, user)
 
-        return user
+        # The roles & classes of the user are loaded whilst it is converted, so that happens in the threadpool as well.
+        return await run_in_threadpool(UserSchema.model_validate, user)
@@ -6,7 +6,6 @@ from api.system.schemas.schemas import LecturerClass
 
 from api.users.repositories.user_repository import UserRepository
 from api.classes.repositories.class_repository import ClassRepository
-from api.marks.repositories.mark_repository import MarkRepository
 
 from api.users.errors.user_not_found import UserNotFound
 
@@ -21,11 +20,9 @@ class GetLecturerUseCase:
             self, 
             user_repository: UserRepository,
             class_repository: ClassRepository,
-            mark_repository: MarkRepository
         ) -> None:
         self.user_repository = user_repository
         self.class_repository = class_repository
-        self.mark_repository = mark_repository
     
     def execute(self, current_user: Tuple[str, bool, bool]) -> Lecturer:
         """
@@ -50,9 +47,9 @@ class GetLecturerUseCase:
         if lecturer is None:
             raise UserNotFound("User not found")
         
-        classes = self.class_repository.get_classes_by_lecturer_id(lecturer.id)
+        classes = self.class_repository.get_classes_with_upload_status([lecturer.id])
 
-        class_list: List = [self.create_lecturer_class(class_) for class_ in classes]
+        class_list: List = [self.create_lecturer_class(class_, is_uploaded) for class_, is_uploaded in classes]
 
         lecturer_data = Lecturer(
             id=lecturer.id,
@@ -64,13 +61,11 @@ class GetLecturerUseCase:
 
         return lecturer_data
 
-    def create_lecturer_class(self, class_: Class) -> LecturerClass:
-        marks = self.mark_repository.get_student_marks_for_class(class_.id)
-
+    def create_lecturer_class(self, class_: Class, is_uploaded: bool) -> LecturerClass:
         return LecturerClass(
             name=class_.name,
             code=class_.code,
             credit=class_.credit,
             credit_level=class_.credit_level,
-            is_uploaded=len(marks) > 0,
+            is_uploaded=is_uploaded,
         )
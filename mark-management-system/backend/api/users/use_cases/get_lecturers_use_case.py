@@ -1,4 +1,4 @@
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Optional
 
 from api.system.schemas.schemas import Lecturer
 from api.system.schemas.schemas import Class
@@ -6,10 +6,13 @@ from api.system.schemas.schemas import LecturerClass
 
 from api.users.repositories.user_repository import UserRepository
 from api.classes.repositories.class_repository import ClassRepository
-from api.marks.repositories.mark_repository import MarkRepository
 
 from api.users.errors.lecturers_not_found import LecturersNotFound
 
+from api.utils.pagination import Page
+from api.utils.pagination import build_page
+from api.utils.pagination import decode_cursor
+
 
 class GetLecturersUseCase:
     """
@@ -19,68 +22,82 @@ class GetLecturersUseCase:
             self, 
             user_repository: UserRepository,
             class_repository: ClassRepository,
-            mark_repository: MarkRepository
         ) -> None:
         self.user_repository = user_repository
         self.class_repository = class_repository
-        self.mark_repository = mark_repository
     
-    def execute(self, skip: int, limit: int, current_user: Tuple[str, bool, bool]) -> List[Lecturer]:
+    def execute(
+            self,
+            skip: int,
+            limit: int,
+            current_user: Tuple[str, bool, bool],
+            cursor: Optional[str] = None,
+            include_total: bool = False,
+        ) -> Page:
         """
         Executes the Use Case to retrieve a list of lecturers.
 
         Since a Lecturer schema contains also various other details, such as number of classes taught & classes they teach, that data
-        is calculated in this use case.
+        is calculated in this use case. The classes (and whether marks have been uploaded for them) of every lecturer on the page are
+        retrieved in a single query, rather than per lecturer & per class.
 
         Args:
             skip: The amount to skip.
             limit: The maximum number of items to be retrieved.
             current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+            cursor (default: None): The cursor of the page to retrieve, as returned with the previous page.
+            include_total (default: False): Whether to include an estimate of the total number of lecturers.
 
         Raises:
+            InvalidCursor: If the cursor is malformed.
             LecturersNotFound: If no lecturers have been found.
             PermissionError: If the requestor is not an administrator.
 
         Returns:
-            List[Lecturer]: A list of Lecturer schema objects containing the lecturer details.
+            Page: A page of Lecturer schema objects containing the lecturer details, and the cursor of the next page.
         """
         _, is_admin, _ = current_user
 
         if is_admin is False:
             raise PermissionError("Permission denied to access this resource")
         
-        lecturers = self.user_repository.get_lecturers(skip, limit)
+        lecturers = self.user_repository.get_lecturers(skip, limit, decode_cursor(cursor))
 
         if not lecturers:
             raise LecturersNotFound("Users not found")
+
+        page = build_page(lecturers, limit, lambda lecturer: lecturer.id)
+        lecturers = page.items
         
+        classes_by_lecturer: Dict[int, List[LecturerClass]] = {lecturer.id: [] for lecturer in lecturers}
+
+        for class_, is_uploaded in self.class_repository.get_classes_with_upload_status(classes_by_lecturer.keys()):
+            classes_by_lecturer[class_.lecturer_id].append(self.create_lecturer_class(class_, is_uploaded))
+
         lecturers_with_classes: List = []
 
         for lecturer in lecturers:
-            classes = self.class_repository.get_classes_by_lecturer_id(lecturer.id, skip, limit)
-
-            class_list: List = [self.create_lecturer_class(class_) for class_ in classes]
+            class_list = classes_by_lecturer[lecturer.id]
 
             lecturer_data = Lecturer(
                 id=lecturer.id,
                 first_name=lecturer.first_name,
                 last_name=lecturer.last_name,
-                number_of_classes_taught=len(classes),
+                number_of_classes_taught=len(class_list),
                 classes=class_list
             )
 
             lecturers_with_classes.append(lecturer_data)
 
+        total_estimate = self.user_repository.count_lecturers() if include_total else None
 
-        return lecturers_with_classes
-
-    def create_lecturer_class(self, class_: Class) -> LecturerClass:
-        marks = self.mark_repository.get_student_marks_for_class(class_.id)
+        return page._replace(items=lecturers_with_classes, total_estimate=total_estimate)
 
+    def create_lecturer_class(self, class_: Class, is_uploaded: bool) -> LecturerClass:
         return LecturerClass(
             name=class_.name,
             code=class_.code,
             credit=class_.credit,
             credit_level=class_.credit_level,
-            is_uploaded=len(marks) > 0,
+            is_uploaded=is_uploaded,
         )
@@ -1,11 +1,13 @@
-from typing import Tuple, List
-
-from api.system.schemas.schemas import User as UserSchema
+from typing import Tuple, Optional
 
 from api.users.repositories.user_repository import UserRepository
 
 from api.users.errors.users_not_found import UsersNotFound
 
+from api.utils.pagination import Page
+from api.utils.pagination import build_page
+from api.utils.pagination import decode_cursor
+
 
 class GetUsersUseCase:
     """
@@ -14,7 +16,14 @@ class GetUsersUseCase:
     def __init__(self, user_repository: UserRepository) -> None:
         self.user_repository = user_repository
     
-    def execute(self, skip: int, limit: int, current_user: Tuple[str, bool, bool]) -> List[UserSchema]:
+    def execute(
+            self,
+            skip: int,
+            limit: int,
+            current_user: Tuple[str, bool, bool],
+            cursor: Optional[str] = None,
+            include_total: bool = False,
+        ) -> Page:
         """
         Executes the Use Case to retrieve a list of users.
 
@@ -22,22 +31,27 @@ class GetUsersUseCase:
             skip: The amount to skip.
             limit: The maximum number of items to be retrieved.
             current_user: A middleware object `current_user` which contains JWT information. For more details see the controller.
+            cursor (default: None): The cursor of the page to retrieve, as returned with the previous page.
+            include_total (default: False): Whether to include an estimate of the total number of users.
         
         Raises:
+            InvalidCursor: If the cursor is malformed.
             PermissionError: If the requestor is not an administrator.
             UsersNotFound: If no users are returned from the repository.
 
         Returns:
-            List[UserSchema]: A list of `UserSchema` objects, containing the information about the users.
+            Page: A page of `User` objects, containing the information about the users, and the cursor of the next page.
         """
         _, is_admin, _ = current_user
 
         if is_admin is False:
             raise PermissionError("Permission denied to access this resource")
         
-        users = self.user_repository.get_users(skip, limit)
+        users = self.user_repository.get_users(skip, limit, decode_cursor(cursor))
 
         if not users:
             raise UsersNotFound("Users not found")
 
-        return users
+        total_estimate = self.user_repository.estimate_users() if include_total else None
+
+        return build_page(users, limit, lambda user: user.id, total_estimate)
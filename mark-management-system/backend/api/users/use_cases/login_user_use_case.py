@@ -1,8 +1,8 @@
 from fastapi.security import OAuth2PasswordRequestForm
 
-from typing import List
-from jose import jwt
-from datetime import datetime, timedelta
+from starlette.concurrency import run_in_threadpool
+
+from api.system.models.models import User
 
 from api.system.schemas.schemas import UserDetails, RoleInUser
 
@@ -13,6 +13,9 @@ from api.users.errors.invalid_credentials import InvalidCredentials
 
 from api.users.hashers.bcrypt_hasher import BCryptHasher
 
+from api.users.tokens import create_access_token
+from api.users.tokens import create_refresh_token
+
 from api.config import Config
 
 
@@ -25,10 +28,13 @@ class LoginUserUseCase:
         self.bcrypt_hasher = bcrypt_hasher
         self.config = config
     
-    def execute(self, form_data: OAuth2PasswordRequestForm) -> UserDetails:
+    async def execute(self, form_data: OAuth2PasswordRequestForm) -> UserDetails:
         """
         Executes the Use Case to authenticate a user.
 
+        The password is checked (and rehashed) in the hashing pool without holding a thread, whereas the (blocking) queries
+        are run in the threadpool, as the session is synchronous.
+
         Args:
             form_data: The data from the form which will be authenticated against the database.
 
@@ -39,16 +45,25 @@ class LoginUserUseCase:
         Returns:
             UserDetails: A UserDetails schema object which contains mostly data with regards to authentication, i.e. a JWT token and a refresh token.
         """
-        user = self.user_repository.find_by_email(form_data.username)
+        user = await run_in_threadpool(self.user_repository.find_by_email, form_data.username, use_cache=False)
 
         if user is None:
             raise UserNotFound("User not found")
         
-        if not self.bcrypt_hasher.check(user.password, form_data.password):
+        if not await self.bcrypt_hasher.check_async(user.password, form_data.password):
             raise InvalidCredentials("Invalid Credentials provided")
 
-        access_token = self.create_access_token(user.email_address, user.roles)
-        refresh_token = self.create_refresh_token(user.email_address)
+        # The password is only known whilst logging in, so that is when a hash at an outdated cost is replaced.
+        if self.bcrypt_hasher.needs_rehash(user.password):
+            hashed_password = await self.bcrypt_hasher.hash_async(form_data.password)
+            await run_in_threadpool(self.user_repository.update_password, user, hashed_password)
+
+        # The user is reloaded after a rehash has been committed, so the details are also created in the threadpool.
+        return await run_in_threadpool(self.create_user_details, user)
+
+    def create_user_details(self, user: User) -> UserDetails:
+        access_token = create_access_token(self.config, user.email_address, user.roles)
+        refresh_token = create_refresh_token(self.config, user.email_address)
 
         roles = [RoleInUser(id=role.id, title=role.title) for role in user.roles]
 
@@ -63,24 +78,3 @@ class LoginUserUseCase:
         )
 
         return user_details
-
-    def create_access_token(self, subject: str, roles: List[str]) -> str:
-        """Creates & returns an encoded JWT which contains the expiry date, subject (email), and two flags: is_admin & is_lecturer."""
-        expire = datetime.utcnow() + timedelta(minutes=self.config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-
-        is_admin = any(role.title == "admin" for role in roles)
-        is_lecturer = any(role.title == "lecturer" for role in roles)
-
-        to_encode = ({"exp": expire, "sub": str(subject), "is_admin": is_admin, "is_lecturer": is_lecturer})
-        encoded_jwt = jwt.encode(to_encode, self.config.JWT_SECRET_KEY, algorithm=self.config.JWT_ALGORITHM)
-
-        return encoded_jwt
-    
-    def create_refresh_token(self, subject: str) -> str:
-        """Creates & returns an encoded JWT whcih contains the expiry date and the subject (email)."""
-        expires_delta = datetime.utcnow() + timedelta(minutes=self.config.JWT_REFRESH_TOKEN_EXPIRE_MINUTES)
-        
-        to_encode = {"exp": expires_delta, "sub": str(subject)}
-        encoded_jwt = jwt.encode(to_encode, self.config.JWT_REFRESH_SECRET_KEY, self.config.JWT_ALGORITHM)
-        
-        return encoded_jwt
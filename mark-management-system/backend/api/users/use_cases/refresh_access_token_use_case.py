@@ -0,0 +1,53 @@
+from api.system.schemas.schemas import TokenRefresh
+from api.system.schemas.schemas import AccessToken
+
+from api.users.repositories.user_repository import UserRepository
+
+from api.users.errors.user_not_found import UserNotFound
+from api.users.errors.invalid_refresh_token import InvalidRefreshToken
+
+from api.middleware.decoders.token_decoder import TokenDecoder
+
+from api.users.tokens import create_access_token
+from api.users.tokens import REFRESH_TOKEN_TYPE
+
+from api.config import Config
+
+
+class RefreshAccessTokenUseCase:
+    """
+    The Use Case containing business logic for exchanging a refresh token for a new access token.
+    """
+    def __init__(self, user_repository: UserRepository, refresh_token_decoder: TokenDecoder, config: Config) -> None:
+        self.user_repository = user_repository
+        self.refresh_token_decoder = refresh_token_decoder
+        self.config = config
+
+    def execute(self, request: TokenRefresh) -> AccessToken:
+        """
+        Executes the Use Case to create a new access token from a refresh token.
+
+        The password is not checked (and therefore not hashed) again, and the roles of the user are read from the user
+        cache, so refreshing is far cheaper than logging in.
+
+        Args:
+            request: A `TokenRefresh` object is required which contains the refresh token, as returned when logging in.
+
+        Raises:
+            InvalidRefreshToken: If the refresh token is invalid, expired, corrupt or not a refresh token (i.e. an access token).
+            UserNotFound: If the user (from the refresh token) cannot be found.
+
+        Returns:
+            AccessToken: An AccessToken schema object which contains the new access token.
+        """
+        claims = self.refresh_token_decoder.decode(request.refresh_token)
+
+        if claims is None or claims.get("type") != REFRESH_TOKEN_TYPE or not claims.get("sub"):
+            raise InvalidRefreshToken("Invalid refresh token provided")
+
+        user = self.user_repository.find_by_email(claims["sub"])
+
+        if user is None:
+            raise UserNotFound("User not found")
+
+        return AccessToken(access_token=create_access_token(self.config, user.email_address, user.roles))
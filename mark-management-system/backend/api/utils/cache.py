@@ -0,0 +1,200 @@
+import pickle
+import threading
+
+from abc import ABC, abstractmethod
+
+from contextlib import contextmanager
+
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+from api.utils.ttl_cache import TTLCache
+
+
+T = TypeVar("T")
+
+
+class CacheBackend(ABC):
+    """
+    The storage of a `ScopedCache`, which holds values (which expire after a while) & counters (which do not).
+    """
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def get_counter(self, key: str) -> int:
+        pass
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    A backend which keeps every value in the memory of the process, evicting the least recently used value once `maxsize`
+    is reached.
+    """
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.entries = TTLCache(maxsize, ttl)
+        self.counters: Dict[str, int] = {}
+
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self.entries.set(key, value)
+
+    def get_counter(self, key: str) -> int:
+        return self.counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+
+            return self.counters[key]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+        with self._lock:
+            self.counters.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    A backend which keeps every value in a Redis (compatible) server, so that it is shared between processes. Values are
+    pickled, so the server must only be reachable by the application.
+    """
+    def __init__(self, url: str, ttl: float, prefix: str = "mms:cache:") -> None:
+        # Only imported when a server is configured, as the default backend does not need it.
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.client.get(self.prefix + key)
+
+        return None if value is None else pickle.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=max(1, round(self.ttl)))
+
+    def get_counter(self, key: str) -> int:
+        return int(self.client.get(self.prefix + key) or 0)
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(self.prefix + key)
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+def create_cache_backend(url: Optional[str], maxsize: int, ttl: float) -> CacheBackend:
+    """
+    Creates the backend of a cache.
+
+    Args:
+        url: The URL of a Redis (compatible) server, i.e. `redis://localhost:6379/0`, or `None` to keep values in memory.
+        maxsize: The maximum number of values which are kept in memory, which is ignored by a Redis server.
+        ttl: The number of seconds after which a value expires.
+
+    Returns:
+        CacheBackend: A `RedisCacheBackend` if a URL is given, otherwise a `MemoryCacheBackend`.
+    """
+    if url:
+        return RedisCacheBackend(url, ttl)
+
+    return MemoryCacheBackend(maxsize, ttl)
+
+
+class ScopedCache:
+    """
+    A cache of values which are each derived from a scope of the data, i.e. the marks of a class, where invalidating a scope
+    drops every value derived from it. Each scope has a generation which is part of the keys of its values, so a scope is
+    invalidated by incrementing its generation, without having to know the keys of its values.
+
+    Concurrent misses of the same key are collapsed into a single computation (within a process), whilst the others wait
+    for its value, i.e. single-flight.
+    """
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+
+        self._flights: Dict[str, Tuple[threading.Lock, int]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, scope: str, key: str, compute: Callable[[], Optional[T]]) -> Optional[T]:
+        """
+        Retrieves a value from the cache, computing (and caching) it if it is missing.
+
+        Args:
+            scope: The scope which the value is derived from.
+            key: The key of the value within the scope.
+            compute: A function which computes the value, where `None` (or an exception) is never cached.
+
+        Returns:
+            Optional[T]: The cached or computed value.
+        """
+        cache_key = f"{scope}@{self.backend.get_counter(scope)}:{key}"
+
+        value = self.backend.get(cache_key)
+
+        if value is not None:
+            return value
+
+        with self._single_flight(cache_key):
+            # Another request may have computed the value whilst this one was waiting.
+            value = self.backend.get(cache_key)
+
+            if value is None:
+                value = compute()
+
+                if value is not None:
+                    self.backend.set(cache_key, value)
+
+        return value
+
+    def invalidate(self, *scopes: str) -> None:
+        """
+        Invalidates every value derived from the given scopes.
+
+        Args:
+            scopes: The scopes to be invalidated.
+        """
+        for scope in set(scopes):
+            self.backend.incr(scope)
+
+    def clear(self) -> None:
+        """Removes every value (and generation) from the cache."""
+        self.backend.clear()
+
+    @contextmanager
+    def _single_flight(self, cache_key: str) -> Iterator[None]:
+        with self._lock:
+            lock, waiters = self._flights.get(cache_key, (threading.Lock(), 0))
+            self._flights[cache_key] = (lock, waiters + 1)
+
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, waiters = self._flights[cache_key]
+
+                if waiters == 1:
+                    del self._flights[cache_key]
+                else:
+                    self._flights[cache_key] = (lock, waiters - 1)
@@ -0,0 +1,39 @@
+import hashlib
+
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Builds a strong ETag from everything a response depends on.
+
+    Args:
+        parts: The values the response depends on, i.e. the versions of the tables it reads and the requestor.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    digest = hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+
+    return f'"{digest[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks an `If-None-Match` header against an ETag, using the weak comparison which RFC 9110 requires for `If-None-Match`.
+
+    Args:
+        if_none_match: The value of the `If-None-Match` header, if any.
+        etag: The current (quoted) ETag.
+
+    Returns:
+        bool: True if the client already has the current representation, false if not.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
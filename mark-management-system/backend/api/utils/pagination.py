@@ -0,0 +1,144 @@
+import json
+import base64
+import binascii
+
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from fastapi import Response
+
+from sqlalchemy import text
+
+from sqlalchemy.orm import Query
+from sqlalchemy.orm import Session
+
+from api.system.errors.invalid_cursor import InvalidCursor
+
+
+class Page(NamedTuple):
+    """
+    A page of a listing, alongside the (opaque) cursor of the next page, if there is one, and an estimate of the total.
+    """
+    items: List[Any]
+    next_cursor: Optional[str]
+    total_estimate: Optional[int]
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encodes the identifier of the last item of a page as an opaque, URL-safe cursor.
+
+    Args:
+        last_id: The identifier of the last item of the page.
+
+    Returns:
+        str: The cursor of the next page.
+    """
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decodes a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: The cursor, or `None` for the first page.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+
+    Returns:
+        Optional[int]: The identifier after which the next page starts, or `None` for the first page.
+    """
+    if not cursor:
+        return None
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        last_id = payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursor("Invalid cursor provided")
+
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise InvalidCursor("Invalid cursor provided")
+
+    return last_id
+
+def keyset(query: Query, column: Any, after_id: Optional[int], skip: int, limit: int) -> Query:
+    """
+    Applies keyset pagination to a query, i.e. rows are read from the (indexed) `column` onwards, rather than skipped over.
+
+    One more row than `limit` is fetched, so that `build_page` can tell whether there is a next page. `skip` is kept for
+    existing clients, and is applied after the cursor.
+
+    Args:
+        query: The query to paginate.
+        column: The unique, indexed column which the listing is ordered by.
+        after_id: The value of `column` of the last row of the previous page, or `None` for the first page.
+        skip: The amount to skip.
+        limit: The maximum number of items to be retrieved.
+
+    Returns:
+        Query: The paginated query.
+    """
+    if after_id is not None:
+        query = query.filter(column > after_id)
+
+    return query.order_by(column).offset(skip).limit(limit + 1)
+
+def build_page(rows: List[Any], limit: int, key: Callable[[Any], int], total_estimate: Optional[int] = None) -> Page:
+    """
+    Builds a page from the rows of a query paginated by `keyset`.
+
+    Args:
+        rows: The rows of the query, of which there are at most `limit + 1`.
+        limit: The maximum number of items on the page.
+        key: A function which returns the identifier (the keyset column) of a row.
+        total_estimate (default: None): An estimate of the total number of items, if requested.
+
+    Returns:
+        Page: The page, with a cursor if there is a next page.
+    """
+    items = rows[:limit]
+    next_cursor = encode_cursor(key(items[-1])) if len(rows) > limit and items else None
+
+    return Page(items=items, next_cursor=next_cursor, total_estimate=total_estimate)
+
+def estimate_count(db: Session, table_name: str, query: Query) -> int:
+    """
+    Estimates the number of rows of a table. On PostgreSQL the planner statistics are used, which avoids a full scan of
+    the table, any other database (or a table which has not been analysed yet) falls back to counting `query`.
+
+    Args:
+        db: The database session.
+        table_name: The name of the table.
+        query: A query of the rows of the table, which is counted if no estimate is available.
+
+    Returns:
+        int: The (estimated) number of rows.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        estimate = db.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": table_name},
+        ).scalar()
+
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+
+    return query.count()
+
+def set_page_headers(response: Response, page: Page) -> None:
+    """
+    Adds the cursor of the next page & the total estimate (if any) of a page to the headers of a response, so that the
+    body of a listing remains a plain list.
+
+    Args:
+        response: The response of the listing.
+        page: The page being returned.
+    """
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+
+    if page.total_estimate is not None:
+        response.headers["X-Total-Estimate"] = str(page.total_estimate)
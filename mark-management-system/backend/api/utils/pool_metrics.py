@@ -0,0 +1,83 @@
+import time
+import threading
+
+from typing import Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """
+    Thread-safe counters of how long requests wait to check out a connection from the connection pool.
+    """
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+
+        self._lock = threading.Lock()
+
+    def record_checkout(self, wait: float, timed_out: bool = False) -> None:
+        """
+        Records a checkout of a connection.
+
+        Args:
+            wait: The number of seconds spent waiting for the connection.
+            timed_out (default: False): Whether the checkout timed out, rather than returning a connection.
+        """
+        with self._lock:
+            if timed_out:
+                self.checkout_timeouts += 1
+            else:
+                self.checkouts += 1
+
+            self.checkout_wait_total += wait
+            self.checkout_wait_max = max(self.checkout_wait_max, wait)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Retrieves the current counters.
+
+        Returns:
+            Dict[str, float]: The number of checkouts & timeouts, and the mean & maximum wait of a checkout in milliseconds.
+        """
+        with self._lock:
+            attempts = self.checkouts + self.checkout_timeouts
+
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "checkout_wait_mean_ms": self.checkout_wait_total / attempts * 1000 if attempts else 0.0,
+                "checkout_wait_max_ms": self.checkout_wait_max * 1000,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    A `QueuePool` which records the time spent waiting for a connection in `pool_metrics`, i.e. to tell whether the pool
+    is too small for the number of concurrent requests.
+    """
+    def _do_get(self):
+        start = time.perf_counter()
+
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+
+        pool_metrics.record_checkout(time.perf_counter() - start)
+
+        return connection
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """
+    The `InstrumentedQueuePool` of an `AsyncEngine`, whose checkouts wait on the event loop rather than block a thread.
+    """
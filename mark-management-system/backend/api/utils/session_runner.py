@@ -0,0 +1,62 @@
+from typing import Any, Callable, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+from sqlalchemy.orm import Session
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+T = TypeVar("T")
+
+
+class SessionRunner:
+    """
+    Runs (sync) repository code from `async def` handlers, in the thread pool, against a (sync) `Session`.
+
+    The repositories & use cases are shared by both runners, they are constructed with `session` and only called through `run`.
+    """
+    def __init__(self, db: Session) -> None:
+        """
+        Args:
+            db: The session of the request.
+        """
+        self.db = db
+
+    @property
+    def session(self) -> Session:
+        return self.db
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Runs a function, which queries `session`, without blocking the event loop.
+
+        Args:
+            fn: The function, i.e. `use_case.execute`.
+            args: The arguments of the function.
+
+        Returns:
+            T: The result of the function.
+        """
+        return await run_in_threadpool(fn, *args)
+
+class AsyncSessionRunner(SessionRunner):
+    """
+    Runs (sync) repository code from `async def` handlers against an `AsyncSession`, through `AsyncSession.run_sync`,
+    i.e. the queries are awaited on the event loop by the async driver, rather than holding a thread while they run.
+
+    Only the queries are awaited, so functions must not block otherwise, i.e. on a network call which isn't a query.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Args:
+            db: The async session of the request.
+        """
+        self.db = db
+
+    @property
+    def session(self) -> Session:
+        return self.db.sync_session
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        return await self.db.run_sync(lambda _: fn(*args))
@@ -0,0 +1,81 @@
+import time
+import threading
+
+from collections import OrderedDict
+
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    A small, thread-safe, in-process cache which evicts the least recently used entry once `maxsize` is reached,
+    and treats any entry older than `ttl` seconds as missing.
+    """
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Retrieves an entry from the cache.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            Optional[Any]: The cached value, however can also return `None` if the key is not cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Adds (or replaces) an entry in the cache.
+
+        Args:
+            key: The key of the entry.
+            value: The value to be cached.
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Removes an entry from the cache, if it is present.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,27 @@
+from typing import Callable, Dict, Final
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+from sqlalchemy.orm import Session
+
+
+# The databases which the API runs on, each with the `insert` construct which supports `ON CONFLICT` & `RETURNING`.
+# `create_database_engine` refuses any other database, so every repository may rely on upserts.
+DIALECT_INSERTS: Final[Dict[str, Callable]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def dialect_insert(db: Session) -> Callable:
+    """
+    Retrieves the `insert` construct of the database of a session, i.e. for `INSERT ... ON CONFLICT`.
+
+    Args:
+        db: The database session.
+
+    Returns:
+        Callable: The `insert` construct of the dialect of the database.
+    """
+    return DIALECT_INSERTS[db.get_bind().dialect.name]
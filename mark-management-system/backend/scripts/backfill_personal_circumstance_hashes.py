@@ -0,0 +1,42 @@
+import sys
+import os
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+from sqlalchemy import create_engine
+
+from api.config import DevelopmentConfig
+from api.config import TestingConfig
+
+from api.system.schema_upgrades import upgrade_personal_circumstances
+
+from api.system.errors.duplicate_rows import DuplicateRows
+
+
+# Adds the `content_hash` column (and its unique index) to the `personal_circumstances` table of an existing database, as
+# `create_all` only creates new tables, and calculates the hash of every personal circumstance which is missing one. The
+# app does the same every time it starts (see `api/system/schema_upgrades.py`), so this is only needed to check a database
+# before it is deployed. Any duplicate personal circumstances are listed instead, as those must be resolved by hand first, e.g.
+#
+#   python scripts/backfill_personal_circumstance_hashes.py
+
+
+def main():
+    database_url = DevelopmentConfig.DATABASE_URL or TestingConfig.DATABASE_URL
+
+    if database_url:
+        engine = create_engine(database_url)
+
+    try:
+        upgrade_personal_circumstances(engine)
+    except DuplicateRows as e:
+        print(e.message)
+        sys.exit(1)
+
+    print("Created the unique index on the content hash of personal circumstances")
+
+
+if __name__ == "__main__":
+    main()
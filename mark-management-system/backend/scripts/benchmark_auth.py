@@ -0,0 +1,60 @@
+import sys
+import os
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+import timeit
+
+from datetime import datetime, timedelta
+
+from jose import jwt
+
+from api.config import Config
+
+from api.middleware.token_verifier import TokenVerifier
+from api.middleware.token_verifier import create_token_decoder
+
+
+# Measures the overhead of authenticating a request, i.e. verifying the access token which is sent with every request,
+# for each JWT decoder, with & without the cache of verified tokens, e.g.
+#
+#   python scripts/benchmark_auth.py 100000
+
+
+SECRET_KEY = "benchmark"
+
+
+def create_token() -> str:
+    expire = datetime.utcnow() + timedelta(minutes=Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    return jwt.encode(
+        {"type": "access", "exp": expire, "sub": "lecturer@mms.com", "is_admin": False, "is_lecturer": True},
+        SECRET_KEY,
+        algorithm=Config.JWT_ALGORITHM,
+    )
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    token = create_token()
+
+    for backend in ("jose", "pyjwt"):
+        try:
+            decoder = create_token_decoder(backend, SECRET_KEY, Config.JWT_ALGORITHM)
+        except ImportError:
+            print(f"{backend:>6}: not installed")
+            continue
+
+        verifier = TokenVerifier(decoder, maxsize=1024, ttl=300)
+
+        assert decoder.decode(token) is not None
+
+        uncached = timeit.timeit(lambda: decoder.decode(token), number=number) / number
+        cached = timeit.timeit(lambda: verifier.verify(token), number=number) / number
+
+        print(f"{backend:>6}: {uncached * 1e6:8.2f} µs per request, {cached * 1e6:8.2f} µs per request once verified")
+
+
+if __name__ == "__main__":
+    main()
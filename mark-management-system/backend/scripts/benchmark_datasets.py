@@ -0,0 +1,206 @@
+import sys
+import os
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+from random import Random
+
+from typing import Any, Dict, Final, Iterable, Iterator, List, NamedTuple, Optional
+
+from sqlalchemy import insert
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine import make_url
+
+from sqlalchemy.orm import Session
+
+from api.config import DevelopmentConfig
+from api.config import TestingConfig
+
+from api.database import create_database_engine
+
+from api.system.models.models import Class, Marks, Role, RoleUsers, Student, User
+
+from api.classes.repositories.class_statistics_repository import ClassStatisticsRepository
+
+from scripts.db_base_values import initialise_roles, create_users, create_degree
+from scripts.db_base_values import MIN_MU, MAX_MU, MIN_SIGMA, MAX_SIGMA
+
+
+# Seeds a database with a dataset of a given scale, for `benchmark_endpoints.py`. Unlike `db_base_values.py`, rows are
+# inserted in batches with Core inserts (rather than one at a time through the repositories), so that the large dataset,
+# i.e. 1M marks, can be seeded in minutes. The users of `db_base_values.py` are seeded as well, so that the benchmarks can
+# log in as `admin@mms.com` & `lecturer@mms.com`, where `lecturer@mms.com` teaches the first class.
+#
+# The benchmarks drop & recreate every table, so they only run against a dedicated database, see `benchmark_engine`.
+
+
+class Scale(NamedTuple):
+    students: int
+    classes: int
+    classes_per_student: int
+    classes_per_lecturer: int
+
+    @property
+    def marks(self) -> int:
+        return self.students * self.classes_per_student
+
+
+SCALES: Final[Dict[str, Scale]] = {
+    "small": Scale(students=1_000, classes=50, classes_per_student=10, classes_per_lecturer=5),
+    "medium": Scale(students=10_000, classes=500, classes_per_student=10, classes_per_lecturer=5),
+    "large": Scale(students=100_000, classes=5_000, classes_per_student=10, classes_per_lecturer=5),
+}
+
+INSERT_BATCH_SIZE: Final[int] = 10_000
+
+# The share of marks (in %) which only have a mark code, i.e. "ABS", as in `db_base_values.py`.
+ABSENT_PERCENTAGE: Final[int] = 2
+
+# Lecturers other than `lecturer@mms.com` never log in, so their password is not a valid hash.
+UNUSABLE_PASSWORD: Final[str] = "!"
+
+
+def benchmark_engine(database_url: Optional[str]) -> Engine:
+    """
+    Creates the engine of the database which a benchmark is run against, which is never the database of the app.
+
+    Args:
+        database_url: The URL of the database, i.e. from `--database-url`, otherwise `MMS_DATABASE_URL_TEST` is used.
+
+    Raises:
+        SystemExit: If no URL is given, or if it is the URL of the app's database (`MMS_DATABASE_URL`).
+
+    Returns:
+        Engine: The engine of the benchmark database.
+    """
+    database_url = database_url or TestingConfig.DATABASE_URL
+
+    if not database_url:
+        raise SystemExit("A dedicated benchmark database is required, pass --database-url or set MMS_DATABASE_URL_TEST")
+
+    if DevelopmentConfig.DATABASE_URL and make_url(database_url) == make_url(DevelopmentConfig.DATABASE_URL):
+        raise SystemExit("Refusing to benchmark against the app's database (MMS_DATABASE_URL), as every table is dropped")
+
+    return create_database_engine(database_url)
+
+def student_reg_no(index: int) -> str:
+    return f"bmk{index:06d}"
+
+def class_code(index: int) -> str:
+    return f"BM{index:04d}"
+
+def seed(db: Session, scale: Scale, random_seed: int = 0) -> None:
+    """
+    Seeds an empty database with a dataset of the given scale, including the statistics of every class. The changes are committed.
+
+    Args:
+        db: The database session.
+        scale: The number of students & classes, and how many classes each student takes & each lecturer teaches.
+        random_seed (default: 0): The seed of the marks, so that datasets of the same scale are identical between runs.
+    """
+    random = Random(random_seed)
+
+    initialise_roles(db)
+    create_users(db)
+    create_degree(db)
+    db.commit()
+
+    lecturer_role = db.query(Role).filter_by(title="lecturer").one()
+    lecturer = db.query(User).filter_by(email_address="lecturer@mms.com").one()
+
+    lecturer_ids = [lecturer.id] + insert_lecturers(db, lecturer_role.id, -(-scale.classes // scale.classes_per_lecturer) - 1)
+
+    class_ids = insert_all(db, Class, (
+        {
+            "name": f"Benchmark Class {index}",
+            "code": class_code(index),
+            "credit": 20,
+            "credit_level": 4,
+            "lecturer_id": lecturer_ids[index // scale.classes_per_lecturer],
+        }
+        for index in range(scale.classes)
+    ))
+
+    student_ids = insert_all(db, Student, (
+        {
+            "reg_no": student_reg_no(index),
+            "student_name": f"Benchmark Student {index}",
+            "year": index % 4 + 1,
+            "degree_id": 1,
+        }
+        for index in range(scale.students)
+    ))
+
+    distributions = [(random.randint(MIN_MU, MAX_MU), random.randint(MIN_SIGMA, MAX_SIGMA)) for _ in class_ids]
+
+    def marks() -> Iterator[Dict[str, Any]]:
+        for student_id in student_ids:
+            for index in random.sample(range(scale.classes), min(scale.classes_per_student, scale.classes)):
+                if random.randint(1, 100) <= ABSENT_PERCENTAGE:
+                    yield {"mark": None, "code": "ABS", "class_id": class_ids[index], "student_id": student_id}
+                    continue
+
+                mu, sigma = distributions[index]
+                mark = min(max(round(random.normalvariate(mu, sigma)), 0), 100)
+
+                yield {"mark": mark, "code": None, "class_id": class_ids[index], "student_id": student_id}
+
+    insert_all(db, Marks, marks(), returning=False)
+
+    ClassStatisticsRepository(db).rebuild()
+    db.commit()
+
+def insert_lecturers(db: Session, role_id: int, count: int) -> List[int]:
+    user_ids = insert_all(db, User, (
+        {
+            "email_address": f"lecturer{index}@benchmark.mms.com",
+            "first_name": "Benchmark",
+            "last_name": f"Lecturer {index}",
+            "password": UNUSABLE_PASSWORD,
+        }
+        for index in range(count)
+    ))
+
+    insert_all(db, RoleUsers, ({"role_id": role_id, "user_id": user_id} for user_id in user_ids), returning=False)
+
+    return user_ids
+
+def insert_all(db: Session, model: Any, rows: Iterable[Dict[str, Any]], returning: bool = True) -> List[int]:
+    """
+    Inserts rows in batches of `INSERT_BATCH_SIZE` & commits after each batch, so that the rows are never all held in memory.
+
+    Args:
+        db: The database session.
+        model: The model of the table.
+        rows: The rows, as dictionaries of column values.
+        returning (default: True): Whether the identifiers of the inserted rows are returned, in the order of the rows.
+
+    Returns:
+        List[int]: The identifiers of the inserted rows, or `[]` if `returning` is `False`.
+    """
+    ids: List[int] = []
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        if returning:
+            statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+            ids.extend(db.scalars(statement, batch))
+        else:
+            db.execute(insert(model), batch)
+
+        db.commit()
+        batch.clear()
+
+    for row in rows:
+        batch.append(row)
+
+        if len(batch) >= INSERT_BATCH_SIZE:
+            flush()
+
+    if batch:
+        flush()
+
+    return ids
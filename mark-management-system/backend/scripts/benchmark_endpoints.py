@@ -0,0 +1,368 @@
+import sys
+import os
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+import json
+import math
+import time
+import argparse
+import platform
+import statistics
+import tracemalloc
+
+from typing import Any, Callable, Dict, Final, List, NamedTuple, Optional
+
+from fastapi.testclient import TestClient
+
+from sqlalchemy import event
+from sqlalchemy import select
+
+from sqlalchemy.engine import Engine
+
+from sqlalchemy.orm import sessionmaker
+
+from api import create_app
+
+from api.database import get_db
+
+from api.system.models.models import Base, Class, Marks, Student
+
+from api.marks.statistics_cache import statistics_cache
+
+from scripts.benchmark_datasets import SCALES, Scale, seed, class_code, benchmark_engine
+
+
+# Times the endpoints which read (or write) marks at scale, through `TestClient`, and records the p50/p95 latency, the number
+# of queries & the peak memory of each endpoint as a JSON baseline, which a later run can be compared against to catch
+# regressions, i.e. in `MarkRepository` or the statistics use cases. The statistics cache is cleared before each request
+# (unless `--warm` is given), so that the queries behind each endpoint are measured rather than the cache.
+#
+# The database of `--database-url` (or `MMS_DATABASE_URL_TEST`) is recreated & seeded (see `benchmark_datasets.py`), so it
+# must be a dedicated database, and the app's database (`MMS_DATABASE_URL`) is refused. The large dataset (1M marks) should
+# be run against PostgreSQL, e.g.
+#
+#   MMS_DATABASE_URL_TEST=sqlite:////tmp/mms_benchmark.db python scripts/benchmark_endpoints.py --scale small --output baseline.json
+#   MMS_DATABASE_URL_TEST=sqlite:////tmp/mms_benchmark.db python scripts/benchmark_endpoints.py --scale small --compare baseline.json
+#
+# Where `MMS_DATABASE_URL` is set, i.e. in docker compose, the benchmark database is passed with `--database-url` instead.
+#
+# `benchmark_baseline.json` is a baseline of the small dataset on SQLite. Only the query counts are portable, so `--compare`
+# only compares those, unless `--timings` is given. Latencies & memory depend on the machine, so a baseline to compare them
+# against must be re-recorded (with `--output`) on the machine which the benchmarks are run on.
+
+
+PASSWORD: Final[str] = "12345678"
+
+USERS: Final[Dict[str, str]] = {
+    "admin": "admin@mms.com",
+    "lecturer": "lecturer@mms.com",
+}
+
+
+class Fixtures(NamedTuple):
+    """
+    The rows of the seeded dataset which the endpoints are called with.
+    """
+    class_id: int
+    class_code: str
+    reg_no: str
+    mark_id: int
+    free_student_ids: List[int]
+
+
+class Endpoint(NamedTuple):
+    name: str
+    user: str
+    method: str
+    path: Callable[[Fixtures, int], str]
+    body: Optional[Callable[[Fixtures, int], Dict[str, Any]]] = None
+
+
+ENDPOINTS: Final[List[Endpoint]] = [
+    Endpoint("marks.statistics", "lecturer", "GET", lambda f, i: "/api/v1/marks/statistics"),
+    Endpoint("marks.global_statistics", "admin", "GET", lambda f, i: "/api/v1/marks/global/statistics/all"),
+    Endpoint("classes.statistics", "lecturer", "GET", lambda f, i: f"/api/v1/classes/{f.class_code}/statistics"),
+    Endpoint("classes.metrics", "lecturer", "GET", lambda f, i: "/api/v1/classes/metrics/all"),
+    Endpoint("classes.list", "admin", "GET", lambda f, i: "/api/v1/classes"),
+    Endpoint("classes.lecturer", "lecturer", "GET", lambda f, i: "/api/v1/classes/lecturer"),
+    Endpoint("marks.lecturer", "lecturer", "GET", lambda f, i: "/api/v1/marks"),
+    Endpoint("marks.class", "admin", "GET", lambda f, i: f"/api/v1/marks/class/{f.class_code}/all"),
+    Endpoint("users.lecturers", "admin", "GET", lambda f, i: "/api/v1/lecturers"),
+    Endpoint("students.list", "admin", "GET", lambda f, i: "/api/v1/students"),
+    Endpoint("students.profile", "lecturer", "GET", lambda f, i: f"/api/v1/students/{f.reg_no}"),
+    Endpoint("students.statistics", "lecturer", "GET", lambda f, i: f"/api/v1/students/{f.reg_no}/statistics"),
+    Endpoint("marks.student", "lecturer", "GET", lambda f, i: f"/api/v1/marks/{f.reg_no}"),
+    Endpoint(
+        "marks.create",
+        "lecturer",
+        "POST",
+        lambda f, i: "/api/v1/marks",
+        lambda f, i: {"mark": 40 + i % 60, "class_id": f.class_id, "student_id": f.free_student_ids[i]},
+    ),
+    Endpoint(
+        "marks.edit",
+        "lecturer",
+        "PUT",
+        lambda f, i: f"/api/v1/marks/{f.mark_id}",
+        lambda f, i: {"id": f.mark_id, "mark": 40 + i % 60},
+    ),
+]
+
+
+class QueryCounter:
+    """
+    Counts the statements executed by an engine, from the moment it is created until it is removed.
+    """
+    def __init__(self, engine: Any) -> None:
+        self.engine = engine
+        self.count = 0
+
+        event.listen(self.engine, "before_cursor_execute", self._increment)
+
+    def _increment(self, *_: Any) -> None:
+        self.count += 1
+
+    def remove(self) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._increment)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    # Nearest-rank, so that the percentile is always one of the measured values.
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+def load_fixtures(engine: Engine, requests: int) -> Fixtures:
+    with sessionmaker(bind=engine)() as db:
+        class_ = db.execute(select(Class.id, Class.code).where(Class.code == class_code(0))).one()
+
+        reg_no, mark_id = db.execute(
+            select(Student.reg_no, Marks.id)
+            .join(Marks, Marks.student_id == Student.id)
+            .where(Marks.class_id == class_.id, Marks.mark.is_not(None))
+            .order_by(Marks.id)
+            .limit(1)
+        ).one()
+
+        # Students without a mark in the class, so that each request creates a new mark, i.e. one for the warm up & one for memory.
+        free_student_ids = list(db.scalars(
+            select(Student.id)
+            .where(~select(Marks.id).where(Marks.student_id == Student.id, Marks.class_id == class_.id).exists())
+            .order_by(Student.id)
+            .limit(requests + 2)
+        ))
+
+    if len(free_student_ids) < requests + 2:
+        raise SystemExit(f"The dataset only has {len(free_student_ids)} students without a mark in {class_.code}, reduce --requests")
+
+    return Fixtures(class_.id, class_.code, reg_no, mark_id, free_student_ids)
+
+def login(client: TestClient, email_address: str) -> Dict[str, str]:
+    response = client.post("/api/v1/users/login", data={"username": email_address, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+def measure(
+    client: TestClient,
+    engine: Engine,
+    endpoint: Endpoint,
+    headers: Dict[str, str],
+    fixtures: Fixtures,
+    requests: int,
+    warm: bool,
+) -> Dict[str, Any]:
+    def call(index: int) -> None:
+        body = endpoint.body(fixtures, index) if endpoint.body else None
+        response = client.request(endpoint.method, endpoint.path(fixtures, index), json=body, headers=headers)
+
+        assert response.status_code < 300, f"{endpoint.name}: {response.status_code} {response.text}"
+
+    def prepare() -> None:
+        if not warm:
+            statistics_cache.clear()
+
+    # The first request warms up the app, i.e. the token verifier & the pool, and is not measured.
+    prepare()
+    call(0)
+
+    latencies, queries = [], []
+    counter = QueryCounter(engine)
+
+    try:
+        for index in range(1, requests + 1):
+            prepare()
+            counter.count = 0
+
+            start = time.perf_counter()
+            call(index)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            queries.append(counter.count)
+    finally:
+        counter.remove()
+
+    # Memory is measured by a separate request, as tracing slows down every allocation & would skew the latencies.
+    prepare()
+    tracemalloc.start()
+
+    try:
+        call(requests + 1)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "max_ms": round(max(latencies), 3),
+        "queries": round(statistics.median(queries)),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, timings: bool) -> List[str]:
+    """
+    Compares the results of a run against a baseline.
+
+    Args:
+        results: The results of this run.
+        baseline: The results of a previous run, i.e. from `--output`.
+        tolerance: How many times slower (or larger) than the baseline an endpoint may be before it counts as a regression.
+        timings: Whether the latencies & peak memory are compared, rather than only the query counts, which is only
+                 meaningful against a baseline recorded on the same machine.
+
+    Returns:
+        List[str]: A description of each regression, however can also return `[]` if there are none.
+    """
+    regressions: List[str] = []
+
+    if results["scale"] != baseline["scale"]:
+        print(f"warning: the baseline was recorded at a different scale ({baseline['scale']})")
+
+    for name, result in results["endpoints"].items():
+        previous = baseline["endpoints"].get(name)
+
+        if previous is None:
+            continue
+
+        print(
+            f"{name:>24}: p95 {result['p95_ms']:9.2f} ms (was {previous['p95_ms']:9.2f}), "
+            f"{result['queries']:3d} queries (was {previous['queries']:3d}), "
+            f"{result['peak_memory_kib']:9.1f} KiB (was {previous['peak_memory_kib']:9.1f})"
+        )
+
+        if result["queries"] > previous["queries"]:
+            regressions.append(f"{name}: {result['queries']} queries exceeds {previous['queries']}")
+
+        if not timings:
+            continue
+
+        if result["p95_ms"] > previous["p95_ms"] * tolerance:
+            regressions.append(f"{name}: p95 latency {result['p95_ms']} ms exceeds {previous['p95_ms']} ms x {tolerance}")
+
+        if result["peak_memory_kib"] > previous["peak_memory_kib"] * tolerance:
+            regressions.append(f"{name}: peak memory {result['peak_memory_kib']} KiB exceeds {previous['peak_memory_kib']} KiB x {tolerance}")
+
+    return regressions
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks the mark & statistics endpoints against a seeded dataset.")
+
+    parser.add_argument("--database-url", help="The URL of a dedicated benchmark database (default: MMS_DATABASE_URL_TEST)")
+    parser.add_argument("--scale", choices=SCALES, default="small", help="The size of the dataset (default: small)")
+    parser.add_argument("--students", type=int, help="Overrides the number of students of the scale")
+    parser.add_argument("--classes", type=int, help="Overrides the number of classes of the scale")
+    parser.add_argument("--requests", type=int, default=20, help="The number of measured requests per endpoint (default: 20)")
+    parser.add_argument("--endpoint", action="append", help="Only benchmarks the given endpoint(s), by name")
+    parser.add_argument("--warm", action="store_true", help="Keeps the statistics cache between requests")
+    parser.add_argument("--reuse", action="store_true", help="Reuses the dataset of a previous run with --keep, if it is the same size")
+    parser.add_argument("--keep", action="store_true", help="Keeps the dataset once the benchmarks have finished")
+    parser.add_argument("--output", help="Writes the results as JSON to the given file, i.e. a new baseline")
+    parser.add_argument("--compare", help="Compares the results against a baseline, and exits with 1 on any regression")
+    parser.add_argument("--timings", action="store_true", help="Also compares the latencies & memory, against a baseline of this machine")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="The slowdown allowed when comparing timings (default: 1.5)")
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    scale: Scale = SCALES[args.scale]
+    scale = scale._replace(students=args.students or scale.students, classes=args.classes or scale.classes)
+
+    engine = benchmark_engine(args.database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with SessionLocal() as db:
+        Base.metadata.create_all(bind=engine)
+        reusable = args.reuse and db.query(Student).count() == scale.students and db.query(Class).count() == scale.classes
+
+    if not reusable:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+        start = time.perf_counter()
+
+        with SessionLocal() as db:
+            seed(db, scale)
+
+        print(f"Seeded {scale.students} students, {scale.classes} classes & {scale.marks} marks in {time.perf_counter() - start:.1f}s")
+
+    endpoints = [endpoint for endpoint in ENDPOINTS if not args.endpoint or endpoint.name in args.endpoint]
+
+    def get_benchmark_db():
+        with SessionLocal() as db:
+            yield db
+
+    app = create_app()
+    app.dependency_overrides[get_db] = get_benchmark_db
+
+    client = TestClient(app)
+
+    try:
+        fixtures = load_fixtures(engine, args.requests)
+        headers = {user: login(client, email_address) for user, email_address in USERS.items()}
+
+        results: Dict[str, Any] = {
+            "scale": {"name": args.scale, **scale._asdict(), "marks": scale.marks},
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "requests": args.requests,
+            "warm": args.warm,
+            "endpoints": {},
+        }
+
+        for endpoint in endpoints:
+            result = measure(client, engine, endpoint, headers[endpoint.user], fixtures, args.requests, args.warm)
+            results["endpoints"][endpoint.name] = result
+
+            print(
+                f"{endpoint.name:>24}: p50 {result['p50_ms']:9.2f} ms, p95 {result['p95_ms']:9.2f} ms, "
+                f"{result['queries']:3d} queries, {result['peak_memory_kib']:9.1f} KiB peak"
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+        if not args.keep:
+            Base.metadata.drop_all(bind=engine)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+            file.write("\n")
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.tolerance, args.timings)
+
+        for regression in regressions:
+            print(f"regression: {regression}")
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
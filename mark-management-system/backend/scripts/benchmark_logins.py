@@ -0,0 +1,112 @@
+import sys
+import os
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+import time
+import argparse
+
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from api import create_app
+
+from api.database import get_db
+
+from api.config import Config
+
+from api.system.models.models import Base
+
+from api.users.dependencies import get_bcrypt_hasher
+from api.users.hashers.bcrypt_hasher import BCryptHasher
+from api.users.hashers.hashing_pool import get_hashing_pool
+from api.users.hashers.hashing_pool import shutdown_hashing_pool
+
+from sqlalchemy.orm import sessionmaker
+
+from scripts.db_base_values import initialise_roles, create_users
+
+from scripts.benchmark_datasets import benchmark_engine
+
+
+# Measures how many logins per second the API sustains under concurrency, with passwords hashed in the request handlers
+# and in the hashing process pool, at a cost of `BCRYPT_ROUNDS`. The database of `--database-url` (or `MMS_DATABASE_URL_TEST`)
+# is recreated, so it must be a dedicated database, and the app's database (`MMS_DATABASE_URL`) is refused, e.g.
+#
+#   MMS_DATABASE_URL_TEST=sqlite:////tmp/mms_benchmark.db python scripts/benchmark_logins.py 16 64
+#
+# Where `MMS_DATABASE_URL` is set, i.e. in docker compose, the benchmark database is passed with `--database-url` instead.
+
+
+def measure(client: TestClient, concurrency: int, logins: int) -> float:
+    def login(_: int) -> int:
+        return client.post("/api/v1/users/login", data={"username": "lecturer@mms.com", "password": "12345678"}).status_code
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        status_codes = list(executor.map(login, range(logins)))
+
+    elapsed = time.perf_counter() - start
+
+    assert all(status_code == 200 for status_code in status_codes), status_codes
+
+    return logins / elapsed
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks how many logins per second the API sustains under concurrency.")
+
+    parser.add_argument("concurrency", type=int, nargs="?", default=16, help="The number of concurrent logins (default: 16)")
+    parser.add_argument("logins", type=int, nargs="?", default=64, help="The number of measured logins (default: 64)")
+    parser.add_argument("--database-url", help="The URL of a dedicated benchmark database (default: MMS_DATABASE_URL_TEST)")
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    concurrency, logins = args.concurrency, args.logins
+
+    engine = benchmark_engine(args.database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    with SessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    def get_benchmark_db():
+        with SessionLocal() as db:
+            yield db
+
+    app = create_app()
+    app.dependency_overrides[get_db] = get_benchmark_db
+
+    client = TestClient(app)
+
+    hashers = {
+        "inline": lambda: BCryptHasher(Config.BCRYPT_ROUNDS),
+        f"{max(Config.BCRYPT_PROCESSES, 1)} processes": lambda: BCryptHasher(Config.BCRYPT_ROUNDS, get_hashing_pool(max(Config.BCRYPT_PROCESSES, 1))),
+    }
+
+    try:
+        for name, hasher in hashers.items():
+            app.dependency_overrides[get_bcrypt_hasher] = hasher
+
+            # Rehashes the seeded passwords at `BCRYPT_ROUNDS` (and starts the process pool) before measuring.
+            measure(client, 1, 1)
+
+            print(f"{name:>12}: {measure(client, concurrency, logins):8.2f} logins/s ({concurrency} concurrent, {Config.BCRYPT_ROUNDS} rounds)")
+    finally:
+        app.dependency_overrides.clear()
+        shutdown_hashing_pool()
+        Base.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    main()
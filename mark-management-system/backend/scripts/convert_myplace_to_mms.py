@@ -0,0 +1,99 @@
+import sys
+import os
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+import argparse
+
+from sqlalchemy import create_engine
+
+from sqlalchemy.orm import sessionmaker
+
+from api.config import Config
+from api.config import DevelopmentConfig
+from api.config import TestingConfig
+
+from api.users.repositories.user_repository import UserRepository
+from api.students.repositories.student_repository import StudentRepository
+from api.classes.repositories.class_repository import ClassRepository
+from api.marks.repositories.mark_repository import MarkRepository
+
+from api.marks.use_cases.convert_myplace_file_use_case import ConvertMyPlaceFileUseCase
+from api.marks.use_cases.import_myplace_file_use_case import ImportMyPlaceFileUseCase
+
+from api.marks.validators import MarkValidator
+
+from api.marks.myplace import open_myplace_file
+
+from api.marks.statistics_cache import statistics_cache
+
+
+# Converts a MyPlace export to a mark upload file, which is written to standard output (or `--output`), or imports it
+# as marks on behalf of a user with `--import-as`, in which case the NDJSON lines of `/api/v1/marks/myplace/import` are
+# written instead. The file is streamed, so it can be of any size, e.g.
+#
+#   python scripts/convert_myplace_to_mms.py export.csv --output converted.csv
+#   python scripts/convert_myplace_to_mms.py export.csv --import-as lecturer@mms.com --overwrite
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Converts (or imports) a MyPlace export.")
+    parser.add_argument("file", help="The MyPlace export (CSV)")
+    parser.add_argument("--output", help="The file to write the mark upload file to, rather than standard output")
+    parser.add_argument("--import-as", metavar="EMAIL", help="Imports the marks as the user with this email address, rather than converting the file")
+    parser.add_argument("--overwrite", action="store_true", help="Replaces marks which already exist when importing")
+
+    args = parser.parse_args()
+
+    database_url = DevelopmentConfig.DATABASE_URL or TestingConfig.DATABASE_URL
+
+    if database_url:
+        engine = create_engine(database_url)
+
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
+
+    user_repository = UserRepository(db)
+    student_repository = StudentRepository(db)
+
+    try:
+        with open(args.file, "rb") as file:
+            if args.import_as:
+                user = user_repository.find_by_email(args.import_as)
+
+                roles = {role.title for role in user.roles} if user else set()
+                current_user = (args.import_as, "admin" in roles, "lecturer" in roles)
+
+                use_case = ImportMyPlaceFileUseCase(
+                    MarkRepository(db),
+                    user_repository,
+                    ClassRepository(db),
+                    student_repository,
+                    MarkValidator(),
+                    statistics_cache,
+                    Config(),
+                )
+
+                lines = use_case.execute(file, current_user, args.overwrite)
+            else:
+                use_case = ConvertMyPlaceFileUseCase(user_repository, student_repository, Config())
+
+                # The file is converted by whoever has access to the database, so the permission check is skipped.
+                lines = use_case.convert(*open_myplace_file(file))
+
+            output = open(args.output, "w", newline="") if args.output else sys.stdout
+
+            try:
+                for line in lines:
+                    output.write(line)
+            finally:
+                if args.output:
+                    output.close()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
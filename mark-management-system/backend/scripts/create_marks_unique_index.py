@@ -0,0 +1,42 @@
+import sys
+import os
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+from sqlalchemy import create_engine
+
+from api.config import DevelopmentConfig
+from api.config import TestingConfig
+
+from api.system.schema_upgrades import create_marks_unique_index
+
+from api.system.errors.duplicate_rows import DuplicateRows
+
+
+# Creates the unique index on `marks(student_id, class_id)` on an existing database, as `create_all` only creates the
+# indexes of new tables. The app does the same every time it starts (see `api/system/schema_upgrades.py`), so this is
+# only needed to check a database before it is deployed. Any student with more than one mark for a class is listed
+# instead, as those must be resolved by hand first, e.g.
+#
+#   python scripts/create_marks_unique_index.py
+
+
+def main():
+    database_url = DevelopmentConfig.DATABASE_URL or TestingConfig.DATABASE_URL
+
+    if database_url:
+        engine = create_engine(database_url)
+
+    try:
+        create_marks_unique_index(engine)
+    except DuplicateRows as e:
+        print(e.message)
+        sys.exit(1)
+
+    print("Created the unique index on the marks table")
+
+
+if __name__ == "__main__":
+    main()
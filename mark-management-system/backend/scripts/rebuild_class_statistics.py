@@ -0,0 +1,54 @@
+import sys
+import os
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+from sqlalchemy import create_engine
+
+from sqlalchemy.orm import sessionmaker
+
+from api.system.models.models import Base
+
+from api.config import DevelopmentConfig
+from api.config import TestingConfig
+
+from api.classes.repositories.class_repository import ClassRepository
+from api.classes.repositories.class_statistics_repository import ClassStatisticsRepository
+
+
+# Rebuilds the `class_statistics` summary table from the `marks` table, i.e. after it is first created or after marks
+# have been written outside of the API. Class codes may be passed as arguments to only rebuild those classes, e.g.
+#
+#   python scripts/rebuild_class_statistics.py CS412 CS407
+
+
+def main():
+    database_url = DevelopmentConfig.DATABASE_URL or TestingConfig.DATABASE_URL
+
+    if database_url:
+        engine = create_engine(database_url)
+
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+
+    try:
+        class_statistics_repository = ClassStatisticsRepository(db)
+
+        class_ids = None
+
+        if len(sys.argv) > 1:
+            class_ids = [class_.id for class_ in ClassRepository(db).find_by_codes(sys.argv[1:])]
+
+        rebuilt = class_statistics_repository.rebuild(class_ids)
+        db.commit()
+
+        print(f"Rebuilt the statistics of {rebuilt} class(es)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
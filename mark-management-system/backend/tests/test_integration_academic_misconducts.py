@@ -2,6 +2,8 @@ import sys
 import os
 import pytest
 
+from datetime import date
+
 from typing import Generator, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,6 +13,7 @@ from fastapi.testclient import TestClient
 from api import create_app
 
 from api.system.models.models import Base
+from api.system.models.models import AcademicMisconduct
 from api.database import engine
 from api.config import TestingConfig
 from api.database import get_db
@@ -93,6 +96,41 @@ def test_when_creating_academic_misconducts_with_correct_details_then_academic_m
     
     assert response.status_code == 200
 
+def test_when_creating_academic_misconducts_with_a_lower_case_outcome_then_outcome_is_stored_in_upper_case(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_degree(db)
+        create_students(db)
+        create_users(db)
+        create_classes(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    SAMPLE_ACADEMIC_MISCONDUCT_BODY = {
+        "date": "2024-03-04",
+        "outcome": "under investigation",
+        "reg_no": "abc12345",
+        "class_code": "CS412"
+    }
+
+    response = client.post(
+        f"/api/v1/academic-misconducts",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_ACADEMIC_MISCONDUCT_BODY
+    )
+
+    assert response.status_code == 200
+    assert response.json()["outcome"] == "UNDER INVESTIGATION"
+
+    with TestingSessionLocal() as db:
+        assert db.query(AcademicMisconduct).filter_by(outcome="UNDER INVESTIGATION").count() == 1
+
 def test_when_creating_academic_misconducts_with_wrong_student_reg_no_then_student_not_found_is_thrown(
         test_db: Generator[None, Any, None]
     ):
@@ -218,6 +256,71 @@ def test_given_a_base_user_when_creating_academic_misconducts_then_error_is_thro
     
     assert response.status_code == 403
 
+def test_when_creating_academic_misconducts_in_bulk_then_valid_rows_are_created_and_errors_are_reported_per_row(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_degree(db)
+        create_students(db)
+        create_users(db)
+        create_classes(db)
+        create_marks(db)   
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_ACADEMIC_MISCONDUCT_BULK_BODY = {
+        "academic_misconducts": [
+            {"date": "2024-03-04", "outcome": "UPHELD", "reg_no": "abc12345", "class_code": "CS412"},
+            {"date": "2024-03-04", "outcome": "under investigation", "reg_no": "abc12345", "class_code": "CS407"},
+            {"date": "04/03/2024", "outcome": "UPHELD", "reg_no": "abc12345", "class_code": "CS412"},
+            {"date": "2024-03-04", "outcome": "DISMISSED", "reg_no": "abc12345", "class_code": "CS412"},
+            {"date": "2024-03-04", "outcome": "UPHELD", "reg_no": "abc12345", "class_code": "CS408"},
+            {"date": "2024-03-04", "outcome": "UPHELD", "reg_no": "zzz00000", "class_code": "CS412"},
+            {"date": "2024-03-04", "outcome": "UPHELD", "reg_no": "abc12345", "class_code": "XX999"},
+        ]
+    }
+
+    response = client.post(
+        f"/api/v1/academic-misconducts/bulk",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_ACADEMIC_MISCONDUCT_BULK_BODY
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+    assert [result["status"] for result in response.json()["results"]] == [
+        "created", "created", "invalid", "invalid", "student_not_in_class", "student_not_found", "class_not_found"
+    ]
+
+    with TestingSessionLocal() as db:
+        assert db.query(AcademicMisconduct).filter_by(outcome="UNDER INVESTIGATION").count() == 1
+
+def test_given_a_base_user_when_creating_academic_misconducts_in_bulk_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_degree(db)
+        create_students(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "base@mms.com", "12345678"
+    )
+
+    response = client.post(
+        f"/api/v1/academic-misconducts/bulk",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json={"academic_misconducts": []}
+    )
+    
+    assert response.status_code == 403
+
 def test_given_academic_misconducts_when_retrieving_misconducts_then_misconducts_are_returned(
         test_db: Generator[None, Any, None]
     ):
@@ -244,6 +347,39 @@ def test_given_academic_misconducts_when_retrieving_misconducts_then_misconducts
     
     assert response.status_code == 200
 
+def test_given_academic_misconducts_for_several_students_when_retrieving_misconducts_then_only_the_students_misconducts_are_returned(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_degree(db)
+        create_students(db)
+        create_users(db)
+        create_classes(db)
+        create_marks(db)
+
+        db.add(AcademicMisconduct(date=date(2024, 1, 1), outcome="UPHELD", student_id=1, class_id=2))
+        db.add(AcademicMisconduct(date=date(2024, 3, 1), outcome="UNDER INVESTIGATION", student_id=1, class_id=3))
+        db.add(AcademicMisconduct(date=date(2024, 2, 1), outcome="UNDER INVESTIGATION", student_id=2, class_id=2))
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    SAMPLE_STUDENT_REG_NO = "abc12345"
+
+    response = client.get(
+        f"/api/v1/academic-misconducts/{SAMPLE_STUDENT_REG_NO}",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+    
+    assert response.status_code == 200
+    assert response.json() == [
+        {"date": "2024-01-01", "outcome": "UPHELD", "class_code": "CS407"},
+        {"date": "2024-03-01", "outcome": "UNDER INVESTIGATION", "class_code": "CS426"},
+    ]
+
 def test_given_misconduct_when_requestor_does_not_have_sufficient_permissions_then_error_is_thrown(
         test_db: Generator[None, Any, None]
     ):
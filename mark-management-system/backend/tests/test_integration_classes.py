@@ -11,9 +11,13 @@ from fastapi.testclient import TestClient
 from api import create_app
 
 from api.system.models.models import Base
+from api.system.models.models import Marks
+from api.marks.repositories.mark_repository import MarkRepository
+from api.classes.repositories.class_statistics_repository import ClassStatisticsRepository
 from api.database import engine
 from api.config import TestingConfig
 from api.database import get_db
+from api.marks.statistics_cache import statistics_cache
 
 from scripts.db_base_values import (
     initialise_roles,
@@ -55,6 +59,7 @@ client = TestClient(app)
 @pytest.fixture()
 def test_db():
     Base.metadata.create_all(bind=engine)
+    statistics_cache.clear()
     yield
     Base.metadata.drop_all(bind=engine)
     engine.dispose()
@@ -510,6 +515,143 @@ def test_given_a_class_when_retrieving_statistics_of_that_class_then_statistics_
     
     assert response.status_code == 200
 
+def test_given_known_marks_when_retrieving_statistics_of_that_class_then_statistics_are_calculated_correctly(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_classes(db)
+        create_students(db)
+
+        for student_id, mark, code in ((1, 70, None), (2, 61, None), (3, 61, None), (4, 40, None), (5, None, "ABS")):
+            db.add(Marks(mark=mark, code=code, class_id=1, student_id=student_id))
+
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    SAMPLE_CLASS_CODE = "CS412"
+
+    response = client.get(
+        f"/api/v1/classes/{SAMPLE_CLASS_CODE}/statistics",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+    
+    assert response.status_code == 200
+    assert response.json() == {
+        "mean": 58,
+        "median": 61,
+        "mode": 61,
+        "pass_rate": 80,
+        "first_bucket": 0,
+        "second_bucket": 1,
+        "third_bucket": 0,
+        "fourth_bucket": 2,
+        "fifth_bucket": 1,
+    }
+
+def test_given_marks_are_edited_and_deleted_when_retrieving_statistics_of_that_class_then_statistics_are_up_to_date(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_classes(db)
+        create_students(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    edit_response = client.put(
+        f"/api/v1/marks/1",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json={"id": 1, "mark": 12}
+    )
+
+    delete_response = client.delete(
+        f"/api/v1/marks/4",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    SAMPLE_CLASS_CODE = "CS412"
+
+    response = client.get(
+        f"/api/v1/classes/{SAMPLE_CLASS_CODE}/statistics",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    with TestingSessionLocal() as db:
+        expected_statistics = MarkRepository(db).get_marks_statistics(40, class_code=SAMPLE_CLASS_CODE)
+
+        class_statistics_repository = ClassStatisticsRepository(db)
+
+        maintained_statistics = [
+            (statistics.class_id, statistics.row_count, statistics.mark_sum, statistics.mark_sum_of_squares, statistics.histogram)
+            for statistics, _ in class_statistics_repository.get_class_statistics()
+        ]
+
+        class_statistics_repository.rebuild()
+        db.flush()
+
+        rebuilt_statistics = [
+            (statistics.class_id, statistics.row_count, statistics.mark_sum, statistics.mark_sum_of_squares, statistics.histogram)
+            for statistics, _ in class_statistics_repository.get_class_statistics()
+        ]
+    
+    assert edit_response.status_code == 200
+    assert delete_response.status_code == 200
+    assert response.status_code == 200
+    assert response.json() == expected_statistics.model_dump()
+    assert maintained_statistics == rebuilt_statistics
+
+def test_given_cached_statistics_when_a_mark_is_edited_then_the_statistics_of_the_class_are_recalculated(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_classes(db)
+        create_students(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_CLASS_CODE = "CS412"
+
+    cached_response = client.get(
+        f"/api/v1/classes/{SAMPLE_CLASS_CODE}/statistics",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    edit_response = client.put(
+        f"/api/v1/marks/1",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json={"id": 1, "mark": 12}
+    )
+
+    response = client.get(
+        f"/api/v1/classes/{SAMPLE_CLASS_CODE}/statistics",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert cached_response.status_code == 200
+    assert edit_response.status_code == 200
+    assert response.status_code == 200
+    assert response.json()["first_bucket"] == cached_response.json()["first_bucket"] + 1
+    assert response.json()["fifth_bucket"] == cached_response.json()["fifth_bucket"] - 1
+
 def test_given_no_marks_in_the_system_when_retrieving_statistics_of_that_class_then_error_is_thrown(
         test_db: Generator[None, Any, None]
     ):
@@ -555,6 +697,73 @@ def test_given_classes_in_the_system_when_retrieving_metrics_of_that_class_then_
     
     assert response.status_code == 200
 
+def test_given_a_k_when_retrieving_metrics_of_classes_then_the_k_lowest_and_highest_classes_are_returned(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_degree(db)
+        create_students(db)
+        create_users(db)
+        create_classes(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    all_classes_response = client.get(
+        f"/api/v1/classes/metrics/all?k=4",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    response = client.get(
+        f"/api/v1/classes/metrics/all?k=2",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    all_classes = all_classes_response.json()
+    
+    assert response.status_code == 200
+    assert [class_["mean"] for class_ in all_classes["lowest_performing_classes"]] == sorted(
+        class_["mean"] for class_ in all_classes["highest_performing_classes"]
+    )
+    assert response.json()["lowest_performing_classes"] == all_classes["lowest_performing_classes"][:2]
+    assert response.json()["highest_performing_classes"] == all_classes["highest_performing_classes"][-2:]
+    assert response.json()["most_consistent_classes"] == all_classes["most_consistent_classes"][-2:]
+
+def test_given_marks_without_class_statistics_when_retrieving_metrics_of_classes_then_metrics_are_calculated_from_marks(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_classes(db)
+        create_students(db)
+
+        # Written outside of the API (i.e. before the statistics existed), so no class has statistics yet.
+        for student_id, mark, code, class_id in ((1, 70, None, 1), (2, 60, None, 1), (3, None, "ABS", 1), (1, 40, None, 2)):
+            db.add(Marks(mark=mark, code=code, class_id=class_id, student_id=student_id))
+
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/classes/metrics/all",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert [(class_["code"], class_["mean"]) for class_ in response.json()["highest_performing_classes"]] == [
+        ("CS407", 40),
+        ("CS412", 65),
+    ]
+
 def test_given_no_marks_in_the_system_when_retrieving_metrics_of_that_class_then_error_is_thrown(
         test_db: Generator[None, Any, None]
     ):
@@ -1,5 +1,8 @@
+import io
 import sys
 import os
+import csv
+import json
 import pytest
 
 from typing import Generator, Any
@@ -11,9 +14,11 @@ from fastapi.testclient import TestClient
 from api import create_app
 
 from api.system.models.models import Base
+from api.system.models.models import Marks
 from api.database import engine
 from api.config import TestingConfig
 from api.database import get_db
+from api.marks.statistics_cache import statistics_cache
 
 from scripts.db_base_values import (
     initialise_roles,
@@ -25,6 +30,7 @@ from scripts.db_base_values import (
 )
 
 from sqlalchemy import create_engine
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
 # Some of the code below has been taken in parts from the official FastAPI documentation:
@@ -55,6 +61,7 @@ client = TestClient(app)
 @pytest.fixture()
 def test_db():
     Base.metadata.create_all(bind=engine)
+    statistics_cache.clear()
     yield
     Base.metadata.drop_all(bind=engine)
     engine.dispose()
@@ -581,6 +588,56 @@ def test_given_a_user_with_insufficient_permissions_when_retrieving_student_stat
     
     assert response.status_code == 403
 
+def test_given_unchanged_marks_when_retrieving_student_statistics_conditionally_then_not_modified_is_returned(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/marks/statistics",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        f"/api/v1/marks/statistics",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}", "If-None-Match": etag},
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    response = client.put(
+        f"/api/v1/marks/1",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json={"id": 1, "mark": 73}
+    )
+
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/api/v1/marks/statistics",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}", "If-None-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
 def test_given_a_valid_student_reg_no_when_retrieving_student_marks_then_marks_are_returned(
         test_db: Generator[None, Any, None]
     ):
@@ -729,6 +786,487 @@ def test_given_no_marks_in_the_system_when_retrieving_student_marks_for_the_clas
     
     assert response.status_code == 404
 
+def test_when_creating_marks_in_bulk_with_correct_details_then_marks_are_created(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_BULK_BODY = {
+        "marks": [
+            {"class_code": "CS412", "reg_no": "abc12345", "mark": 72},
+            {"class_code": "CS412", "reg_no": "abc54321", "mark": 35, "code": "PM"},
+            {"class_code": "CS412", "reg_no": "abc33311", "code": "ABS"},
+        ]
+    }
+
+    response = client.post(
+        f"/api/v1/marks/bulk",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_BULK_BODY
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["created"] == 3
+    assert response.json()["failed"] == 0
+    assert all(result["mark_id"] is not None for result in response.json()["results"])
+
+def test_given_invalid_rows_when_creating_marks_in_bulk_then_errors_are_reported_per_row(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_BULK_BODY = {
+        "marks": [
+            {"class_code": "CS412", "reg_no": "abc12345", "mark": 72},
+            {"class_code": "XX999", "reg_no": "abc12345", "mark": 72},
+            {"class_code": "CS412", "reg_no": "zzz00000", "mark": 72},
+            {"class_code": "CS412", "reg_no": "abc33355", "mark": 172},
+            {"class_code": "CS412", "reg_no": "abc33355"},
+            {"class_code": "CS408", "reg_no": "abc33355", "mark": 50},
+        ]
+    }
+
+    response = client.post(
+        f"/api/v1/marks/bulk",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_BULK_BODY
+    )
+    
+    assert response.status_code == 200
+    assert [result["status"] for result in response.json()["results"]] == [
+        "already_exists", "class_not_found", "student_not_found", "invalid", "invalid", "created"
+    ]
+
+def test_given_existing_marks_when_creating_marks_in_bulk_with_overwrite_then_marks_are_updated(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_BULK_BODY = {
+        "marks": [
+            {"class_code": "CS412", "reg_no": "abc12345", "mark": 45},
+            {"class_code": "CS412", "reg_no": "abc33355", "mark": 50},
+        ],
+        "overwrite": True
+    }
+
+    response = client.post(
+        f"/api/v1/marks/bulk",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_BULK_BODY
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["created"] == 1
+    assert response.json()["updated"] == 1
+    assert [(result["status"], result["mark_id"]) for result in response.json()["results"]][0] == ("updated", 1)
+
+    response = client.get(
+        f"/api/v1/marks/1/1",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.json()["mark"] == 45
+
+def test_given_a_user_with_insufficient_permissions_when_creating_marks_in_bulk_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "base@mms.com", "12345678"
+    )
+
+    SAMPLE_BULK_BODY = {
+        "marks": [
+            {"class_code": "CS412", "reg_no": "abc12345", "mark": 72},
+        ]
+    }
+
+    response = client.post(
+        f"/api/v1/marks/bulk",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_BULK_BODY
+    )
+    
+    assert response.status_code == 403
+
+def test_when_resolving_marks_then_identifiers_are_returned_per_row(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_RESOLVE_BODY = {
+        "rows": [
+            {"class_code": "CS412", "reg_no": "abc12345"},
+            {"class_code": "CS412", "reg_no": "abc33355"},
+            {"class_code": "XX999", "reg_no": "abc12345"},
+            {"class_code": "CS412", "reg_no": "zzz00000"},
+        ]
+    }
+
+    response = client.post(
+        f"/api/v1/marks/resolve",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_RESOLVE_BODY
+    )
+    
+    assert response.status_code == 200
+    assert [(result["class_id"], result["student_id"], result["mark_id"]) for result in response.json()] == [
+        (1, 1, 1), (1, 4, None), (None, 1, None), (1, None, None)
+    ]
+
+def test_given_a_user_with_insufficient_permissions_when_resolving_marks_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "base@mms.com", "12345678"
+    )
+
+    response = client.post(
+        f"/api/v1/marks/resolve",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json={"rows": [{"class_code": "CS412", "reg_no": "abc12345"}]}
+    )
+    
+    assert response.status_code == 403
+
+def test_when_uploading_a_mark_file_then_marks_are_created_and_errors_are_streamed(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_FILE = (
+        "CLASS_CODE,REG_NO,STUDENT_NAME,DEGREE_LEVEL,DEGREE_NAME,MARK,MARK_CODE\n"
+        "CS412,abc12345,Jane Doe,BSc,Computer Science,72,\n"
+        "CS412,abc54321,John Doe,BSc,Computer Science,,ABS\n"
+        "CS412,abc33311,John Doe,BSc,Computer Science,seventy,\n"
+        "CS412,zzz00000,John Doe,BSc,Computer Science,50,\n"
+    )
+
+    response = client.post(
+        f"/api/v1/marks/upload",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        files={"file": ("marks.csv", SAMPLE_FILE, "text/csv")}
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    
+    assert response.status_code == 200
+    assert [(line["row"], line["status"]) for line in lines if line["type"] == "error"] == [
+        (4, "invalid"), (5, "student_not_found")
+    ]
+    assert lines[-1] == {"type": "summary", "processed": 4, "created": 2, "updated": 0, "failed": 2}
+
+def test_given_the_database_rejects_a_chunk_when_uploading_a_mark_file_then_error_and_summary_are_streamed(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    # Every mark write also updates the statistics of its class, which fails once the table is gone.
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE class_statistics"))
+
+    SAMPLE_FILE = (
+        "CLASS_CODE,REG_NO,MARK,MARK_CODE\n"
+        "CS412,abc12345,72,\n"
+        "CS412,abc54321,,ABS\n"
+    )
+
+    response = client.post(
+        f"/api/v1/marks/upload",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        files={"file": ("marks.csv", SAMPLE_FILE, "text/csv")}
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    with TestingSessionLocal() as db:
+        marks = db.query(Marks).count()
+
+    assert response.status_code == 200
+    assert [(line["row"], line["status"]) for line in lines if line["type"] == "error"] == [(2, "database_error")]
+    assert lines[-1] == {"type": "summary", "processed": 2, "created": 0, "updated": 0, "failed": 2}
+    assert marks == 0
+
+def test_given_a_mark_file_with_missing_columns_when_uploading_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    response = client.post(
+        f"/api/v1/marks/upload",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        files={"file": ("marks.csv", "CLASS_CODE,MARK\nCS412,72\n", "text/csv")}
+    )
+    
+    assert response.status_code == 400
+
+def test_when_converting_a_myplace_file_then_a_mark_upload_file_is_streamed(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_FILE = (
+        "CLASS_CODE,DATE,REG_NO,CLASS_TOTAL,OVERRIDE_MARK\n"
+        "CS408,01/01/2021,abc12345,45,50\n"
+        "CS408,01/01/2021,abc54321,45,\n"
+        ",,,,\n"
+        "CS408,01/01/2021,zzz00000,45,\n"
+    )
+
+    response = client.post(
+        f"/api/v1/marks/myplace/convert",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        files={"file": ("myplace.csv", SAMPLE_FILE, "text/csv")}
+    )
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "class_code,reg_no,mark,student_name,degree_level,degree_name",
+        "CS408,abc12345,50,John Doe,BSc (Hons),Computer Science",
+        "CS408,abc54321,45,Jane Doe,BSc (Hons),Computer Science",
+    ]
+
+def test_when_importing_a_myplace_file_then_marks_are_created_with_the_override_mark(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    SAMPLE_FILE = (
+        "CLASS_CODE,DATE,REG_NO,CLASS_TOTAL,OVERRIDE_MARK\n"
+        "CS412,01/01/2021,abc12345,45,50\n"
+        "CS412,01/01/2021,zzz00000,45,\n"
+    )
+
+    response = client.post(
+        f"/api/v1/marks/myplace/import",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        files={"file": ("myplace.csv", SAMPLE_FILE, "text/csv")}
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == 200
+    assert [(line["row"], line["status"]) for line in lines if line["type"] == "error"] == [(3, "student_not_found")]
+    assert lines[-1] == {"type": "summary", "processed": 2, "created": 1, "updated": 0, "failed": 1}
+
+    response = client.get(
+        f"/api/v1/marks/1/1",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.json()["mark"] == 50
+
+def test_given_a_myplace_file_with_missing_columns_when_converting_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    response = client.post(
+        f"/api/v1/marks/myplace/convert",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        files={"file": ("myplace.csv", "CLASS_CODE,DATE,REG_NO\nCS408,01/01/2021,abc12345\n", "text/csv")}
+    )
+
+    assert response.status_code == 400
+
+def test_when_exporting_the_marks_of_a_class_then_a_mark_sheet_is_streamed(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/marks/class/CS412/export",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert rows[0] == ["CLASS_CODE", "REG_NO", "MARK", "MARK_CODE", "STUDENT_NAME", "CLASS_NAME", "DEGREE_LEVEL", "DEGREE_NAME"]
+    assert ["CS412", "abc12345", "70", "", "John Doe", "Information Access and Mining", "BSc (Hons)", "Computer Science"] in rows
+
+    response = client.get(
+        f"/api/v1/marks/class/CS412/all",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert len(rows) - 1 == len(response.json())
+
+def test_when_a_lecturer_exports_their_marks_then_the_marks_of_their_classes_are_streamed(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        create_marks(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/marks/export",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/api/v1/marks",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert len(rows) - 1 == len(response.json())
+
+def test_given_a_user_with_insufficient_permissions_when_exporting_marks_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "base@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/marks/export",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.status_code == 403
+
 def _prepare_login_and_retrieve_token(
     username: str,
     password: str
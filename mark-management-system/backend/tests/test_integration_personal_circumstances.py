@@ -11,6 +11,7 @@ from fastapi.testclient import TestClient
 from api import create_app
 
 from api.system.models.models import Base
+from api.system.models.models import PersonalCircumstance
 from api.database import engine
 from api.config import TestingConfig
 from api.database import get_db
@@ -196,6 +197,115 @@ def test_given_already_existing_circumstance_when_creating_personal_circumstance
     
     assert response.status_code == 409
 
+def test_given_circumstance_without_content_hash_when_creating_personal_circumstances_with_same_details_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_degree(db)
+        create_students(db)
+        create_users(db)
+
+        # Added directly, as a personal circumstance from before the content hash backfill would be.
+        db.add(PersonalCircumstance(
+            details="03/31/2023 to 05/29/2024: Mental Health Issues",
+            semester="2",
+            cat=2,
+            comments="Discount attempt as CS412",
+            student_id=1,
+        ))
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    SAMPLE_PERSONAL_CIRCUMSTANCES_BODY = {
+        "details": "03/31/2023 to 05/29/2024: Mental Health Issues",
+        "semester": "2",
+        "cat": "2",
+        "comments": "Discount attempt as CS412",
+        "reg_no": "abc12345"
+    }
+
+    response = client.post(
+        f"/api/v1/personal-circumstances",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_PERSONAL_CIRCUMSTANCES_BODY
+    )
+
+    assert response.status_code == 409
+
+    response = client.post(
+        f"/api/v1/personal-circumstances/bulk",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json={"personal_circumstances": [SAMPLE_PERSONAL_CIRCUMSTANCES_BODY]}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 0
+    assert response.json()["results"][0]["status"] == "already_exists"
+
+def test_when_creating_personal_circumstances_in_bulk_then_new_rows_are_created_and_duplicates_are_reported(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_degree(db)
+        create_students(db)
+        create_users(db)
+        create_personal_circumstances(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    SAMPLE_PERSONAL_CIRCUMSTANCES_BULK_BODY = {
+        "personal_circumstances": [
+            {
+                "details": "03/31/2023 to 05/29/2023: Health Issues",
+                "semester": "1",
+                "cat": "3",
+                "comments": "Discount attempt as CS426",
+                "reg_no": "abc12345"
+            },
+            {
+                "details": "03/31/2023 to 05/29/2023: Health Issues",
+                "semester": "1",
+                "cat": "3",
+                "comments": "Discount attempt as CS426",
+                "reg_no": "abc33311"
+            },
+            {
+                "details": "03/31/2023 to 05/29/2023: Health Issues",
+                "semester": "1",
+                "cat": "3",
+                "comments": "Discount attempt as CS426",
+                "reg_no": "abc33311"
+            },
+            {
+                "details": "03/31/2023 to 05/29/2023: Health Issues",
+                "semester": "1",
+                "cat": "3",
+                "comments": "Discount attempt as CS426",
+                "reg_no": "zzz00000"
+            },
+        ]
+    }
+
+    response = client.post(
+        f"/api/v1/personal-circumstances/bulk",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        json=SAMPLE_PERSONAL_CIRCUMSTANCES_BULK_BODY
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["created"] == 1
+    assert [result["status"] for result in response.json()["results"]] == [
+        "already_exists", "created", "already_exists", "student_not_found"
+    ]
+
 def test_given_student_reg_no_when_retrieving_personal_circumstances_for_student_then_personal_circumstances_are_returned(
         test_db: Generator[None, Any, None]
     ):
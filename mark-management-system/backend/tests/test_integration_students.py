@@ -2,6 +2,8 @@ import sys
 import os
 import pytest
 
+from datetime import date
+
 from typing import Generator, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,9 +13,11 @@ from fastapi.testclient import TestClient
 from api import create_app
 
 from api.system.models.models import Base
+from api.system.models.models import AcademicMisconduct
 from api.database import engine
 from api.config import TestingConfig
 from api.database import get_db
+from api.marks.statistics_cache import statistics_cache
 
 from scripts.db_base_values import (
     initialise_roles,
@@ -21,7 +25,8 @@ from scripts.db_base_values import (
     create_classes,
     create_degree,
     create_students,
-    create_marks
+    create_marks,
+    create_personal_circumstances
 )
 
 from sqlalchemy import create_engine
@@ -55,6 +60,7 @@ client = TestClient(app)
 @pytest.fixture()
 def test_db():
     Base.metadata.create_all(bind=engine)
+    statistics_cache.clear()
     yield
     Base.metadata.drop_all(bind=engine)
     engine.dispose()
@@ -172,6 +178,51 @@ def test_given_students_when_retrieving_students_then_students_are_returned(
     
     assert response.status_code == 200
 
+def test_given_students_when_retrieving_students_with_a_cursor_then_every_student_is_returned_once(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/students?limit=40&include_total=true",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Total-Estimate"] == "105"
+
+    reg_nos = [student["reg_no"] for student in response.json()]
+
+    while "X-Next-Cursor" in response.headers:
+        response = client.get(
+            f"/api/v1/students?limit=40&cursor={response.headers['X-Next-Cursor']}",
+            headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+        )
+
+        assert response.status_code == 200
+
+        reg_nos.extend(student["reg_no"] for student in response.json())
+
+    assert len(reg_nos) == 105
+    assert len(set(reg_nos)) == 105
+    assert reg_nos[:5] == ["abc12345", "abc54321", "abc33311", "abc33355", "abc33356"]
+
+    response = client.get(
+        f"/api/v1/students?cursor=invalid",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.status_code == 400
+
 def test_given_no_students_in_the_system_when_retrieving_students_then_error_is_thrown(
         test_db: Generator[None, Any, None]
     ):
@@ -237,6 +288,45 @@ def test_given_students_when_retrieving_a_student_then_student_is_returned(
     
     assert response.status_code == 200
 
+def test_given_a_student_with_misconducts_when_retrieving_a_student_then_only_their_misconducts_are_returned(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_classes(db)
+        create_students(db)
+        create_marks(db)
+        create_personal_circumstances(db)
+
+        db.add(AcademicMisconduct(date=date(2024, 1, 1), outcome="UPHELD", student_id=1, class_id=2))
+        db.add(AcademicMisconduct(date=date(2024, 2, 1), outcome="UNDER INVESTIGATION", student_id=2, class_id=2))
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    SAMPLE_STUDENT_REG_NO = "abc12345"
+
+    response = client.get(
+        f"/api/v1/students/{SAMPLE_STUDENT_REG_NO}",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+
+    classes = {class_["code"]: class_["academic_misconducts"] for class_ in response.json()["classes"]}
+
+    assert classes == {
+        "CS412": [],
+        "CS407": [{"date": "2024-01-01", "outcome": "UPHELD", "class_code": "CS407", "reg_no": "abc12345"}],
+        "CS426": [],
+    }
+    assert response.json()["degree"]["name"] == "Computer Science"
+    assert len(response.json()["personal_circumstances"]) == 2
+
 def test_given_non_existing_student_when_retrieving_a_student_then_error_is_thrown(
         test_db: Generator[None, Any, None]
     ):
@@ -0,0 +1,271 @@
+import sys
+import os
+import pytest
+
+from typing import Generator, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from api import create_app
+
+from api.system.models.models import Base
+from api.database import engine
+from api.config import TestingConfig
+from api.database import get_db
+from api.database import create_async_database_engine
+from api.middleware.dependencies import get_session_runner
+from api.marks.statistics_cache import statistics_cache
+
+from api.system.schema_upgrades import upgrade_schema
+from api.system.errors.duplicate_rows import DuplicateRows
+
+from api.personal_circumstances.content_hash import content_hash
+
+from api.utils.session_runner import AsyncSessionRunner
+
+from scripts.db_base_values import (
+    initialise_roles,
+    create_users,
+    create_classes,
+    create_degree,
+    create_students,
+    create_marks
+)
+
+from sqlalchemy import create_engine
+from sqlalchemy import inspect
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+# Some of the code below has been taken in parts from the official FastAPI documentation:
+
+# https://fastapi.tiangolo.com/tutorial/testing/
+# https://fastapi.tiangolo.com/advanced/testing-database/
+
+app = create_app()
+
+if TestingConfig.DATABASE_URL:
+    engine = create_engine(
+        TestingConfig.DATABASE_URL,
+    )
+
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        
+        yield db
+    finally:
+        db.close()
+
+app.dependency_overrides[get_db] = override_get_db
+client = TestClient(app)
+
+@pytest.fixture()
+def test_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+app.dependency_overrides[get_db] = override_get_db
+
+def test_given_an_administrator_when_retrieving_database_metrics_then_metrics_are_returned(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/system/metrics/database",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["pool_size"] == TestingConfig.DATABASE_POOL_SIZE
+    assert response.json()["max_overflow"] == TestingConfig.DATABASE_MAX_OVERFLOW
+    assert 0 <= response.json()["saturation"] <= 1
+    assert response.json()["checkouts"] >= 1
+
+def test_given_a_user_with_insufficient_permissions_when_retrieving_database_metrics_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/system/metrics/database",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+
+    assert response.status_code == 403
+
+def test_given_marks_table_without_unique_index_when_upgrading_schema_then_index_is_created(
+        test_db: Generator[None, Any, None]
+    ):
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_marks_student_id_class_id"))
+        connection.execute(text("INSERT INTO marks (mark, class_id, student_id) VALUES (50, 1, 1), (60, 1, 2)"))
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)
+
+    indexes = {index["name"]: index for index in inspect(engine).get_indexes("marks")}
+
+    assert indexes["ix_marks_student_id_class_id"]["unique"]
+
+def test_given_duplicate_marks_without_unique_index_when_upgrading_schema_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_marks_student_id_class_id"))
+        connection.execute(text("INSERT INTO marks (mark, class_id, student_id) VALUES (50, 1, 1), (60, 1, 1)"))
+
+    with pytest.raises(DuplicateRows):
+        upgrade_schema(engine)
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("marks")}
+
+    assert "ix_marks_student_id_class_id" not in indexes
+
+def test_given_personal_circumstances_table_without_content_hash_when_upgrading_schema_then_hashes_are_backfilled(
+        test_db: Generator[None, Any, None]
+    ):
+    _drop_personal_circumstance_content_hash()
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO personal_circumstances (details, semester, cat, comments, student_id) "
+            "VALUES ('Illness', '1', 2, 'None', 1), ('Illness', '2', 2, 'None', 1)"
+        ))
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)
+
+    with engine.connect() as connection:
+        hashes = connection.execute(text("SELECT semester, content_hash FROM personal_circumstances ORDER BY semester")).all()
+
+    indexes = {index["name"]: index for index in inspect(engine).get_indexes("personal_circumstances")}
+
+    assert hashes == [
+        ("1", content_hash(1, "Illness", "1", 2, "None")),
+        ("2", content_hash(1, "Illness", "2", 2, "None")),
+    ]
+    assert indexes["ix_personal_circumstances_content_hash"]["unique"]
+
+def test_given_duplicate_personal_circumstances_without_content_hash_when_upgrading_schema_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    _drop_personal_circumstance_content_hash()
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO personal_circumstances (details, semester, cat, comments, student_id) "
+            "VALUES ('Illness', '1', 2, 'None', 1), ('Illness', '1', 2, 'None', 1)"
+        ))
+
+    with pytest.raises(DuplicateRows):
+        upgrade_schema(engine)
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("personal_circumstances")}
+
+    assert "ix_personal_circumstances_content_hash" not in indexes
+
+def test_given_the_async_engine_when_retrieving_marks_classes_and_statistics_then_responses_match_the_sync_engine(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_classes(db)
+        create_degree(db)
+        create_students(db)
+        create_marks(db)
+        db.commit()
+
+    ADMIN_TOKEN = _prepare_login_and_retrieve_token("admin@mms.com", "12345678")
+    LECTURER_TOKEN = _prepare_login_and_retrieve_token("lecturer@mms.com", "12345678")
+
+    REQUESTS = [
+        ("/api/v1/marks", LECTURER_TOKEN),
+        ("/api/v1/marks/abc12345", LECTURER_TOKEN),
+        ("/api/v1/marks/class/CS412/all", ADMIN_TOKEN),
+        ("/api/v1/marks/statistics", LECTURER_TOKEN),
+        ("/api/v1/marks/global/statistics/all", ADMIN_TOKEN),
+        ("/api/v1/classes?limit=2&include_total=true", ADMIN_TOKEN),
+        ("/api/v1/classes/lecturer", LECTURER_TOKEN),
+        ("/api/v1/classes/CS412/statistics", LECTURER_TOKEN),
+        ("/api/v1/classes/metrics/all", ADMIN_TOKEN),
+    ]
+
+    sync_responses = [client.get(url, headers={"Authorization": f"Bearer {token}"}) for url, token in REQUESTS]
+
+    async_engine = create_async_database_engine(TestingConfig.DATABASE_URL)
+    AsyncTestingSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_session_runner():
+        async with AsyncTestingSessionLocal() as db:
+            yield AsyncSessionRunner(db)
+
+    statistics_cache.clear()
+    app.dependency_overrides[get_session_runner] = override_get_session_runner
+
+    try:
+        # A single event loop for every request, as the connections of the async engine's pool belong to the loop.
+        with TestClient(app) as async_client:
+            async_responses = [async_client.get(url, headers={"Authorization": f"Bearer {token}"}) for url, token in REQUESTS]
+
+            not_modified = async_client.get(
+                "/api/v1/classes/metrics/all",
+                headers={"Authorization": f"Bearer {ADMIN_TOKEN}", "If-None-Match": async_responses[-1].headers["ETag"]},
+            )
+
+            async_client.portal.call(async_engine.dispose)
+    finally:
+        del app.dependency_overrides[get_session_runner]
+
+    for (url, _), sync_response, async_response in zip(REQUESTS, sync_responses, async_responses):
+        assert sync_response.status_code == 200, url
+        assert async_response.status_code == 200, url
+        assert async_response.json() == sync_response.json(), url
+        assert async_response.headers.get("X-Next-Cursor") == sync_response.headers.get("X-Next-Cursor"), url
+
+    assert not_modified.status_code == 304
+
+def test_given_a_database_url_when_creating_the_async_engine_then_the_async_driver_is_used():
+    assert create_async_database_engine("sqlite:////tmp/mms.db").url.drivername == "sqlite+aiosqlite"
+    assert create_async_database_engine("postgresql://mms@localhost/mms").url.drivername == "postgresql+asyncpg"
+    assert create_async_database_engine("postgresql+psycopg2://mms@localhost/mms").url.drivername == "postgresql+asyncpg"
+
+def _drop_personal_circumstance_content_hash() -> None:
+    # The `personal_circumstances` table as it was before the content hash, which SQLite only drops once its index is dropped.
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_personal_circumstances_content_hash"))
+        connection.execute(text("ALTER TABLE personal_circumstances DROP COLUMN content_hash"))
+
+def _prepare_login_and_retrieve_token(
+    username: str,
+    password: str
+) -> str:
+    SAMPLE_LOGIN_BODY = {"username": username, "password": password}
+    response = client.post("/api/v1/users/login", data=SAMPLE_LOGIN_BODY)
+
+    assert response.status_code == 200
+    return response.json()["access_token"]
@@ -8,14 +8,21 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi.testclient import TestClient
 
+from jose import jwt
+
 from api import create_app
 
 from api.system.models.models import Base
+from api.system.models.models import Marks
+from api.system.models.models import User
 from api.database import engine
+from api.config import Config
 from api.config import TestingConfig
 from api.database import get_db
+from api.users.dependencies import get_bcrypt_hasher
+from api.users.hashers.bcrypt_hasher import BCryptHasher
 
-from scripts.db_base_values import initialise_roles, create_users
+from scripts.db_base_values import initialise_roles, create_users, create_degree, create_students, create_classes
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -122,6 +129,36 @@ def test_given_correct_details_when_logging_in_as_a_user_then_user_is_returned(
     
     assert response.status_code == 200
 
+def test_given_a_password_hashed_at_a_different_cost_when_logging_in_then_the_password_is_rehashed(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    app.dependency_overrides[get_bcrypt_hasher] = lambda: BCryptHasher(rounds=4)
+
+    try:
+        response = client.post(
+            "/api/v1/users/login",
+            data={"username": "lecturer@mms.com", "password": "12345678"}
+        )
+
+        second_response = client.post(
+            "/api/v1/users/login",
+            data={"username": "lecturer@mms.com", "password": "12345678"}
+        )
+    finally:
+        del app.dependency_overrides[get_bcrypt_hasher]
+
+    with TestingSessionLocal() as db:
+        hashed_password = db.query(User).filter_by(email_address="lecturer@mms.com").one().password
+
+    assert response.status_code == 200
+    assert second_response.status_code == 200
+    assert hashed_password.startswith("$2b$04$")
+
 def test_given_incorrect_credentials_when_logging_in_as_a_user_then_error_is_thrown(
         test_db: Generator[None, Any, None]
     ):
@@ -180,6 +217,111 @@ def test_given_non_existing_email_when_logging_in_as_a_user_then_error_is_thrown
     
     assert response.status_code == 404
 
+def test_given_a_refresh_token_when_refreshing_the_access_token_then_a_new_access_token_is_returned(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    login_response = client.post(
+        "/api/v1/users/login",
+        data={"username": "admin@mms.com", "password": "12345678"}
+    )
+
+    response = client.post(
+        "/api/v1/users/refresh",
+        json={"refresh_token": login_response.json()["refresh_token"]}
+    )
+
+    assert response.status_code == 200
+
+    users_response = client.get(
+        "/api/v1/users",
+        headers={"Authorization": f"Bearer {response.json()['access_token']}"}
+    )
+
+    assert users_response.status_code == 200
+
+def test_given_an_access_token_when_refreshing_the_access_token_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    response = client.post(
+        "/api/v1/users/refresh",
+        json={"refresh_token": JSON_TOKEN}
+    )
+
+    assert response.status_code == 401
+
+def test_given_tokens_signed_with_the_other_secret_key_when_used_as_the_other_type_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    login_response = client.post(
+        "/api/v1/users/login",
+        data={"username": "admin@mms.com", "password": "12345678"}
+    )
+
+    # As if both secret keys were the same, only the type of each token tells them apart.
+    access_claims = jwt.get_unverified_claims(login_response.json()["access_token"])
+    refresh_claims = jwt.get_unverified_claims(login_response.json()["refresh_token"])
+
+    ACCESS_TOKEN_AS_REFRESH_TOKEN = jwt.encode(access_claims, Config.JWT_REFRESH_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+    REFRESH_TOKEN_AS_ACCESS_TOKEN = jwt.encode(refresh_claims, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+
+    refresh_response = client.post(
+        "/api/v1/users/refresh",
+        json={"refresh_token": ACCESS_TOKEN_AS_REFRESH_TOKEN}
+    )
+
+    users_response = client.get(
+        "/api/v1/users",
+        headers={"Authorization": f"Bearer {REFRESH_TOKEN_AS_ACCESS_TOKEN}"}
+    )
+
+    assert refresh_response.status_code == 401
+    assert users_response.status_code == 401
+
+def test_given_access_token_without_type_when_retrieving_users_then_users_are_returned(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    login_response = client.post(
+        "/api/v1/users/login",
+        data={"username": "admin@mms.com", "password": "12345678"}
+    )
+
+    # As issued before the `type` claim was added.
+    access_claims = jwt.get_unverified_claims(login_response.json()["access_token"])
+    del access_claims["type"]
+
+    ACCESS_TOKEN_WITHOUT_TYPE = jwt.encode(access_claims, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+
+    response = client.get(
+        "/api/v1/users",
+        headers={"Authorization": f"Bearer {ACCESS_TOKEN_WITHOUT_TYPE}"}
+    )
+
+    assert response.status_code == 200
+
 def test_given_users_in_the_database_when_calling_get_users_then_users_are_returned(
         test_db: Generator[None, Any, None]
     ):
@@ -219,6 +361,33 @@ def test_given_a_non_admin_requestor_when_calling_get_users_then_error_is_thrown
     
     assert response.status_code == 403
 
+def test_given_a_verified_token_when_a_forged_token_is_sent_then_error_is_thrown(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "lecturer@mms.com", "12345678"
+    )
+
+    claims = jwt.get_unverified_claims(JSON_TOKEN)
+    claims["is_admin"] = True
+
+    FORGED_TOKEN = jwt.encode(claims, "not-the-secret-key", algorithm="HS256")
+
+    responses = [
+        client.get(
+            "/api/v1/users",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        for token in (JSON_TOKEN, JSON_TOKEN, FORGED_TOKEN)
+    ]
+
+    assert [response.status_code for response in responses] == [403, 403, 401]
+
 def test_given_a_valid_user_id_when_getting_user_details_then_user_is_returned(
         test_db: Generator[None, Any, None]
     ):
@@ -307,6 +476,30 @@ def test_given_a_user_when_editing_the_users_details_then_the_users_details_are_
     
     assert response.status_code == 200
 
+def test_given_a_user_when_editing_the_users_details_twice_then_the_latest_details_are_returned(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    for SAMPLE_EDIT_BODY in ({"id": "1", "first_name": "John"}, {"id": "1", "last_name": "Smith"}):
+        response = client.put(
+            f"/api/v1/users/1",
+            headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+            json=SAMPLE_EDIT_BODY
+        )
+    
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "John"
+    assert response.json()["last_name"] == "Smith"
+    assert [role["title"] for role in response.json()["roles"]] == ["admin"]
+
 def test_given_an_invalid_password_when_editing_the_users_details_then_error_is_thrown(
         test_db: Generator[None, Any, None]
     ):
@@ -378,6 +571,33 @@ def test_given_lecturers_in_the_system_when_getting_all_lecturers_then_lecturers
     assert response.status_code == 200
     assert len(response.json()) == 1
 
+def test_given_lecturers_with_classes_when_getting_all_lecturers_then_classes_are_flagged_if_marks_are_uploaded(
+        test_db: Generator[None, Any, None]
+    ):
+    with TestingSessionLocal() as db:
+        initialise_roles(db)
+        create_users(db)
+        create_degree(db)
+        create_students(db)
+        create_classes(db)
+        db.add(Marks(mark=70, class_id=1, student_id=1))
+        db.commit()
+
+    JSON_TOKEN = _prepare_login_and_retrieve_token(
+        "admin@mms.com", "12345678"
+    )
+
+    response = client.get(
+        f"/api/v1/lecturers",
+        headers={"Authorization": f"Bearer {JSON_TOKEN}"},
+    )
+    
+    assert response.status_code == 200
+    assert response.json()[0]["number_of_classes_taught"] == 4
+    assert [(class_["code"], class_["is_uploaded"]) for class_ in response.json()[0]["classes"]] == [
+        ("CS412", True), ("CS407", False), ("CS426", False), ("CS408", False)
+    ]
+
 def test_given_not_admin_requestor_when_getting_all_lecturers_then_error_is_thrown(
         test_db: Generator[None, Any, None]
     ):